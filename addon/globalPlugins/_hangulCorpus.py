@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+
+from ._hangulSplitterCore import (
+	SplitOptions,
+	normalize_rules,
+	split_hangul_blocks_with_source_map,
+	translate_hangul_blocks,
+)
+
+
+# A pre-split corpus file: the original texts, their split forms and optionally the source map of
+# each split form, laid out so one record or a range of jamo can be read through mmap without
+# loading the rest.
+#
+#   header      CORPUS_HEADER, then the options as UTF-8 JSON
+#   source      every original text, UTF-32-LE, back to back
+#   output      every split form, UTF-32-LE, back to back
+#   map         for each output character, the uint32 index of its source character in the record
+#   offsets     count + 1 uint64 character offsets into source, then count + 1 into output
+#
+# Texts are stored in UTF-32 so that character n of a record is at byte 4 * n and any range of
+# jamo is one slice. The map lines up with output, so the output offsets index it too.
+# All numbers are little-endian, the byte order of every machine NVDA runs on.
+CORPUS_MAGIC = b"HBSCORP\x00"
+CORPUS_VERSION = 1
+CORPUS_HEADER = struct.Struct("<8sIIQQQQQQQQ")
+CORPUS_FLAG_SOURCE_MAP = 1
+_TEXT_ENCODING = "utf-32-le"
+_CHAR_BYTES = 4
+_ALIGNMENT = 8
+
+
+def _pad(file, position: int) -> int:
+	padding = -position % _ALIGNMENT
+	file.write(b"\0" * padding)
+	return position + padding
+
+
+def write_corpus(path: str, texts: Iterable[str], options: SplitOptions, source_map: bool = False) -> int:
+	# Splits each text with options and writes the corpus to path; returns the number of records.
+	# Texts are streamed: split forms and maps wait in temporary files until the originals are written.
+	source_offsets = array("Q", [0])
+	output_offsets = array("Q", [0])
+	options_data = json.dumps(
+		{
+			"splitComplexLetters": options.splitComplexLetters,
+			"insertSpacesBetweenLetters": options.insertSpacesBetweenLetters,
+			"decompositionRules": dict(options.decompositionRules),
+		},
+		ensure_ascii=False,
+	).encode("utf-8")
+	partial = f"{path}.{os.getpid()}.tmp"
+	try:
+		with (
+			open(partial, "wb") as corpus_file,
+			tempfile.TemporaryFile() as output_file,
+			tempfile.TemporaryFile() as map_file,
+		):
+			corpus_file.write(b"\0" * CORPUS_HEADER.size)
+			corpus_file.write(options_data)
+			source_position = _pad(corpus_file, CORPUS_HEADER.size + len(options_data))
+			for text in texts:
+				if source_map:
+					output, positions = split_hangul_blocks_with_source_map(text, options)
+					map_file.write(array("I", positions).tobytes())
+				else:
+					output = translate_hangul_blocks(text, options)
+				corpus_file.write(text.encode(_TEXT_ENCODING))
+				output_file.write(output.encode(_TEXT_ENCODING))
+				source_offsets.append(source_offsets[-1] + len(text))
+				output_offsets.append(output_offsets[-1] + len(output))
+			output_position = _pad(corpus_file, source_position + source_offsets[-1] * _CHAR_BYTES)
+			output_file.seek(0)
+			shutil.copyfileobj(output_file, corpus_file)
+			map_position = _pad(corpus_file, output_position + output_offsets[-1] * _CHAR_BYTES)
+			offsets_position = map_position
+			if source_map:
+				map_file.seek(0)
+				shutil.copyfileobj(map_file, corpus_file)
+				offsets_position = _pad(corpus_file, map_position + output_offsets[-1] * 4)
+			if sys.byteorder != "little":
+				source_offsets.byteswap()
+				output_offsets.byteswap()
+			corpus_file.write(source_offsets.tobytes())
+			corpus_file.write(output_offsets.tobytes())
+			corpus_file.seek(0)
+			corpus_file.write(
+				CORPUS_HEADER.pack(
+					CORPUS_MAGIC,
+					CORPUS_VERSION,
+					CORPUS_FLAG_SOURCE_MAP if source_map else 0,
+					len(source_offsets) - 1,
+					len(options_data),
+					source_position,
+					output_position,
+					map_position if source_map else 0,
+					offsets_position,
+					offsets_position + len(source_offsets) * 8,
+					0,
+				),
+			)
+		os.replace(partial, path)
+	except BaseException:
+		# A failing text iterator or split leaves no partial file behind.
+		try:
+			os.unlink(partial)
+		except FileNotFoundError:
+			pass
+		raise
+	return len(source_offsets) - 1
+
+
+class HangulCorpus:
+	# Read-only view of a file made by write_corpus. Nothing is read until a record is asked for;
+	# the operating system pages in only the parts of the file that are touched.
+
+	def __init__(self, path: str):
+		with open(path, "rb") as corpus_file:
+			self._mmap = mmap.mmap(corpus_file.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			self._open()
+		except Exception:
+			self._mmap.close()
+			raise
+
+	def _open(self) -> None:
+		if len(self._mmap) < CORPUS_HEADER.size:
+			raise ValueError("Not a Hangul corpus file: too short")
+		(
+			magic,
+			version,
+			flags,
+			count,
+			options_length,
+			self._source_position,
+			self._output_position,
+			self._map_position,
+			source_offsets_position,
+			output_offsets_position,
+			_reserved,
+		) = CORPUS_HEADER.unpack_from(self._mmap)
+		if magic != CORPUS_MAGIC:
+			raise ValueError("Not a Hangul corpus file")
+		if version != CORPUS_VERSION:
+			raise ValueError(f"Unsupported Hangul corpus version {version}")
+		if output_offsets_position + (count + 1) * 8 > len(self._mmap):
+			raise ValueError("Hangul corpus file is truncated")
+		options = json.loads(self._mmap[CORPUS_HEADER.size : CORPUS_HEADER.size + options_length])
+		self.options = SplitOptions(
+			splitComplexLetters=options["splitComplexLetters"],
+			insertSpacesBetweenLetters=options["insertSpacesBetweenLetters"],
+			decompositionRules=normalize_rules(options["decompositionRules"]),
+		)
+		self.has_source_map = bool(flags & CORPUS_FLAG_SOURCE_MAP)
+		self._count = count
+		self._view = memoryview(self._mmap)
+		self._source_offsets = self._offsets(source_offsets_position, count)
+		self._output_offsets = self._offsets(output_offsets_position, count)
+
+	def _offsets(self, position: int, count: int):
+		view = self._view[position : position + (count + 1) * 8]
+		if sys.byteorder != "little":
+			swapped = array("Q")
+			swapped.frombytes(view)
+			swapped.byteswap()
+			return swapped
+		return view.cast("Q")
+
+	def close(self) -> None:
+		if self._mmap.closed:
+			return
+		# Views into the map must go before the map itself can be closed.
+		for offsets in (self._source_offsets, self._output_offsets):
+			if isinstance(offsets, memoryview):
+				offsets.release()
+		self._view.release()
+		self._mmap.close()
+
+	def __enter__(self) -> HangulCorpus:
+		return self
+
+	def __exit__(self, *exc_info) -> None:
+		self.close()
+
+	def __len__(self) -> int:
+		return self._count
+
+	def _record_span(self, offsets, index: int) -> tuple[int, int]:
+		if not -self._count <= index < self._count:
+			raise IndexError("corpus record index out of range")
+		index %= self._count
+		return offsets[index], offsets[index + 1]
+
+	def _text(self, position: int, start: int, end: int) -> str:
+		return str(self._view[position + start * _CHAR_BYTES : position + end * _CHAR_BYTES], _TEXT_ENCODING)
+
+	def _clamp(self, length: int, start: int, end: int | None) -> tuple[int, int]:
+		start, end, _step = slice(start, end).indices(length)
+		return start, max(start, end)
+
+	def source_length(self, index: int) -> int:
+		start, end = self._record_span(self._source_offsets, index)
+		return end - start
+
+	def output_length(self, index: int) -> int:
+		start, end = self._record_span(self._output_offsets, index)
+		return end - start
+
+	def source(self, index: int) -> str:
+		start, end = self._record_span(self._source_offsets, index)
+		return self._text(self._source_position, start, end)
+
+	def output(self, index: int, start: int = 0, end: int | None = None) -> str:
+		# The split form of record index, or the jamo from start to end of it, sliced like a str.
+		record_start, record_end = self._record_span(self._output_offsets, index)
+		start, end = self._clamp(record_end - record_start, start, end)
+		return self._text(self._output_position, record_start + start, record_start + end)
+
+	def source_map(self, index: int, start: int = 0, end: int | None = None) -> list[int]:
+		# For each output character from start to end, the index of its source character in the record.
+		if not self.has_source_map:
+			raise ValueError("This corpus was written without a source map")
+		record_start, record_end = self._record_span(self._output_offsets, index)
+		start, end = self._clamp(record_end - record_start, start, end)
+		first = self._map_position + (record_start + start) * 4
+		positions = array("I")
+		positions.frombytes(self._view[first : first + (end - start) * 4])
+		if sys.byteorder != "little":
+			positions.byteswap()
+		return positions.tolist()
+
+	def source_span(self, index: int, start: int, end: int) -> tuple[int, int]:
+		# The range of source characters that output characters start to end came from.
+		# The map never decreases, so its two ends are enough.
+		length = self.output_length(index)
+		start, end = self._clamp(length, start, end)
+		if start == end:
+			position = self.source_map(index, start, start + 1)[0] if start < length else self.source_length(index)
+			return position, position
+		return self.source_map(index, start, start + 1)[0], self.source_map(index, end - 1, end)[0] + 1
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+from ._hangulSplitterCore import (
+	COMPLEX_COMPAT_MAP,
+	DEFAULT_DECOMPOSITION_RULES,
+	LEADING_COMPAT,
+	TRAILING_COMPAT,
+	VOWEL_COMPAT,
+	DecompositionRules,
+	normalize_rules,
+)
+
+
+PROFILES_FILE_NAME = "hangulBlockSplitter-profiles.json"
+
+PROFILE_FULL = "full"
+PROFILE_DOUBLE_CONSONANTS = "doubleConsonants"
+PROFILE_CONSONANTS = "consonants"
+PROFILE_COMPLEX_VOWELS = "complexVowels"
+
+_DOUBLE_CONSONANTS = "ㄲㄸㅃㅆㅉ"
+_COMPLEX_VOWELS = "ㅘㅙㅚㅝㅞㅟㅢ"
+_LETTERS = frozenset(LEADING_COMPAT + VOWEL_COMPAT + TRAILING_COMPAT[1:])
+
+
+def _rules_for(letters: str) -> DecompositionRules:
+	return normalize_rules({letter: COMPLEX_COMPAT_MAP[letter] for letter in letters})
+
+
+BUILTIN_PROFILES: dict[str, DecompositionRules] = {
+	PROFILE_FULL: DEFAULT_DECOMPOSITION_RULES,
+	PROFILE_DOUBLE_CONSONANTS: _rules_for(_DOUBLE_CONSONANTS),
+	PROFILE_CONSONANTS: _rules_for("".join(letter for letter in COMPLEX_COMPAT_MAP if letter not in _COMPLEX_VOWELS)),
+	PROFILE_COMPLEX_VOWELS: _rules_for(_COMPLEX_VOWELS),
+}
+
+# Parsed profiles of the last file read, with the modification time and size they were read at.
+_file_cache: tuple[tuple[str, int, int], dict[str, DecompositionRules]] | None = None
+
+
+def parse_profiles(data: Any) -> dict[str, DecompositionRules]:
+	# Format: {"profiles": {"name": {"base": "consonants", "rules": {"ㅐ": "ㅏㅣ", "ㄲ": null}}}}
+	# A profile starts from its base, a built-in profile or nothing; a null replacement removes a rule.
+	if not isinstance(data, dict) or not isinstance(data.get("profiles"), dict):
+		raise ValueError('Expected an object with a "profiles" object')
+	profiles: dict[str, DecompositionRules] = {}
+	for name, definition in data["profiles"].items():
+		if not name or name in BUILTIN_PROFILES:
+			raise ValueError(f"Invalid or built-in profile name: {name!r}")
+		if not isinstance(definition, dict):
+			raise ValueError(f"Profile {name!r} must be an object")
+		base = definition.get("base")
+		if base is not None and base not in BUILTIN_PROFILES:
+			raise ValueError(f"Profile {name!r} has an unknown base {base!r}")
+		replacements = dict(BUILTIN_PROFILES[base]) if base is not None else {}
+		rules = definition.get("rules", {})
+		if not isinstance(rules, dict):
+			raise ValueError(f'Rules of profile {name!r} must be an object')
+		for letter, replacement in rules.items():
+			if letter not in _LETTERS:
+				raise ValueError(f"Profile {name!r}: {letter!r} is not a Hangul compatibility letter")
+			if replacement is None:
+				replacements.pop(letter, None)
+				continue
+			if not isinstance(replacement, str) or not replacement or any(char.isspace() for char in replacement):
+				raise ValueError(f"Profile {name!r}: replacement for {letter!r} must be a non-empty string without spaces")
+			replacements[letter] = replacement
+		profiles[name] = normalize_rules(replacements)
+	return profiles
+
+
+def load_profiles(path: str) -> dict[str, DecompositionRules]:
+	# Built-in profiles followed by the ones in the file, which is parsed again only when it changes.
+	# Raises OSError or ValueError when the file cannot be read or is invalid.
+	global _file_cache
+	try:
+		stat = os.stat(path)
+	except FileNotFoundError:
+		return dict(BUILTIN_PROFILES)
+	key = (path, stat.st_mtime_ns, stat.st_size)
+	if _file_cache is None or _file_cache[0] != key:
+		with open(path, encoding="utf-8") as file:
+			data = json.load(file)
+		_file_cache = (key, parse_profiles(data))
+	profiles = dict(BUILTIN_PROFILES)
+	profiles.update(_file_cache[1])
+	return profiles
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
+
+from ._hangulSplitterCore import (
+	DEFAULT_DECOMPOSITION_RULES,
+	SplitOptions,
+	decompose_syllables,
+	letter_translation_table,
+	split_hangul_blocks_with_source_map,
+)
+
+
+# Larger distances leave pieces too short to narrow the search; those queries scan the length buckets.
+_MAX_INDEXED_DISTANCE = 3
+
+
+@dataclass(frozen=True)
+class JamoMatch:
+	start: int
+	end: int
+	distance: int
+	jamoStart: int
+	jamoEnd: int
+
+
+def _letter_table(split_complex_letters: bool) -> dict[int, str]:
+	return letter_translation_table(DEFAULT_DECOMPOSITION_RULES if split_complex_letters else ())
+
+
+def _jamo_key(text: str, split_complex_letters: bool) -> str:
+	# Standalone letters are split like letters inside syllables, as in JamoTrie.key,
+	# so a typed ㄲ or ㅘ compares equal to the letters of 까 or 과.
+	return decompose_syllables(text.translate(_letter_table(split_complex_letters)), split_complex_letters)
+
+
+def _split_letters_with_source_map(text: str, split_complex_letters: bool) -> tuple[str, list[int]]:
+	jamo, source_map = split_hangul_blocks_with_source_map(
+		text,
+		SplitOptions(splitComplexLetters=split_complex_letters, insertSpacesBetweenLetters=False),
+	)
+	letter_table = _letter_table(split_complex_letters)
+	if jamo.translate(letter_table) == jamo:
+		return jamo, source_map
+	letters: list[str] = []
+	positions: list[int] = []
+	for char, position in zip(jamo, source_map):
+		replacement = letter_table.get(ord(char), char)
+		letters.append(replacement)
+		positions.extend([position] * len(replacement))
+	return "".join(letters), positions
+
+
+class _BitParallelPattern:
+	# Myers' bit-vector algorithm in Hyyrö's formulation.
+	# Python integers grow as needed, so patterns longer than a machine word need no blocking.
+
+	def __init__(self, jamo: str):
+		self.length = len(jamo)
+		self._mask = (1 << self.length) - 1
+		self._high_bit = 1 << (self.length - 1) if self.length else 0
+		peq: dict[str, int] = {}
+		for index, char in enumerate(jamo):
+			peq[char] = peq.get(char, 0) | (1 << index)
+		self._peq = peq
+
+	def distance(self, text: str, max_distance: int | None = None) -> int:
+		length = self.length
+		text_length = len(text)
+		if max_distance is not None and abs(text_length - length) > max_distance:
+			return max_distance + 1
+		if not length:
+			return text_length
+		peq_get = self._peq.get
+		mask = self._mask
+		high_bit = self._high_bit
+		pv = mask
+		mv = 0
+		score = length
+		remaining = text_length
+		for char in text:
+			remaining -= 1
+			eq = peq_get(char, 0)
+			xv = eq | mv
+			xh = (((eq & pv) + pv) ^ pv) | eq
+			ph = mv | (~(xh | pv) & mask)
+			mh = pv & xh
+			if ph & high_bit:
+				score += 1
+			elif mh & high_bit:
+				score -= 1
+			# Row 0 of the global distance matrix grows by one per column.
+			ph = ((ph << 1) | 1) & mask
+			mh = (mh << 1) & mask
+			pv = mh | (~(xv | ph) & mask)
+			mv = ph & xv
+			if max_distance is not None and score - remaining > max_distance:
+				return max_distance + 1
+		return score
+
+	def scan(self, text: str, max_distance: int) -> list[tuple[int, int]]:
+		# Returns (end, distance) for every text prefix end where the pattern matches
+		# some substring ending there with at most max_distance edits.
+		length = self.length
+		if not length:
+			return [(end, 0) for end in range(len(text) + 1)]
+		peq_get = self._peq.get
+		mask = self._mask
+		high_bit = self._high_bit
+		pv = mask
+		mv = 0
+		score = length
+		hits: list[tuple[int, int]] = []
+		for index, char in enumerate(text):
+			eq = peq_get(char, 0)
+			xv = eq | mv
+			xh = (((eq & pv) + pv) ^ pv) | eq
+			ph = mv | (~(xh | pv) & mask)
+			mh = pv & xh
+			if ph & high_bit:
+				score += 1
+			elif mh & high_bit:
+				score -= 1
+			# Row 0 stays zero: a match may start anywhere in the text.
+			ph = (ph << 1) & mask
+			mh = (mh << 1) & mask
+			pv = mh | (~(xv | ph) & mask)
+			mv = ph & xv
+			if score <= max_distance:
+				hits.append((index + 1, score))
+		return hits
+
+
+class JamoPattern:
+	def __init__(self, pattern: str, split_complex_letters: bool = True):
+		self.text = pattern
+		self.split_complex_letters = split_complex_letters
+		self.jamo = _jamo_key(pattern, split_complex_letters)
+		self._pattern = _BitParallelPattern(self.jamo)
+		self._reversed_pattern: _BitParallelPattern | None = None
+
+	def distance(self, candidate: str, max_distance: int | None = None) -> int:
+		return self._pattern.distance(_jamo_key(candidate, self.split_complex_letters), max_distance)
+
+	def distance_to_jamo(self, candidate_jamo: str, max_distance: int | None = None) -> int:
+		return self._pattern.distance(candidate_jamo, max_distance)
+
+	def search(self, text: str, max_distance: int) -> list[JamoMatch]:
+		jamo, source_map = _split_letters_with_source_map(text, self.split_complex_letters)
+		if not self.jamo:
+			return []
+		matches: list[JamoMatch] = []
+		for jamo_end, distance in self._best_match_ends(self._pattern.scan(jamo, max_distance)):
+			jamo_start = self._find_match_start(jamo, jamo_end, distance)
+			matches.append(
+				JamoMatch(
+					start=source_map[jamo_start],
+					end=source_map[jamo_end - 1] + 1,
+					distance=distance,
+					jamoStart=jamo_start,
+					jamoEnd=jamo_end,
+				),
+			)
+		return matches
+
+	@staticmethod
+	def _best_match_ends(hits: list[tuple[int, int]]) -> list[tuple[int, int]]:
+		# Adjacent ends describe the same occurrence; keep the first end with the lowest distance.
+		best: list[tuple[int, int]] = []
+		previous_end = -1
+		for end, distance in hits:
+			if best and end == previous_end + 1:
+				if distance < best[-1][1]:
+					best[-1] = (end, distance)
+			else:
+				best.append((end, distance))
+			previous_end = end
+		return best
+
+	def _find_match_start(self, jamo: str, jamo_end: int, distance: int) -> int:
+		if self._reversed_pattern is None:
+			self._reversed_pattern = _BitParallelPattern(self.jamo[::-1])
+		window_start = max(0, jamo_end - self._pattern.length - distance)
+		reversed_window = jamo[window_start:jamo_end][::-1]
+		hits = self._reversed_pattern.scan(reversed_window, distance)
+		if not hits:
+			return window_start
+		return jamo_end - hits[0][0]
+
+
+def jamo_edit_distance(first: str, second: str, split_complex_letters: bool = True) -> int:
+	return JamoPattern(first, split_complex_letters).distance(second)
+
+
+def _jamo_set_mask(jamo: str) -> int:
+	# One bit per distinct character, folded into 64 bits. Folding can only hide differences,
+	# so the filter below never rejects a real match.
+	mask = 0
+	for char in set(jamo):
+		mask |= 1 << (ord(char) & 63)
+	return mask
+
+
+@lru_cache(maxsize=None)
+def _piece_bounds(length: int, pieces: int) -> tuple[int, ...]:
+	return tuple(length * index // pieces for index in range(pieces + 1))
+
+
+class JamoVocabulary:
+	# Candidates are decomposed once and bucketed by jamo length.
+	# A query only looks at words whose length is within the distance limit, and finds them through
+	# a piece index: each word is cut into max_distance + r pieces at fixed positions for its length.
+	# Every edit touches one piece, so a word within the limit keeps r pieces unchanged, and each of
+	# them appears in the query shifted by no more than the edits around it. One unchanged piece is
+	# required up to distance 1 and two from distance 2, where single pieces are short and common.
+	# Each edit removes at most one distinct character of the query from the candidate,
+	# which gives a cheap set filter before the bit-parallel distance runs.
+
+	def __init__(self, words: Iterable[str], split_complex_letters: bool = True):
+		self.split_complex_letters = split_complex_letters
+		self.words: list[str] = []
+		self._jamo: list[str] = []
+		self._masks: list[int] = []
+		self._buckets: dict[int, list[int]] = {}
+		# Built on first use for each piece count: (word length, piece) -> piece text -> word indexes.
+		self._piece_indexes: dict[int, dict[tuple[int, int], dict[str, list[int]]]] = {}
+		for word in words:
+			jamo = _jamo_key(word, split_complex_letters)
+			self._buckets.setdefault(len(jamo), []).append(len(self.words))
+			self._jamo.append(jamo)
+			self._masks.append(_jamo_set_mask(jamo))
+			self.words.append(word)
+
+	def __len__(self) -> int:
+		return len(self.words)
+
+	def _piece_index(self, pieces: int) -> dict[tuple[int, int], dict[str, list[int]]]:
+		index = self._piece_indexes.get(pieces)
+		if index is None:
+			index = {}
+			jamo = self._jamo
+			for length, word_indexes in self._buckets.items():
+				if length < pieces:
+					continue
+				bounds = _piece_bounds(length, pieces)
+				for piece in range(pieces):
+					start, end = bounds[piece], bounds[piece + 1]
+					postings: dict[str, list[int]] = {}
+					for word_index in word_indexes:
+						postings.setdefault(jamo[word_index][start:end], []).append(word_index)
+					index[(length, piece)] = postings
+			self._piece_indexes[pieces] = index
+		return index
+
+	def _candidates(self, jamo: str, max_distance: int) -> Iterable[int]:
+		length = len(jamo)
+		lengths = range(max(0, length - max_distance), length + max_distance + 1)
+		if max_distance > _MAX_INDEXED_DISTANCE:
+			return [word_index for word_length in lengths for word_index in self._buckets.get(word_length, ())]
+		unchanged = 1 if max_distance <= 1 else 2
+		pieces = max_distance + unchanged
+		index = self._piece_index(pieces)
+		candidates: set[int] = set()
+		for word_length in lengths:
+			if word_length not in self._buckets:
+				continue
+			if word_length < pieces:
+				candidates.update(self._buckets[word_length])
+				continue
+			bounds = _piece_bounds(word_length, pieces)
+			difference = length - word_length
+			found: list[set[int]] = []
+			for piece in range(pieces):
+				start, end = bounds[piece], bounds[piece + 1]
+				# Insertions before the first piece and after the last are edits of those pieces,
+				# so an unchanged first or last piece is anchored to its end of the query.
+				if piece == 0:
+					shifts: Iterable[int] = (0,)
+				elif piece == pieces - 1:
+					shifts = (difference,)
+				else:
+					shifts = [
+						shift
+						for shift in range(-max_distance, max_distance + 1)
+						if abs(shift) + abs(difference - shift) <= max_distance
+					]
+				postings = index[(word_length, piece)]
+				matched: set[int] = set()
+				for shift in shifts:
+					if start + shift >= 0 and end + shift <= length:
+						matched.update(postings.get(jamo[start + shift : end + shift], ()))
+				found.append(matched)
+			if unchanged == 1:
+				candidates.update(*found)
+			else:
+				for first, second in combinations(found, 2):
+					candidates |= first & second
+		return candidates
+
+	def match(self, query: str | JamoPattern, max_distance: int, limit: int | None = None) -> list[tuple[str, int]]:
+		pattern = query if isinstance(query, JamoPattern) else JamoPattern(query, self.split_complex_letters)
+		if max_distance < 0:
+			return []
+		query_mask = _jamo_set_mask(pattern.jamo)
+		distance_to_jamo = pattern.distance_to_jamo
+		jamo = self._jamo
+		masks = self._masks
+		found: list[tuple[int, int]] = []
+		for word_index in self._candidates(pattern.jamo, max_distance):
+			if (query_mask & ~masks[word_index]).bit_count() > max_distance:
+				continue
+			distance = distance_to_jamo(jamo[word_index], max_distance)
+			if distance <= max_distance:
+				found.append((distance, word_index))
+		found.sort()
+		if limit is not None:
+			found = found[:limit]
+		return [(self.words[word_index], distance) for distance, word_index in found]
+
+
+def fuzzy_match(
+	query: str,
+	candidates: Iterable[str],
+	max_distance: int,
+	limit: int | None = None,
+	split_complex_letters: bool = True,
+) -> list[tuple[str, int]]:
+	pattern = JamoPattern(query, split_complex_letters)
+	found: list[tuple[int, int, str]] = []
+	for index, candidate in enumerate(candidates):
+		distance = pattern.distance(candidate, max_distance)
+		if distance <= max_distance:
+			found.append((distance, index, candidate))
+	found.sort()
+	if limit is not None:
+		found = found[:limit]
+	return [(candidate, distance) for distance, _index, candidate in found]
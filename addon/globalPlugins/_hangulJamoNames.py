@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+
+NAME_STYLE_FULL = "full"
+NAME_STYLE_SHORT = "short"
+# NVDA's own character descriptions, looked up one character at a time.
+NAME_STYLE_DESCRIPTION = "description"
+NAME_STYLES = (NAME_STYLE_FULL, NAME_STYLE_SHORT, NAME_STYLE_DESCRIPTION)
+
+_CONSONANTS = "ㄱㄲㄳㄴㄵㄶㄷㄸㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅃㅄㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_VOWELS = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+
+_KOREAN_CONSONANT_NAMES = (
+	"기역", "쌍기역", "기역시옷", "니은", "니은지읒", "니은히읗", "디귿", "쌍디귿", "리을", "리을기역",
+	"리을미음", "리을비읍", "리을시옷", "리을티읕", "리을피읖", "리을히읗", "미음", "비읍", "쌍비읍", "비읍시옷",
+	"시옷", "쌍시옷", "이응", "지읒", "쌍지읒", "치읓", "키읔", "티읕", "피읖", "히읗",
+)
+# Each consonant said with ㅡ, as when sounding out a word; ㅇ keeps its final sound to differ from ㅡ.
+_KOREAN_CONSONANT_SHORT_NAMES = (
+	"그", "끄", "그스", "느", "느즈", "느흐", "드", "뜨", "르", "르그",
+	"르므", "르브", "르스", "르트", "르프", "르흐", "므", "브", "쁘", "브스",
+	"스", "쓰", "응", "즈", "쯔", "츠", "크", "트", "프", "흐",
+)
+_KOREAN_VOWEL_NAMES = (
+	"아", "애", "야", "얘", "어", "에", "여", "예", "오", "와", "왜",
+	"외", "요", "우", "워", "웨", "위", "유", "으", "의", "이",
+)
+# Revised Romanization, for synthesizers that cannot read Hangul.
+_ENGLISH_CONSONANT_NAMES = (
+	"giyeok", "ssanggiyeok", "giyeok siot", "nieun", "nieun jieut", "nieun hieut", "digeut", "ssangdigeut",
+	"rieul", "rieul giyeok", "rieul mieum", "rieul bieup", "rieul siot", "rieul tieut", "rieul pieup",
+	"rieul hieut", "mieum", "bieup", "ssangbieup", "bieup siot", "siot", "ssangsiot", "ieung", "jieut",
+	"ssangjieut", "chieut", "kieuk", "tieut", "pieup", "hieut",
+)
+_ENGLISH_CONSONANT_SHORT_NAMES = (
+	"g", "kk", "g s", "n", "n j", "n h", "d", "tt", "r", "r g",
+	"r m", "r b", "r s", "r t", "r p", "r h", "m", "b", "pp", "b s",
+	"s", "ss", "ng", "j", "jj", "ch", "k", "t", "p", "h",
+)
+_ENGLISH_VOWEL_NAMES = (
+	"a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae",
+	"oe", "yo", "u", "wo", "we", "wi", "yu", "eu", "ui", "i",
+)
+
+_LETTERS = _CONSONANTS + _VOWELS
+_NAME_TABLES = {
+	(NAME_STYLE_FULL, True): dict(zip(_LETTERS, _KOREAN_CONSONANT_NAMES + _KOREAN_VOWEL_NAMES)),
+	(NAME_STYLE_SHORT, True): dict(zip(_LETTERS, _KOREAN_CONSONANT_SHORT_NAMES + _KOREAN_VOWEL_NAMES)),
+	(NAME_STYLE_FULL, False): dict(zip(_LETTERS, _ENGLISH_CONSONANT_NAMES + _ENGLISH_VOWEL_NAMES)),
+	(NAME_STYLE_SHORT, False): dict(zip(_LETTERS, _ENGLISH_CONSONANT_SHORT_NAMES + _ENGLISH_VOWEL_NAMES)),
+}
+
+
+def jamo_names(style: str, korean: bool) -> dict[str, str] | None:
+	# Spoken name of every Hangul compatibility letter, or None for NVDA's character descriptions.
+	return _NAME_TABLES.get((style, korean))
+
+
+def jamo_speech_sequence(
+	text: str,
+	names: dict[str, str],
+	spell: Callable[[str], Iterable],
+	separator: Callable[[], object],
+) -> list:
+	# Letters in names are spoken by name; runs of any other characters go to spell.
+	# separator() goes between the items, so each letter stays its own utterance as in spelling.
+	sequence: list = []
+	run_start = 0
+	for index, char in enumerate(text):
+		name = names.get(char)
+		if name is None:
+			continue
+		if run_start < index:
+			if sequence:
+				sequence.append(separator())
+			sequence.extend(spell(text[run_start:index]))
+		if sequence:
+			sequence.append(separator())
+		sequence.append(name)
+		run_start = index + 1
+	if run_start < len(text):
+		if sequence:
+			sequence.append(separator())
+		sequence.extend(spell(text[run_start:]))
+	return sequence
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from ._hangulSplitterCore import (
+	DEFAULT_DECOMPOSITION_RULES,
+	S_BASE,
+	S_END,
+	decompose_syllables,
+	letter_translation_table,
+	syllable_jamo_table,
+)
+
+
+@dataclass(frozen=True)
+class JamoSearchMatch:
+	patternIndex: int
+	start: int
+	end: int
+	startsInsideSyllable: bool
+	endsInsideSyllable: bool
+
+
+class JamoSearcher:
+	# Aho-Corasick automaton over jamo. Text is decomposed one character at a time
+	# while scanning, so matches are reported directly as spans of the original text.
+	# A span covers every source character that contributed a matched jamo;
+	# the inside flags tell whether the match starts or ends part way through a syllable.
+	# Standalone letters are split like letters inside syllables, in patterns and in text,
+	# so a pattern ㄲ finds 까 and a pattern ㄱㅅ finds a standalone ㄳ.
+
+	def __init__(self, patterns: Iterable[str], split_complex_letters: bool = True):
+		self.split_complex_letters = split_complex_letters
+		self.patterns = list(patterns)
+		self._table = syllable_jamo_table(split_complex_letters)
+		self._letter_table = letter_translation_table(DEFAULT_DECOMPOSITION_RULES if split_complex_letters else ())
+		self._goto: list[dict[str, int]] = [{}]
+		self._fail: list[int] = [0]
+		self._outputs: list[tuple[tuple[int, int], ...]] = [()]
+		self._longest = 0
+		self._build()
+
+	def _build(self) -> None:
+		direct_outputs: list[list[tuple[int, int]]] = [[]]
+		for pattern_index, pattern in enumerate(self.patterns):
+			jamo = decompose_syllables(pattern.translate(self._letter_table), self.split_complex_letters)
+			if not jamo:
+				continue
+			state = 0
+			for char in jamo:
+				next_state = self._goto[state].get(char)
+				if next_state is None:
+					next_state = len(self._goto)
+					self._goto[state][char] = next_state
+					self._goto.append({})
+					self._fail.append(0)
+					direct_outputs.append([])
+				state = next_state
+			direct_outputs[state].append((pattern_index, len(jamo)))
+			self._longest = max(self._longest, len(jamo))
+
+		outputs: list[tuple[tuple[int, int], ...]] = [()] * len(self._goto)
+		queue: deque[int] = deque()
+		for child in self._goto[0].values():
+			outputs[child] = tuple(direct_outputs[child])
+			queue.append(child)
+		while queue:
+			state = queue.popleft()
+			for char, child in self._goto[state].items():
+				fallback = self._fail[state]
+				while fallback and char not in self._goto[fallback]:
+					fallback = self._fail[fallback]
+				fail_state = self._goto[fallback].get(char, 0)
+				self._fail[child] = fail_state
+				outputs[child] = tuple(direct_outputs[child]) + outputs[fail_state]
+				queue.append(child)
+		self._outputs = outputs
+
+	def iter_matches(self, chunks: Iterable[str]) -> Iterator[JamoSearchMatch]:
+		goto = self._goto
+		fail = self._fail
+		outputs = self._outputs
+		table = self._table
+		letter_table = self._letter_table
+		# (source index, jamo offset inside that character) of the most recent jamo.
+		history: deque[tuple[int, int]] = deque(maxlen=max(1, self._longest))
+		state = 0
+		source_index = 0
+		for chunk in chunks:
+			for char in chunk:
+				scalar = ord(char)
+				jamo = table[scalar - S_BASE] if S_BASE <= scalar <= S_END else letter_table.get(scalar, char)
+				last_offset = len(jamo) - 1
+				for offset, jamo_char in enumerate(jamo):
+					while state and jamo_char not in goto[state]:
+						state = fail[state]
+					state = goto[state].get(jamo_char, 0)
+					history.append((source_index, offset))
+					for pattern_index, length in outputs[state]:
+						start_index, start_offset = history[-length]
+						yield JamoSearchMatch(
+							patternIndex=pattern_index,
+							start=start_index,
+							end=source_index + 1,
+							startsInsideSyllable=start_offset > 0,
+							endsInsideSyllable=offset < last_offset,
+						)
+				source_index += 1
+
+	def find_all(self, text: str) -> list[JamoSearchMatch]:
+		return list(self.iter_matches((text,)))
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+
+from ._hangulSplitterCore import DEFAULT_DECOMPOSITION_RULES, DecompositionRules, decompose_syllables
+
+
+def _index_array(values: list[int]) -> array:
+	return array("I", values)
+
+
+class JamoTrie:
+	# Prefix tree over the jamo spelling of each word, for completing text that is still being typed.
+	# A query is decomposed the same way, so "하ㄴ" or "한" finds both 한글 and 하나,
+	# and with complex letters split "닭" also finds 달걀.
+	#
+	# Nodes live in flat arrays indexed by node number, numbered depth first with the root as 0.
+	# Children are linked through firstChild and nextSibling in jamo order, 0 ending a list.
+	# Words are sorted by spelling, so the words below any node are one slice of the word list,
+	# words[rangeStart[n]:rangeEnd[n]], and the first exactEnd[n] - rangeStart[n] of them end at n.
+
+	def __init__(
+		self,
+		words: Iterable[str],
+		split_complex_letters: bool = True,
+		rules: DecompositionRules = DEFAULT_DECOMPOSITION_RULES,
+	):
+		self.split_complex_letters = split_complex_letters
+		self._rules = rules if split_complex_letters else ()
+		# Standalone letters in a query, such as a typed ㄲ, are split like letters inside syllables.
+		self._letter_table = {ord(letter): replacement for letter, replacement in self._rules}
+		entries = sorted((self.key(word), word) for word in dict.fromkeys(words) if word)
+		self._keys = [key for key, _word in entries]
+		self.words = [word for _key, word in entries]
+		self._build()
+
+	def key(self, text: str) -> str:
+		return decompose_syllables(text.translate(self._letter_table), self.split_complex_letters, self._rules)
+
+	def _build(self) -> None:
+		# One pass over the sorted spellings: each one shares a prefix with the previous one,
+		# closes the nodes below that prefix and opens nodes for the rest of its letters.
+		keys = self._keys
+		labels = [0]
+		first_child = [0]
+		next_sibling = [0]
+		last_child = [0]
+		range_start = [0]
+		range_end = [len(keys)]
+		exact_end = [0]
+		path = [0]
+		previous = ""
+		for index, key in enumerate(keys):
+			shared = 0
+			limit = min(len(previous), len(key))
+			while shared < limit and previous[shared] == key[shared]:
+				shared += 1
+			while len(path) - 1 > shared:
+				range_end[path.pop()] = index
+			for label in key[shared:]:
+				parent = path[-1]
+				node = len(labels)
+				labels.append(ord(label))
+				first_child.append(0)
+				next_sibling.append(0)
+				last_child.append(0)
+				range_start.append(index)
+				range_end.append(index)
+				exact_end.append(index)
+				if last_child[parent]:
+					next_sibling[last_child[parent]] = node
+				else:
+					first_child[parent] = node
+				last_child[parent] = node
+				path.append(node)
+			exact_end[path[-1]] = index + 1
+			previous = key
+		while len(path) > 1:
+			range_end[path.pop()] = len(keys)
+		self._labels = _index_array(labels)
+		self._first_child = _index_array(first_child)
+		self._next_sibling = _index_array(next_sibling)
+		self._range_start = _index_array(range_start)
+		self._range_end = _index_array(range_end)
+		self._exact_end = _index_array(exact_end)
+
+	@property
+	def node_count(self) -> int:
+		return len(self._labels)
+
+	def _find(self, key: str) -> int:
+		labels = self._labels
+		first_child = self._first_child
+		next_sibling = self._next_sibling
+		node = 0
+		for char in key:
+			code = ord(char)
+			child = first_child[node]
+			while child and labels[child] < code:
+				child = next_sibling[child]
+			if not child or labels[child] != code:
+				return -1
+			node = child
+		return node
+
+	def __len__(self) -> int:
+		return len(self.words)
+
+	def __contains__(self, word: object) -> bool:
+		if not isinstance(word, str):
+			return False
+		node = self._find(self.key(word))
+		return node >= 0 and word in self.words[self._range_start[node] : self._exact_end[node]]
+
+	def count(self, prefix: str) -> int:
+		node = self._find(self.key(prefix))
+		if node < 0:
+			return 0
+		return self._range_end[node] - self._range_start[node]
+
+	def complete(self, prefix: str, limit: int | None = 10) -> list[str]:
+		# Words whose spelling starts with the spelling of prefix, in jamo order.
+		node = self._find(self.key(prefix))
+		if node < 0:
+			return []
+		start = self._range_start[node]
+		end = self._range_end[node]
+		if limit is not None:
+			end = min(end, start + limit)
+		return self.words[start:end]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import queue
+import threading
+from typing import Any, Callable
+
+
+# Jobs up to this many source characters run inline; splitting them takes well under a millisecond.
+INLINE_SPLIT_MAX_CHARS = 4000
+
+
+@dataclass(frozen=True)
+class _Job:
+	generation: int
+	run: Callable[[], Any]
+	onResult: Callable[[Any], None]
+
+
+def _reraise(error: BaseException) -> None:
+	raise error
+
+
+class SplitWorker:
+	# One background thread for splitting long text off the main thread.
+	# Every submission gets a new generation; a job whose generation is no longer current
+	# is skipped before it runs and its result is dropped instead of being delivered.
+	# Results are handed to `deliver`, which must run the callable on the main thread.
+
+	def __init__(
+		self,
+		deliver: Callable[[Callable[[], None]], Any],
+		inline_max_chars: int = INLINE_SPLIT_MAX_CHARS,
+	):
+		self._deliver = deliver
+		self._inline_max_chars = inline_max_chars
+		self._lock = threading.Lock()
+		self._generation = 0
+		self._jobs: queue.Queue[_Job | None] = queue.Queue()
+		self._thread: threading.Thread | None = None
+
+	@property
+	def generation(self) -> int:
+		return self._generation
+
+	def supersede(self) -> int:
+		with self._lock:
+			self._generation += 1
+			return self._generation
+
+	def submit(self, run: Callable[[], Any], on_result: Callable[[Any], None], size: int) -> int:
+		generation = self.supersede()
+		if size <= self._inline_max_chars:
+			on_result(run())
+			return generation
+		self._ensure_thread()
+		self._jobs.put(_Job(generation=generation, run=run, onResult=on_result))
+		return generation
+
+	def terminate(self, timeout: float = 1.0) -> None:
+		self.supersede()
+		thread = self._thread
+		if thread is None:
+			return
+		self._jobs.put(None)
+		thread.join(timeout)
+		self._thread = None
+
+	def wait_idle(self, timeout: float | None = None) -> bool:
+		# True once every queued job has run or been skipped; results may still be waiting in `deliver`.
+		with self._jobs.all_tasks_done:
+			return self._jobs.all_tasks_done.wait_for(lambda: not self._jobs.unfinished_tasks, timeout)
+
+	def _ensure_thread(self) -> None:
+		if self._thread is not None and self._thread.is_alive():
+			return
+		self._thread = threading.Thread(
+			target=self._run_jobs,
+			name="hangulBlockSplitter.SplitWorker",
+			daemon=True,
+		)
+		self._thread.start()
+
+	def _is_current(self, job: _Job) -> bool:
+		return job.generation == self._generation
+
+	def _run_jobs(self) -> None:
+		while True:
+			job = self._jobs.get()
+			try:
+				if job is None:
+					return
+				self._run_job(job)
+			finally:
+				self._jobs.task_done()
+
+	def _run_job(self, job: _Job) -> None:
+		if not self._is_current(job):
+			return
+		try:
+			result = job.run()
+		except Exception as error:
+			self._deliver(lambda error=error: _reraise(error))
+			return
+		if self._is_current(job):
+			self._deliver(lambda: self._finish(job, result))
+
+	def _finish(self, job: _Job, result: Any) -> None:
+		# A newer gesture may have arrived while the result was waiting for the main thread.
+		if self._is_current(job):
+			job.onResult(result)
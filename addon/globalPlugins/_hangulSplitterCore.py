@@ -1,6 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
+import os
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from concurrent.futures import Executor
 
 S_BASE = 0xAC00
 S_END = 0xD7A3
@@ -115,6 +124,16 @@ COMPLEX_COMPAT_MAP = {
 	"ㅄ": "ㅂㅅ",
 }
 
+DecompositionRules = tuple[tuple[str, str], ...]
+
+
+def normalize_rules(replacements: dict[str, str]) -> DecompositionRules:
+	# Sorted pairs, so equal rule sets compare and hash equal and share one compiled table.
+	return tuple(sorted(replacements.items()))
+
+
+DEFAULT_DECOMPOSITION_RULES = normalize_rules(COMPLEX_COMPAT_MAP)
+
 HANGUL_RANGES = (
 	(0x1100, 0x11FF),  # Hangul Jamo
 	(0x3130, 0x318F),  # Hangul Compatibility Jamo
@@ -123,14 +142,52 @@ HANGUL_RANGES = (
 	(0xD7B0, 0xD7FF),  # Hangul Jamo Extended-B
 )
 
+CHAR_KIND_SYLLABLE = "syllable"
+CHAR_KIND_JAMO = "jamo"
+CHAR_KIND_WHITESPACE = "whitespace"
+CHAR_KIND_OTHER = "other"
+
+
+def _char_class_for_ranges(ranges: tuple[tuple[int, int], ...]) -> str:
+	return "".join(f"\\U{start:08x}-\\U{end:08x}" for start, end in ranges)
+
+
+_SYLLABLE_RANGES = ((S_BASE, S_END),)
+_JAMO_RANGES = tuple((start, end) for start, end in HANGUL_RANGES if (start, end) != (S_BASE, S_END))
+# The empty string between two adjacent syllables.
+_SYLLABLE_GAP_RE = re.compile(
+	f"(?<=[{_char_class_for_ranges(_SYLLABLE_RANGES)}])(?=[{_char_class_for_ranges(_SYLLABLE_RANGES)}])",
+)
+_WHITESPACE_RE = re.compile(r"\s")
+_HANGUL_CHAR_RE = re.compile(f"[{_char_class_for_ranges(HANGUL_RANGES)}]")
+# \s matches exactly the characters for which str.isspace() is true.
+_NOT_HANGUL_RE = re.compile(f"[^{_char_class_for_ranges(HANGUL_RANGES)}]+")
+_NOT_HANGUL_OR_SPACE_RE = re.compile(f"[^{_char_class_for_ranges(HANGUL_RANGES)}\\s]+")
+_HANGUL_RUN_RE = re.compile(
+	f"(?P<{CHAR_KIND_SYLLABLE}>[{_char_class_for_ranges(_SYLLABLE_RANGES)}]+)"
+	f"|(?P<{CHAR_KIND_JAMO}>[{_char_class_for_ranges(_JAMO_RANGES)}]+)"
+	f"|(?P<{CHAR_KIND_WHITESPACE}>\\s+)",
+)
+
+
+# Long texts are filtered and translated this many characters at a time, which keeps
+# the intermediate pieces of only one slice alive next to the output.
+_SLICE_CHARS = 64 * 1024
+
 
 @dataclass(frozen=True)
 class SplitOptions:
 	splitComplexLetters: bool = True
 	insertSpacesBetweenLetters: bool = False
+	# Letter replacements used when complex letters are split.
+	decompositionRules: DecompositionRules = DEFAULT_DECOMPOSITION_RULES
 
+	@property
+	def activeRules(self) -> DecompositionRules:
+		return self.decompositionRules if self.splitComplexLetters else ()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _Unit:
 	text: str
 	isWhitespace: bool
@@ -150,12 +207,147 @@ def is_hangul_script_char(char: str) -> bool:
 	return False
 
 
+def classify_char(char: str) -> str:
+	if _is_hangul_syllable(char):
+		return CHAR_KIND_SYLLABLE
+	if is_hangul_script_char(char):
+		return CHAR_KIND_JAMO
+	if char.isspace():
+		return CHAR_KIND_WHITESPACE
+	return CHAR_KIND_OTHER
+
+
+def iter_hangul_runs(text: str, include_whitespace: bool = True) -> Iterator[tuple[int, int, str]]:
+	for match in _HANGUL_RUN_RE.finditer(text):
+		kind = match.lastgroup or CHAR_KIND_OTHER
+		if kind == CHAR_KIND_WHITESPACE and not include_whitespace:
+			continue
+		yield match.start(), match.end(), kind
+
+
+def contains_hangul(text: str) -> bool:
+	return _HANGUL_CHAR_RE.search(text) is not None
+
+
+def _iter_slices(text: str) -> Iterator[str]:
+	for start in range(0, len(text), _SLICE_CHARS):
+		yield text[start : start + _SLICE_CHARS]
+
+
 def keep_only_hangul(text: str, include_whitespace: bool = True) -> str:
-	filtered_chars: list[str] = []
-	for char in text:
-		if is_hangul_script_char(char) or (include_whitespace and char.isspace()):
-			filtered_chars.append(char)
-	return "".join(filtered_chars)
+	pattern = _NOT_HANGUL_OR_SPACE_RE if include_whitespace else _NOT_HANGUL_RE
+	if len(text) <= _SLICE_CHARS:
+		return pattern.sub("", text)
+	return "".join(pattern.sub("", part) for part in _iter_slices(text))
+
+
+def syllable_jamo_table(
+	split_complex_letters: bool,
+	rules: DecompositionRules = DEFAULT_DECOMPOSITION_RULES,
+) -> tuple[str, ...]:
+	return compile_syllable_table(rules if split_complex_letters else ())
+
+
+def _generated_syllable_table(rules: DecompositionRules, spaced: bool = False) -> tuple[str, ...] | None:
+	# The build writes tables for the default rules and for no rules, with and without letter spacing,
+	# into _hangulTables (see site_scons/site_tools/hangulTables); loading them is much faster than computing.
+	# Source checkouts and the core imported as a plain module compute them instead.
+	try:
+		from . import _hangulTables
+	except ImportError:
+		return None
+	if not rules:
+		name = "SYLLABLE_JAMO"
+	elif rules == _hangulTables.SPLIT_RULES:
+		name = "SYLLABLE_JAMO_SPLIT"
+	else:
+		return None
+	return tuple(getattr(_hangulTables, f"{name}_SPACED" if spaced else name).split("\n"))
+
+
+# A few rule sets are kept compiled, so switching between profiles does not rebuild their tables.
+@lru_cache(maxsize=8)
+def compile_syllable_table(rules: DecompositionRules) -> tuple[str, ...]:
+	generated = _generated_syllable_table(rules)
+	if generated is not None:
+		return generated
+	replacements = dict(rules)
+	entries: list[str] = []
+	for s_index in range(S_END - S_BASE + 1):
+		l_index = s_index // N_COUNT
+		v_index = (s_index % N_COUNT) // T_COUNT
+		t_index = s_index % T_COUNT
+		jamo = LEADING_COMPAT[l_index] + VOWEL_COMPAT[v_index] + TRAILING_COMPAT[t_index]
+		if replacements:
+			jamo = "".join(replacements.get(char, char) for char in jamo)
+		entries.append(jamo)
+	return tuple(entries)
+
+
+@lru_cache(maxsize=8)
+def _syllable_translation_table(rules: DecompositionRules) -> dict[int, str]:
+	return dict(zip(range(S_BASE, S_END + 1), compile_syllable_table(rules)))
+
+
+@lru_cache(maxsize=8)
+def _spaced_translation_table(rules: DecompositionRules) -> dict[int, str]:
+	spaced = _generated_syllable_table(rules, spaced=True)
+	if spaced is None:
+		spaced = tuple(" ".join(jamo) for jamo in compile_syllable_table(rules))
+	return dict(zip(range(S_BASE, S_END + 1), spaced))
+
+
+@lru_cache(maxsize=8)
+def letter_translation_table(rules: DecompositionRules) -> dict[int, str]:
+	# Standalone compatibility letters, split by the same rules as the letters inside syllables.
+	return {ord(letter): replacement for letter, replacement in rules}
+
+
+def decompose_syllables(
+	text: str,
+	split_complex_letters: bool = True,
+	rules: DecompositionRules = DEFAULT_DECOMPOSITION_RULES,
+) -> str:
+	# Same result as split_hangul_blocks without letter spacing, done by str.translate.
+	return text.translate(_syllable_translation_table(rules if split_complex_letters else ()))
+
+
+def translate_hangul_blocks(input_text: str, options: SplitOptions) -> str:
+	# Same result as split_hangul_blocks, looked up in the compiled per-syllable table.
+	# With letter spacing, a space goes between adjacent syllables first and each syllable
+	# then becomes its spaced letters, so both steps stay inside str.translate and re.
+	if len(input_text) > _SLICE_CHARS:
+		return "".join(iter_split_hangul_blocks(_iter_slices(input_text), options))
+	if not options.insertSpacesBetweenLetters:
+		return input_text.translate(_syllable_translation_table(options.activeRules))
+	return _SYLLABLE_GAP_RE.sub(" ", input_text).translate(_spaced_translation_table(options.activeRules))
+
+
+def split_hangul_blocks_with_source_map(input_text: str, options: SplitOptions) -> tuple[str, list[int]]:
+	# Each output character maps to the index of the input character it came from.
+	# Spaces inserted between letters map to the syllable that follows them.
+	table = compile_syllable_table(options.activeRules)
+	insert_spaces = options.insertSpacesBetweenLetters
+	output_parts: list[str] = []
+	source_map: list[int] = []
+	previous_was_hangul_letter = False
+	for index, char in enumerate(input_text):
+		scalar = ord(char)
+		if not S_BASE <= scalar <= S_END:
+			output_parts.append(char)
+			source_map.append(index)
+			previous_was_hangul_letter = False
+			continue
+		jamo = table[scalar - S_BASE]
+		if insert_spaces:
+			if previous_was_hangul_letter:
+				output_parts.append(" ")
+				source_map.append(index)
+			jamo = " ".join(jamo)
+		output_parts.append(jamo)
+		source_map.extend([index] * len(jamo))
+		previous_was_hangul_letter = True
+	return "".join(output_parts), source_map
 
 
 def split_hangul_blocks(input_text: str, options: SplitOptions) -> str:
@@ -183,12 +375,13 @@ def split_hangul_blocks(input_text: str, options: SplitOptions) -> str:
 			units.append(_Unit(text=TRAILING_COMPAT[t_index], isWhitespace=False, isHangulLetter=True))
 
 	if options.splitComplexLetters:
+		replacements = dict(options.decompositionRules)
 		expanded: list[_Unit] = []
 		for unit in units:
 			if not unit.isHangulLetter or len(unit.text) != 1:
 				expanded.append(unit)
 				continue
-			mapped = COMPLEX_COMPAT_MAP.get(unit.text)
+			mapped = replacements.get(unit.text)
 			if not mapped:
 				expanded.append(unit)
 				continue
@@ -212,3 +405,85 @@ def split_hangul_blocks(input_text: str, options: SplitOptions) -> str:
 		previous_was_hangul_letter = unit.isHangulLetter
 
 	return "".join(output_parts)
+
+
+def _starts_spaced_run(previous_chunk: str, chunk: str, options: SplitOptions) -> bool:
+	# Whether letter spacing continues across the boundary between two adjacent chunks.
+	return (
+		options.insertSpacesBetweenLetters
+		and bool(previous_chunk)
+		and bool(chunk)
+		and _is_hangul_syllable(previous_chunk[-1])
+		and _is_hangul_syllable(chunk[0])
+	)
+
+
+def iter_split_hangul_blocks(chunks: Iterable[str], options: SplitOptions) -> Iterator[str]:
+	# Joining the yielded pieces gives the same text as splitting the joined chunks,
+	# including the letter spacing between syllables on either side of a chunk boundary.
+	previous_chunk = ""
+	for chunk in chunks:
+		if not chunk:
+			continue
+		output = translate_hangul_blocks(chunk, options)
+		if _starts_spaced_run(previous_chunk, chunk, options):
+			output = " " + output
+		previous_chunk = chunk
+		yield output
+
+
+# Texts shorter than this per worker are split on the calling thread.
+PARALLEL_MIN_CHUNK_CHARS = 256 * 1024
+# How far past an even cut point to look for whitespace to cut at instead.
+_PARALLEL_CUT_SEARCH_CHARS = 4096
+
+
+def parallel_cut_points(input_text: str, parts: int) -> list[int]:
+	# Offsets cutting the text into about equal parts, starting with 0 and ending with its length.
+	# Cuts fall on whitespace where there is some nearby, otherwise between any two characters.
+	size = len(input_text)
+	cuts = [0]
+	for part in range(1, parts):
+		target = max(size * part // parts, cuts[-1] + 1)
+		if target >= size:
+			break
+		match = _WHITESPACE_RE.search(input_text, target, min(size, target + _PARALLEL_CUT_SEARCH_CHARS))
+		cut = match.start() if match else target
+		if cut > cuts[-1]:
+			cuts.append(cut)
+	cuts.append(size)
+	return cuts
+
+
+def split_hangul_blocks_parallel(
+	input_text: str,
+	options: SplitOptions,
+	max_workers: int | None = None,
+	executor: Executor | None = None,
+	min_chunk_chars: int = PARALLEL_MIN_CHUNK_CHARS,
+) -> str:
+	# Same result as split_hangul_blocks, with parts of the text split on several threads.
+	# Nothing shared between the threads is written, so this only needs the GIL-free speedup
+	# of a free-threaded build to use several cores; with the GIL it runs about as fast as one thread.
+	# Pass an executor to reuse its threads across calls; otherwise a pool lives for this call only.
+	workers = max_workers or os.cpu_count() or 1
+	parts = min(workers, len(input_text) // max(1, min_chunk_chars))
+	if parts <= 1:
+		return translate_hangul_blocks(input_text, options)
+	cuts = parallel_cut_points(input_text, parts)
+	chunks = [input_text[start:end] for start, end in zip(cuts, cuts[1:])]
+	# Compiled here first, so the workers do not each build the tables on a cold cache.
+	_syllable_translation_table(options.activeRules)
+	if options.insertSpacesBetweenLetters:
+		_spaced_translation_table(options.activeRules)
+	if executor is not None:
+		outputs = list(executor.map(translate_hangul_blocks, chunks, repeat(options)))
+	else:
+		from concurrent.futures import ThreadPoolExecutor
+
+		with ThreadPoolExecutor(max_workers=len(chunks), thread_name_prefix="hangulSplit") as pool:
+			outputs = list(pool.map(translate_hangul_blocks, chunks, repeat(options)))
+	for index in range(1, len(chunks)):
+		if _starts_spaced_run(chunks[index - 1], chunks[index], options):
+			outputs[index] = " " + outputs[index]
+	return "".join(outputs)
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Callable
+
+import api
+import ui
+import wx
+
+from ._hangulSplitterCore import SplitOptions, translate_hangul_blocks
+from ._hangulSplitterProfiling import profiled
+from .hangulBlockSplitter import (
+	_sanitize_for_split,
+	_save_live_update_setting,
+	_save_split_options,
+	_settings,
+	_tr,
+)
+
+
+class HangulSplitterDialog(wx.Dialog):
+	def __init__(
+		self,
+		parent: wx.Window | None,
+		initial_text: str,
+		on_close: Callable[[], None],
+	):
+		super().__init__(parent=parent, title=_tr("Hangul Block Splitter", "한글 블록 분해기"))
+		self._on_close = on_close
+		self._closed = False
+		self._normalizing_input = False
+		self._build_ui(initial_text)
+		self.Bind(wx.EVT_CLOSE, self._on_close_event)
+
+	def _build_ui(self, initial_text: str) -> None:
+		main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+		input_label = wx.StaticText(self, label=_tr("Input text", "입력 텍스트"))
+		self._input_edit = wx.TextCtrl(self, style=wx.TE_MULTILINE)
+		self._input_edit.SetValue(initial_text)
+
+		options_sizer = wx.StaticBoxSizer(wx.VERTICAL, self, _tr("Options", "옵션"))
+		self._split_complex_checkbox = wx.CheckBox(
+			self,
+			label=_tr(
+				"Split complex letters (ㅘ -> ㅗㅏ, ㄳ -> ㄱㅅ, ㅄ -> ㅂㅅ)",
+				"겹모음/겹받침 분해하기 (ㅘ -> ㅗㅏ, ㄳ -> ㄱㅅ, ㅄ -> ㅂㅅ)",
+			),
+		)
+		self._insert_spaces_checkbox = wx.CheckBox(
+			self,
+			label=_tr("Insert spaces between letters", "글자 사이에 공백 넣기"),
+		)
+		self._live_update_checkbox = wx.CheckBox(
+			self,
+			label=_tr("Update output as you type", "입력할 때 결과 바로 갱신"),
+		)
+		settings = _settings.snapshot()
+		# The checkboxes override the configured options; the decomposition profile is kept.
+		self._base_options = settings.splitOptions
+		self._split_complex_checkbox.SetValue(settings.splitOptions.splitComplexLetters)
+		self._insert_spaces_checkbox.SetValue(settings.splitOptions.insertSpacesBetweenLetters)
+		self._live_update_checkbox.SetValue(settings.liveUpdateInDialog)
+		options_sizer.Add(self._split_complex_checkbox, border=2, flag=wx.BOTTOM)
+		options_sizer.Add(self._insert_spaces_checkbox, border=2, flag=wx.BOTTOM)
+		options_sizer.Add(self._live_update_checkbox)
+
+		output_label = wx.StaticText(
+			self,
+			label=_tr("Output text (read-only)", "결과 텍스트(읽기 전용)"),
+		)
+		self._output_edit = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY)
+
+		button_row = wx.BoxSizer(wx.HORIZONTAL)
+		self._split_button = wx.Button(self, label=_tr("&Split", "&분해"))
+		self._copy_button = wx.Button(self, label=_tr("&Copy output", "결과 &복사"))
+		self._clear_button = wx.Button(self, label=_tr("C&lear", "&지우기"))
+		close_button = wx.Button(self, wx.ID_CANCEL, _tr("&Close", "&닫기"))
+		button_row.Add(self._split_button, border=5, flag=wx.RIGHT)
+		button_row.Add(self._copy_button, border=5, flag=wx.RIGHT)
+		button_row.Add(self._clear_button, border=5, flag=wx.RIGHT)
+		button_row.Add(close_button)
+
+		self._status_label = wx.StaticText(self, label=_tr("Ready.", "준비됨."))
+
+		main_sizer.Add(input_label, border=6, flag=wx.LEFT | wx.TOP)
+		main_sizer.Add(self._input_edit, proportion=1, border=6, flag=wx.EXPAND | wx.LEFT | wx.RIGHT)
+		main_sizer.Add(options_sizer, border=6, flag=wx.EXPAND | wx.ALL)
+		main_sizer.Add(output_label, border=6, flag=wx.LEFT)
+		main_sizer.Add(
+			self._output_edit,
+			proportion=1,
+			border=6,
+			flag=wx.EXPAND | wx.LEFT | wx.RIGHT,
+		)
+		main_sizer.Add(button_row, border=6, flag=wx.LEFT | wx.RIGHT | wx.TOP)
+		main_sizer.Add(self._status_label, border=6, flag=wx.LEFT | wx.RIGHT | wx.BOTTOM)
+
+		self.SetSizer(main_sizer)
+		self.SetMinSize((640, 460))
+		self.SetSize((760, 560))
+
+		self._split_button.Bind(wx.EVT_BUTTON, self._on_split)
+		self._copy_button.Bind(wx.EVT_BUTTON, self._on_copy_output)
+		self._clear_button.Bind(wx.EVT_BUTTON, self._on_clear)
+		close_button.Bind(wx.EVT_BUTTON, lambda evt: self.Close())
+		self.Bind(wx.EVT_CHAR_HOOK, self._on_char_hook)
+		self._input_edit.Bind(wx.EVT_TEXT, self._on_input_text_change)
+		self._split_complex_checkbox.Bind(wx.EVT_CHECKBOX, self._on_live_update_change)
+		self._insert_spaces_checkbox.Bind(wx.EVT_CHECKBOX, self._on_live_update_change)
+		self._live_update_checkbox.Bind(wx.EVT_CHECKBOX, self._on_live_update_toggle)
+		self.SetEscapeId(wx.ID_CANCEL)
+
+		self._enforce_hangul_input()
+		self._update_output(announce=False)
+		wx.CallAfter(self._input_edit.SetFocus)
+
+	def _current_options(self) -> SplitOptions:
+		return replace(
+			self._base_options,
+			splitComplexLetters=self._split_complex_checkbox.GetValue(),
+			insertSpacesBetweenLetters=self._insert_spaces_checkbox.GetValue(),
+		)
+
+	def _save_preferences(self) -> None:
+		_save_split_options(self._current_options())
+		_save_live_update_setting(self._live_update_checkbox.GetValue())
+
+	def get_input_text(self) -> str:
+		return self._input_edit.GetValue()
+
+	def set_input_text(self, text: str) -> None:
+		self._input_edit.SetValue(_sanitize_for_split(text))
+		self._update_output(announce=False)
+
+	def _enforce_hangul_input(self) -> bool:
+		current_text = self._input_edit.GetValue()
+		filtered_text = _sanitize_for_split(current_text)
+		if filtered_text == current_text:
+			return False
+		cursor_pos = self._input_edit.GetInsertionPoint()
+		self._normalizing_input = True
+		self._input_edit.ChangeValue(filtered_text)
+		self._input_edit.SetInsertionPoint(min(cursor_pos, len(filtered_text)))
+		self._normalizing_input = False
+		return True
+
+	def _set_status(self, text: str) -> None:
+		self._status_label.SetLabel(text)
+
+	@profiled
+	def _update_output(self, announce: bool) -> None:
+		output = translate_hangul_blocks(self._input_edit.GetValue(), self._current_options())
+		self._output_edit.ChangeValue(output)
+		if announce:
+			self._set_status(_tr("Output updated.", "결과를 갱신했습니다."))
+
+	def _on_split(self, evt: wx.CommandEvent) -> None:
+		self._update_output(announce=True)
+
+	def _on_copy_output(self, evt: wx.CommandEvent) -> None:
+		text = self._output_edit.GetValue()
+		if not text:
+			self._set_status(_tr("Nothing to copy.", "복사할 내용이 없습니다."))
+			ui.message(_tr("Nothing to copy.", "복사할 내용이 없습니다."))
+			return
+		if api.copyToClip(text, notify=True):
+			self._set_status(_tr("Output copied to clipboard.", "결과를 클립보드에 복사했습니다."))
+		else:
+			self._set_status(_tr("Unable to copy output.", "결과를 복사하지 못했습니다."))
+
+	def _on_clear(self, evt: wx.CommandEvent) -> None:
+		self._input_edit.Clear()
+		self._output_edit.Clear()
+		self._input_edit.SetFocus()
+		self._set_status(_tr("Cleared.", "입력과 결과를 지웠습니다."))
+
+	def _on_live_update_toggle(self, evt: wx.CommandEvent) -> None:
+		if self._live_update_checkbox.GetValue():
+			self._update_output(announce=False)
+			self._set_status(_tr("Live update is on.", "실시간 갱신이 켜졌습니다."))
+		else:
+			self._set_status(
+				_tr(
+					"Live update is off. Press Split to refresh output.",
+					"실시간 갱신이 꺼졌습니다. 분해 버튼을 눌러 결과를 갱신하세요.",
+				),
+			)
+
+	def _on_live_update_change(self, evt: wx.CommandEvent) -> None:
+		if self._live_update_checkbox.GetValue():
+			self._update_output(announce=False)
+		evt.Skip()
+
+	@profiled
+	def _on_input_text_change(self, evt: wx.CommandEvent) -> None:
+		if self._normalizing_input:
+			evt.Skip()
+			return
+		if self._enforce_hangul_input():
+			self._set_status(
+				_tr(
+					"Only Hangul characters are accepted. Non-Hangul input was ignored.",
+					"한글만 입력할 수 있습니다. 한글이 아닌 문자는 자동으로 제외했습니다.",
+				),
+			)
+		if self._live_update_checkbox.GetValue():
+			self._update_output(announce=False)
+		evt.Skip()
+
+	def _on_char_hook(self, evt: wx.KeyEvent) -> None:
+		if evt.GetKeyCode() == wx.WXK_ESCAPE:
+			self.Close()
+			return
+		evt.Skip()
+
+	def _on_close_event(self, evt: wx.CloseEvent) -> None:
+		if self._closed:
+			evt.Skip()
+			return
+		self._closed = True
+		self._save_preferences()
+		try:
+			self._on_close()
+		finally:
+			self.Destroy()
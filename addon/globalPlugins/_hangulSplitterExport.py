@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+import os
+import time
+from typing import Callable
+
+import api
+import gui
+from logHandler import log
+import textInfos
+import ui
+import wx
+
+from ._hangulSplitterCore import SplitOptions, contains_hangul
+from ._hangulSplitterProfiling import profiled
+from .hangulBlockSplitter import _get_start_offset, _iter_split_pieces, _tr
+
+
+# Each step reads and splits for about this long, then hands the main thread back to NVDA.
+EXPORT_STEP_SECONDS = 0.03
+EXPORT_STEP_DELAY_MS = 10
+EXPORT_PROGRESS_INTERVAL_SECONDS = 5.0
+EXPORT_DEFAULT_FILE_NAME = "hangul-split.txt"
+# The file is written under this suffix and renamed once the whole document has been exported.
+EXPORT_PARTIAL_SUFFIX = ".part"
+
+
+def iter_document_chunks(info) -> Iterator[str]:
+	# Paragraph by paragraph where the document supports it, line by line otherwise;
+	# the whole text is fetched at once only from TextInfos that support neither.
+	for unit in (textInfos.UNIT_PARAGRAPH, textInfos.UNIT_LINE):
+		produced = False
+		try:
+			for chunk in info.getTextInChunks(unit):
+				produced = True
+				yield chunk
+			return
+		except NotImplementedError:
+			if produced:
+				raise
+	yield info.text or ""
+
+
+def get_document_length(container) -> int | None:
+	try:
+		info = container.makeTextInfo(textInfos.POSITION_LAST)
+	except (AttributeError, NotImplementedError, RuntimeError):
+		return None
+	length = _get_start_offset(info)
+	return length if length else None
+
+
+class ClipboardTarget:
+	def __init__(self):
+		self._pieces: list[str] = []
+
+	def write(self, piece: str) -> None:
+		self._pieces.append(piece)
+
+	def commit(self) -> None:
+		if api.copyToClip("".join(self._pieces), notify=False):
+			ui.message(_tr("Split document copied to clipboard.", "분해한 문서를 클립보드에 복사했습니다."))
+		else:
+			ui.message(_tr("Unable to copy split result.", "분해 결과를 복사하지 못했습니다."))
+		self._pieces = []
+
+	def discard(self) -> None:
+		self._pieces = []
+
+
+class FileTarget:
+	def __init__(self, path: str):
+		self.path = path
+		self._partial_path = path + EXPORT_PARTIAL_SUFFIX
+		self._file = open(self._partial_path, "w", encoding="utf-8", newline="")
+
+	def write(self, piece: str) -> None:
+		self._file.write(piece)
+
+	def commit(self) -> None:
+		try:
+			self._file.close()
+			os.replace(self._partial_path, self.path)
+		except OSError:
+			log.error("Unable to save split Hangul document", exc_info=True)
+			self.discard()
+			ui.message(_tr("Unable to save the split document.", "분해한 문서를 저장하지 못했습니다."))
+			return
+		ui.message(
+			_tr(
+				"Saved the split document to {fileName}.",
+				"분해한 문서를 {fileName} 파일에 저장했습니다.",
+			).format(fileName=os.path.basename(self.path)),
+		)
+
+	def discard(self) -> None:
+		self._file.close()
+		try:
+			os.remove(self._partial_path)
+		except OSError:
+			pass
+
+
+class DocumentExport:
+	# Splits a whole document on the main thread, where TextInfos must be used, in short steps
+	# scheduled with wx.CallLater so NVDA keeps handling input and speech between them.
+	# Pieces go to the target as they are split; only a finished export is committed.
+
+	def __init__(
+		self,
+		info,
+		options: SplitOptions,
+		target: ClipboardTarget | FileTarget,
+		total_chars: int | None,
+		on_end: Callable[[], None],
+		clock: Callable[[], float] = time.perf_counter,
+	):
+		self._pieces = _iter_split_pieces(self._count_chars(iter_document_chunks(info)), options)
+		self._target = target
+		self._total_chars = total_chars
+		self._on_end = on_end
+		self._clock = clock
+		self._timer: wx.CallLater | None = None
+		self._next_progress = 0.0
+		self._found_hangul = False
+		self.readChars = 0
+		self.running = False
+
+	def start(self) -> None:
+		self.running = True
+		self._next_progress = self._clock() + EXPORT_PROGRESS_INTERVAL_SECONDS
+		self._schedule()
+
+	def cancel(self) -> None:
+		if not self.running:
+			return
+		self._end()
+		self._target.discard()
+		ui.message(_tr("Export cancelled.", "내보내기를 취소했습니다."))
+
+	def _count_chars(self, chunks: Iterator[str]) -> Iterator[str]:
+		for chunk in chunks:
+			self.readChars += len(chunk)
+			yield chunk
+
+	def _schedule(self) -> None:
+		self._timer = wx.CallLater(EXPORT_STEP_DELAY_MS, self._step)
+
+	def _end(self) -> None:
+		self.running = False
+		if self._timer is not None:
+			self._timer.Stop()
+			self._timer = None
+		self._on_end()
+
+	@profiled
+	def _step(self) -> None:
+		self._timer = None
+		if not self.running:
+			return
+		deadline = self._clock() + EXPORT_STEP_SECONDS
+		try:
+			for piece in self._pieces:
+				if not self._found_hangul:
+					self._found_hangul = contains_hangul(piece)
+				self._target.write(piece)
+				if self._clock() >= deadline:
+					break
+			else:
+				self._finish()
+				return
+		except Exception:
+			log.error("Unable to export split Hangul document", exc_info=True)
+			self._end()
+			self._target.discard()
+			ui.message(_tr("Unable to export the document.", "문서를 내보내지 못했습니다."))
+			return
+		now = self._clock()
+		if now >= self._next_progress:
+			self._next_progress = now + EXPORT_PROGRESS_INTERVAL_SECONDS
+			self._report_progress()
+		self._schedule()
+
+	def _finish(self) -> None:
+		self._end()
+		if not self._found_hangul:
+			self._target.discard()
+			ui.message(_tr("The document does not contain Hangul.", "문서에 한글이 없습니다."))
+			return
+		self._target.commit()
+
+	def _report_progress(self) -> None:
+		if self._total_chars:
+			percent = min(99, self.readChars * 100 // self._total_chars)
+			ui.message(_tr("Exporting, {percent} percent.", "내보내는 중, {percent}%.").format(percent=percent))
+			return
+		ui.message(
+			_tr(
+				"Exporting, {count} characters read.",
+				"내보내는 중, {count}자 읽음.",
+			).format(count=self.readChars),
+		)
+
+
+def choose_export_path(on_chosen: Callable[[str], None]) -> None:
+	dialog = wx.FileDialog(
+		gui.mainFrame,
+		message=_tr("Save split document", "분해한 문서 저장"),
+		defaultFile=EXPORT_DEFAULT_FILE_NAME,
+		wildcard=_tr("Text files (*.txt)|*.txt", "텍스트 파일 (*.txt)|*.txt"),
+		style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
+	)
+
+	def on_result(result: int) -> None:
+		if result == wx.ID_OK:
+			on_chosen(dialog.GetPath())
+
+	gui.runScriptModalDialog(dialog, on_result)
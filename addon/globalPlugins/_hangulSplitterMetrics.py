@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+import math
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+
+STAGE_CONTAINER = "container"
+STAGE_TEXT_INFO = "textInfo"
+STAGE_SANITIZE = "sanitize"
+STAGE_SPLIT = "split"
+STAGE_OUTPUT = "output"
+STAGE_TOTAL = "total"
+
+STAGE_ORDER = (STAGE_CONTAINER, STAGE_TEXT_INFO, STAGE_SANITIZE, STAGE_SPLIT, STAGE_OUTPUT, STAGE_TOTAL)
+
+DEFAULT_HISTORY_SIZE = 256
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class GestureRecord:
+	gesture: str
+	timestamp: float
+	# Seconds spent in each stage, excluding time spent in stages nested inside it.
+	stages: dict[str, float]
+
+
+@dataclass(frozen=True)
+class StageStats:
+	count: int
+	p50: float
+	p90: float
+	p99: float
+	max: float
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+	if not sorted_values:
+		return 0.0
+	# Nearest-rank percentile.
+	rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+	return sorted_values[rank]
+
+
+class GestureTrace:
+	# Stage timings for one gesture. Stages may nest and may be entered many times,
+	# for example once per chunk of a lazily split selection; an inner stage's time
+	# is taken out of the stage around it, so the stages add up to the work done.
+	# Stages nest per thread: work timed on the split worker is never taken out of
+	# a stage the main thread has open at the same time.
+
+	def __init__(self, gesture: str, clock: Callable[[], float]):
+		self.gesture = gesture
+		self.stages: dict[str, float] = {}
+		self._clock = clock
+		self._started = clock()
+		self._timestamp = time.time()
+		self._local = threading.local()
+		self._lock = threading.Lock()
+		# Set once the trace is recorded; a superseded gesture is finished by begin and again by its own code.
+		self.finished = False
+
+	def _open_stages(self) -> list[list[Any]]:
+		open_stages = getattr(self._local, "open", None)
+		if open_stages is None:
+			open_stages = self._local.open = []
+		return open_stages
+
+	@contextmanager
+	def stage(self, name: str) -> Iterator[None]:
+		open_stages = self._open_stages()
+		frame: list[Any] = [name, 0.0]
+		open_stages.append(frame)
+		started = self._clock()
+		try:
+			yield
+		finally:
+			elapsed = self._clock() - started
+			open_stages.pop()
+			with self._lock:
+				self.stages[name] = self.stages.get(name, 0.0) + elapsed - frame[1]
+			if open_stages:
+				open_stages[-1][1] += elapsed
+
+	def iter_stage(self, name: str, iterable: Iterable[_T]) -> Iterator[_T]:
+		# Charges the time spent producing each item to the stage, not the time the consumer holds it.
+		iterator = iter(iterable)
+		while True:
+			with self.stage(name):
+				try:
+					item = next(iterator)
+				except StopIteration:
+					return
+			yield item
+
+	def to_record(self) -> GestureRecord:
+		with self._lock:
+			stages = dict(self.stages)
+		stages[STAGE_TOTAL] = self._clock() - self._started
+		return GestureRecord(gesture=self.gesture, timestamp=self._timestamp, stages=stages)
+
+
+class LatencyRecorder:
+	# Keeps the last `capacity` gestures in a ring buffer.
+	# Only one gesture is active at a time; beginning a new one records the previous one as it stands.
+	# Stages are timed on the trace returned by begin, which callers pass to whatever does the work.
+
+	def __init__(self, capacity: int = DEFAULT_HISTORY_SIZE, clock: Callable[[], float] = time.perf_counter):
+		self._clock = clock
+		self._records: deque[GestureRecord] = deque(maxlen=capacity)
+		self._lock = threading.Lock()
+		self.active: GestureTrace | None = None
+
+	@property
+	def capacity(self) -> int:
+		return self._records.maxlen or 0
+
+	def begin(self, gesture: str) -> GestureTrace:
+		if self.active is not None:
+			self.finish(self.active)
+		trace = GestureTrace(gesture, self._clock)
+		self.active = trace
+		return trace
+
+	def finish(self, trace: GestureTrace) -> None:
+		if self.active is trace:
+			self.active = None
+		with self._lock:
+			if trace.finished:
+				return
+			trace.finished = True
+			self._records.append(trace.to_record())
+
+	def records(self) -> list[GestureRecord]:
+		with self._lock:
+			return list(self._records)
+
+	def clear(self) -> None:
+		with self._lock:
+			self._records.clear()
+
+	def summary(self, gesture: str | None = None) -> dict[str, StageStats]:
+		samples: dict[str, list[float]] = {}
+		for record in self.records():
+			if gesture is not None and record.gesture != gesture:
+				continue
+			for name, seconds in record.stages.items():
+				samples.setdefault(name, []).append(seconds)
+		stats: dict[str, StageStats] = {}
+		for name in sorted(samples, key=_stage_sort_key):
+			values = sorted(samples[name])
+			stats[name] = StageStats(
+				count=len(values),
+				p50=percentile(values, 0.50),
+				p90=percentile(values, 0.90),
+				p99=percentile(values, 0.99),
+				max=values[-1],
+			)
+		return stats
+
+	def format_summary(self, gesture: str | None = None) -> str:
+		stats = self.summary(gesture)
+		if not stats:
+			return ""
+		parts = [
+			f"{name} p50 {_format_ms(item.p50)} p90 {_format_ms(item.p90)} max {_format_ms(item.max)}"
+			for name, item in stats.items()
+		]
+		return "; ".join(parts)
+
+	def dump(self, path: str, counters: dict[str, int] | None = None) -> int:
+		records = self.records()
+		payload = {
+			"capacity": self.capacity,
+			"counters": counters or {},
+			"summary": {
+				name: {
+					"count": item.count,
+					"p50Ms": item.p50 * 1000,
+					"p90Ms": item.p90 * 1000,
+					"p99Ms": item.p99 * 1000,
+					"maxMs": item.max * 1000,
+				}
+				for name, item in self.summary().items()
+			},
+			"gestures": [
+				{
+					"gesture": record.gesture,
+					"timestamp": record.timestamp,
+					"stagesMs": {name: seconds * 1000 for name, seconds in record.stages.items()},
+				}
+				for record in records
+			],
+		}
+		with open(path, "w", encoding="utf-8") as file:
+			json.dump(payload, file, ensure_ascii=False, indent="\t")
+		return len(records)
+
+
+def _stage_sort_key(name: str) -> tuple[int, str]:
+	try:
+		return STAGE_ORDER.index(name), name
+	except ValueError:
+		return len(STAGE_ORDER), name
+
+
+def _format_ms(seconds: float) -> str:
+	return f"{seconds * 1000:.1f} ms"
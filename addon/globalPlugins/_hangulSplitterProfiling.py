@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import functools
+import io
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+	import cProfile
+
+
+PROFILE_DIR_NAME = "hangulBlockSplitter-profiles"
+DEFAULT_SUMMARY_LIMIT = 40
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class ProfileSession:
+	# Profiles only the calls made through `profiled`, not everything NVDA runs while the session is open.
+	# One entry point is profiled at a time: nested calls run inside the outer profile,
+	# and calls from another thread while the profiler is busy run unprofiled and are counted.
+
+	def __init__(self):
+		# Loaded on first use so NVDA startup does not pay for the profiler modules.
+		import cProfile
+
+		self.profile: cProfile.Profile = cProfile.Profile()
+		self.startedAt = time.time()
+		self.calls = 0
+		self.missedCalls = 0
+		self._lock = threading.Lock()
+		self._owner: int | None = None
+
+	def call(self, func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+		if self._owner == threading.get_ident():
+			return func(*args, **kwargs)
+		if not self._lock.acquire(blocking=False):
+			self.missedCalls += 1
+			return func(*args, **kwargs)
+		self._owner = threading.get_ident()
+		self.calls += 1
+		try:
+			self.profile.enable()
+			try:
+				return func(*args, **kwargs)
+			finally:
+				self.profile.disable()
+		finally:
+			self._owner = None
+			self._lock.release()
+
+	def format_summary(self, limit: int = DEFAULT_SUMMARY_LIMIT) -> str:
+		import pstats
+
+		stream = io.StringIO()
+		stream.write(f"Profiled entry calls: {self.calls}, skipped while busy: {self.missedCalls}\n\n")
+		stats = pstats.Stats(self.profile, stream=stream)
+		stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+		stream.write("\n")
+		stats.sort_stats(pstats.SortKey.TIME).print_stats(limit)
+		return stream.getvalue()
+
+	def write(self, directory: str, limit: int = DEFAULT_SUMMARY_LIMIT) -> tuple[str, str]:
+		os.makedirs(directory, exist_ok=True)
+		base_name = time.strftime("hangulBlockSplitter-%Y%m%d-%H%M%S", time.localtime(self.startedAt))
+		profile_path = os.path.join(directory, f"{base_name}.prof")
+		summary_path = os.path.join(directory, f"{base_name}.txt")
+		with self._lock:
+			self.profile.dump_stats(profile_path)
+			summary = self.format_summary(limit)
+		with open(summary_path, "w", encoding="utf-8") as file:
+			file.write(summary)
+		return profile_path, summary_path
+
+
+_session: ProfileSession | None = None
+
+
+def profiled(func: _F) -> _F:
+	@functools.wraps(func)
+	def wrapper(*args: Any, **kwargs: Any) -> Any:
+		session = _session
+		if session is None:
+			return func(*args, **kwargs)
+		return session.call(func, args, kwargs)
+
+	return wrapper  # type: ignore[return-value]
+
+
+def is_profiling() -> bool:
+	return _session is not None
+
+
+def start_profiling() -> ProfileSession:
+	global _session
+	if _session is None:
+		_session = ProfileSession()
+	return _session
+
+
+def stop_profiling() -> ProfileSession | None:
+	global _session
+	session, _session = _session, None
+	return session
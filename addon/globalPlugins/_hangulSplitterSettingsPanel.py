@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from gui import guiHelper
+import wx
+
+from .hangulBlockSplitter import (
+	_DEFAULT_SCOPE_VALUES,
+	KEY_ANNOUNCE_ON_CARET_MOVE,
+	KEY_DECOMPOSITION_PROFILE,
+	KEY_INSERT_SPACES,
+	KEY_JAMO_NAME_STYLE,
+	KEY_LIVE_UPDATE_IN_DIALOG,
+	KEY_SPLIT_COMPLEX,
+	NAME_STYLES,
+	SCOPE_CHARACTER,
+	_get_conf_section,
+	_get_decomposition_profile_label,
+	_get_default_source_scope,
+	_get_default_source_scope_labels,
+	_get_jamo_name_style_labels,
+	_save_default_source_scope,
+	_settings,
+	_tr,
+)
+
+
+class SettingsPanelControls:
+	# Controls of HangulSplitterSettingsPanel. The panel class itself stays registered with NVDA,
+	# while this module is only imported when the settings dialog first shows the panel.
+
+	def __init__(self, panel: wx.Window, settingsSizer: wx.BoxSizer):
+		helper = guiHelper.BoxSizerHelper(panel, sizer=settingsSizer)
+		conf = _get_conf_section()
+		scope_labels = _get_default_source_scope_labels()
+		self._default_scope_values = list(_DEFAULT_SCOPE_VALUES)
+		settings = _settings.snapshot()
+		self._profile_values = list(settings.decompositionProfiles)
+		self._name_style_values = list(NAME_STYLES)
+
+		self._split_complex_checkbox = helper.addItem(
+			wx.CheckBox(
+				panel,
+				label=_tr(
+					"Split complex letters by default (ㅘ -> ㅗㅏ, ㄳ -> ㄱㅅ, ㅄ -> ㅂㅅ)",
+					"겹모음/겹받침을 기본으로 더 잘게 분해하기 (ㅘ -> ㅗㅏ, ㄳ -> ㄱㅅ, ㅄ -> ㅂㅅ)",
+				),
+			),
+		)
+		self._split_complex_checkbox.SetValue(bool(conf[KEY_SPLIT_COMPLEX]))
+
+		self._profile_choice = helper.addLabeledControl(
+			_tr("Complex letters to split:", "분해할 겹글자:"),
+			wx.Choice,
+			choices=[_get_decomposition_profile_label(profile) for profile in self._profile_values],
+		)
+		self._profile_choice.SetSelection(self._profile_values.index(settings.decompositionProfile))
+
+		self._insert_spaces_checkbox = helper.addItem(
+			wx.CheckBox(
+				panel,
+				label=_tr(
+					"Insert spaces between Hangul letters by default",
+					"분해된 한글 글자 사이에 공백을 기본으로 넣기",
+				),
+			),
+		)
+		self._insert_spaces_checkbox.SetValue(bool(conf[KEY_INSERT_SPACES]))
+
+		self._live_update_checkbox = helper.addItem(
+			wx.CheckBox(
+				panel,
+				label=_tr(
+					"Update splitter dialog output while typing",
+					"입력할 때 분해 결과를 실시간으로 갱신하기",
+				),
+			),
+		)
+		self._live_update_checkbox.SetValue(bool(conf[KEY_LIVE_UPDATE_IN_DIALOG]))
+
+		self._announce_on_caret_checkbox = helper.addItem(
+			wx.CheckBox(
+				panel,
+				label=_tr(
+					"Announce split letters when moving the caret by character",
+					"캐럿을 글자 단위로 옮길 때 분해한 자모 읽어주기",
+				),
+			),
+		)
+		self._announce_on_caret_checkbox.SetValue(bool(conf[KEY_ANNOUNCE_ON_CARET_MOVE]))
+
+		self._default_scope_choice = helper.addLabeledControl(
+			_tr(
+				"When no text is selected, split this range:",
+				"텍스트를 선택하지 않았을 때 분해할 범위:",
+			),
+			wx.Choice,
+			choices=[scope_labels[scope] for scope in self._default_scope_values],
+		)
+		current_scope = _get_default_source_scope()
+		try:
+			selected_index = self._default_scope_values.index(current_scope)
+		except ValueError:
+			selected_index = 0
+		self._default_scope_choice.SetSelection(selected_index)
+
+		name_style_labels = _get_jamo_name_style_labels()
+		self._name_style_choice = helper.addLabeledControl(
+			_tr("Speak split letters as:", "분해한 글자 읽는 방식:"),
+			wx.Choice,
+			choices=[name_style_labels[style] for style in self._name_style_values],
+		)
+		self._name_style_choice.SetSelection(self._name_style_values.index(settings.jamoNameStyle))
+
+	def save(self) -> None:
+		conf = _get_conf_section()
+		conf[KEY_SPLIT_COMPLEX] = self._split_complex_checkbox.GetValue()
+		conf[KEY_INSERT_SPACES] = self._insert_spaces_checkbox.GetValue()
+		profile_index = self._profile_choice.GetSelection()
+		if profile_index >= 0:
+			conf[KEY_DECOMPOSITION_PROFILE] = self._profile_values[profile_index]
+		conf[KEY_LIVE_UPDATE_IN_DIALOG] = self._live_update_checkbox.GetValue()
+		conf[KEY_ANNOUNCE_ON_CARET_MOVE] = self._announce_on_caret_checkbox.GetValue()
+		selected_index = self._default_scope_choice.GetSelection()
+		if selected_index < 0:
+			selected_scope = SCOPE_CHARACTER
+		else:
+			selected_scope = self._default_scope_values[selected_index]
+		name_style_index = self._name_style_choice.GetSelection()
+		if name_style_index >= 0:
+			conf[KEY_JAMO_NAME_STYLE] = self._name_style_values[name_style_index]
+		_save_default_source_scope(selected_scope)
+		_settings.invalidate()
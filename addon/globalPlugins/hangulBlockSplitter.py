@@ -1,22 +1,75 @@
 from __future__ import annotations
 
-from typing import Callable
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, replace
+import os
+import time
+from typing import TYPE_CHECKING, Callable
 
 import addonHandler
 import api
 import config
 import globalPluginHandler
+import globalVars
 import gui
-from gui import guiHelper
 import languageHandler
+from logHandler import log
 from scriptHandler import getLastScriptRepeatCount, script
 import speech
+from speech.commands import CallbackCommand, EndUtteranceCommand
 import textInfos
 import treeInterceptorHandler
 import ui
 import wx
 
-from ._hangulSplitterCore import SplitOptions, keep_only_hangul, split_hangul_blocks
+from ._hangulDecompositionProfiles import (
+	BUILTIN_PROFILES,
+	PROFILE_COMPLEX_VOWELS,
+	PROFILE_CONSONANTS,
+	PROFILE_DOUBLE_CONSONANTS,
+	PROFILE_FULL,
+	PROFILES_FILE_NAME,
+	load_profiles,
+)
+from ._hangulJamoNames import (
+	NAME_STYLE_DESCRIPTION,
+	NAME_STYLE_FULL,
+	NAME_STYLE_SHORT,
+	NAME_STYLES,
+	jamo_names,
+	jamo_speech_sequence,
+)
+from ._hangulSplitterCore import (
+	S_BASE,
+	S_END,
+	DecompositionRules,
+	SplitOptions,
+	compile_syllable_table,
+	contains_hangul,
+	iter_hangul_runs,
+	iter_split_hangul_blocks,
+)
+from ._hangulSplitterMetrics import (
+	STAGE_CONTAINER,
+	STAGE_OUTPUT,
+	STAGE_SANITIZE,
+	STAGE_SPLIT,
+	STAGE_TEXT_INFO,
+	GestureTrace,
+	LatencyRecorder,
+)
+from ._hangulSplitterProfiling import (
+	PROFILE_DIR_NAME,
+	is_profiling,
+	profiled,
+	start_profiling,
+	stop_profiling,
+)
+from ._hangulSplitWorker import SplitWorker
+
+if TYPE_CHECKING:
+	from ._hangulSplitterDialog import HangulSplitterDialog
+	from ._hangulSplitterExport import DocumentExport
 
 addonHandler.initTranslation()
 
@@ -26,6 +79,9 @@ KEY_SPLIT_COMPLEX = "splitComplexLetters"
 KEY_INSERT_SPACES = "insertSpacesBetweenLetters"
 KEY_LIVE_UPDATE_IN_DIALOG = "liveUpdateInDialog"
 KEY_DEFAULT_SOURCE_SCOPE = "defaultSourceScope"
+KEY_ANNOUNCE_ON_CARET_MOVE = "announceSplitOnCaretMove"
+KEY_DECOMPOSITION_PROFILE = "decompositionProfile"
+KEY_JAMO_NAME_STYLE = "jamoNameStyle"
 
 SCOPE_CHARACTER = "character"
 SCOPE_WORD = "word"
@@ -39,8 +95,93 @@ CONF_SPEC = {
 	KEY_INSERT_SPACES: "boolean(default=False)",
 	KEY_LIVE_UPDATE_IN_DIALOG: "boolean(default=True)",
 	KEY_DEFAULT_SOURCE_SCOPE: "string(default=\"character\")",
+	KEY_ANNOUNCE_ON_CARET_MOVE: "boolean(default=False)",
+	KEY_DECOMPOSITION_PROFILE: f"string(default=\"{PROFILE_FULL}\")",
+	KEY_JAMO_NAME_STYLE: f"string(default=\"{NAME_STYLE_FULL}\")",
 }
 
+# Caret events closer together than this are treated as key repeat and only the last one is handled.
+_CARET_REPEAT_INTERVAL_MS = 80
+# Short delay so NVDA's own character announcement is queued before the split letters.
+_CARET_ANNOUNCE_DELAY_MS = 20
+
+# Source text is reused for this long at most, for applications that change text without events.
+_SOURCE_CACHE_TTL_SECONDS = 3.0
+# Longer selections are read again on every press rather than kept in memory.
+_SOURCE_CACHE_MAX_CHARS = 1_000_000
+# Speech sequences of this many recent split results are kept for pressing the describe gesture again.
+_JAMO_SPEECH_CACHE_ENTRIES = 8
+# Longer split results are spoken without keeping their sequence.
+_JAMO_SPEECH_CACHE_MAX_CHARS = 20_000
+
+LATENCY_LOG_FILE_NAME = "hangulBlockSplitter-latency.json"
+
+_latency = LatencyRecorder()
+
+
+@dataclass(frozen=True)
+class _SettingsSnapshot:
+	splitOptions: SplitOptions
+	liveUpdateInDialog: bool
+	defaultSourceScope: str
+	announceOnCaretMove: bool
+	decompositionProfile: str
+	# Names of the built-in profiles followed by those in the profiles file.
+	decompositionProfiles: tuple[str, ...]
+	jamoNameStyle: str
+
+
+class _SettingsCache:
+	# Settings and translated strings are read on every gesture. Both are kept here and
+	# rebuilt only after the configuration or the language may have changed.
+	# The profiles file is edited by hand, so its modification time and size are checked on every read.
+
+	def __init__(self):
+		self._snapshot: _SettingsSnapshot | None = None
+		self._profiles_stamp: tuple[int, int] | None = None
+		self._is_korean: bool | None = None
+		self._strings: dict[tuple[str, str], str] = {}
+		self.snapshotRebuilds = 0
+		self.stringTableRebuilds = 0
+
+	def invalidate(self) -> None:
+		self._snapshot = None
+
+	def invalidate_language(self) -> None:
+		self._is_korean = None
+		self._strings = {}
+
+	def snapshot(self) -> _SettingsSnapshot:
+		snapshot = self._snapshot
+		profiles_stamp = _get_profiles_file_stamp()
+		if snapshot is None or profiles_stamp != self._profiles_stamp:
+			snapshot = self._snapshot = _build_settings_snapshot()
+			self._profiles_stamp = profiles_stamp
+			self.snapshotRebuilds += 1
+		return snapshot
+
+	def is_korean(self) -> bool:
+		if self._is_korean is None:
+			self._is_korean = _is_korean_locale()
+			self.stringTableRebuilds += 1
+		return self._is_korean
+
+	def translate(self, english: str, korean: str) -> str:
+		key = (english, korean)
+		text = self._strings.get(key)
+		if text is None:
+			text = self._strings[key] = korean if self.is_korean() else _(english)
+		return text
+
+	def counters(self) -> dict[str, int]:
+		return {
+			"settingsSnapshotRebuilds": self.snapshotRebuilds,
+			"stringTableRebuilds": self.stringTableRebuilds,
+		}
+
+
+_settings = _SettingsCache()
+
 
 def _is_korean_locale() -> bool:
 	lang = languageHandler.getLanguage() or ""
@@ -48,7 +189,7 @@ def _is_korean_locale() -> bool:
 
 
 def _tr(english: str, korean: str) -> str:
-	return korean if _is_korean_locale() else _(english)
+	return _settings.translate(english, korean)
 
 
 def _ensure_config_spec() -> None:
@@ -65,28 +206,118 @@ def _get_conf_section():
 	return config.conf[CONF_SECTION]
 
 
-def _get_split_options() -> SplitOptions:
+def _get_profiles_file_path() -> str:
+	return os.path.join(globalVars.appArgs.configPath, PROFILES_FILE_NAME)
+
+
+def _get_profiles_file_stamp() -> tuple[int, int] | None:
+	try:
+		stat = os.stat(_get_profiles_file_path())
+	except OSError:
+		return None
+	return stat.st_mtime_ns, stat.st_size
+
+
+def _load_decomposition_profiles() -> dict[str, DecompositionRules]:
+	path = _get_profiles_file_path()
+	try:
+		return load_profiles(path)
+	except (OSError, ValueError):
+		log.error(f"Unable to load Hangul decomposition profiles from {path}", exc_info=True)
+		return dict(BUILTIN_PROFILES)
+
+
+def _build_settings_snapshot() -> _SettingsSnapshot:
 	conf = _get_conf_section()
-	return SplitOptions(
-		splitComplexLetters=bool(conf[KEY_SPLIT_COMPLEX]),
-		insertSpacesBetweenLetters=bool(conf[KEY_INSERT_SPACES]),
+	profiles = _load_decomposition_profiles()
+	profile = str(conf[KEY_DECOMPOSITION_PROFILE])
+	if profile not in profiles:
+		profile = PROFILE_FULL
+	name_style = str(conf[KEY_JAMO_NAME_STYLE])
+	if name_style not in NAME_STYLES:
+		name_style = NAME_STYLE_FULL
+	return _SettingsSnapshot(
+		splitOptions=SplitOptions(
+			splitComplexLetters=bool(conf[KEY_SPLIT_COMPLEX]),
+			insertSpacesBetweenLetters=bool(conf[KEY_INSERT_SPACES]),
+			decompositionRules=profiles[profile],
+		),
+		liveUpdateInDialog=bool(conf[KEY_LIVE_UPDATE_IN_DIALOG]),
+		defaultSourceScope=_normalize_source_scope(conf[KEY_DEFAULT_SOURCE_SCOPE]),
+		announceOnCaretMove=bool(conf[KEY_ANNOUNCE_ON_CARET_MOVE]),
+		decompositionProfile=profile,
+		decompositionProfiles=tuple(profiles),
+		jamoNameStyle=name_style,
 	)
 
 
+def _on_config_changed(*args, **kwargs) -> None:
+	_settings.invalidate()
+
+
+def _on_config_saved(*args, **kwargs) -> None:
+	# Saving the general settings is also when NVDA applies a new interface language.
+	_settings.invalidate()
+	_settings.invalidate_language()
+
+
+def _get_split_options() -> SplitOptions:
+	return _settings.snapshot().splitOptions
+
+
 def _save_split_options(options: SplitOptions) -> None:
 	conf = _get_conf_section()
 	conf[KEY_SPLIT_COMPLEX] = bool(options.splitComplexLetters)
 	conf[KEY_INSERT_SPACES] = bool(options.insertSpacesBetweenLetters)
+	_settings.invalidate()
 
 
 def _get_live_update_setting() -> bool:
-	conf = _get_conf_section()
-	return bool(conf[KEY_LIVE_UPDATE_IN_DIALOG])
+	return _settings.snapshot().liveUpdateInDialog
 
 
 def _save_live_update_setting(enabled: bool) -> None:
 	conf = _get_conf_section()
 	conf[KEY_LIVE_UPDATE_IN_DIALOG] = bool(enabled)
+	_settings.invalidate()
+
+
+def _get_announce_on_caret_setting() -> bool:
+	return _settings.snapshot().announceOnCaretMove
+
+
+def _save_announce_on_caret_setting(enabled: bool) -> None:
+	conf = _get_conf_section()
+	conf[KEY_ANNOUNCE_ON_CARET_MOVE] = bool(enabled)
+	_settings.invalidate()
+
+
+def _get_decomposition_profile() -> str:
+	return _settings.snapshot().decompositionProfile
+
+
+def _save_decomposition_profile(profile: str) -> None:
+	conf = _get_conf_section()
+	conf[KEY_DECOMPOSITION_PROFILE] = profile
+	_settings.invalidate()
+
+
+def _get_decomposition_profile_label(profile: str) -> str:
+	labels = {
+		PROFILE_FULL: _tr("All complex letters", "모든 겹글자"),
+		PROFILE_DOUBLE_CONSONANTS: _tr("Double consonants only", "쌍자음만"),
+		PROFILE_CONSONANTS: _tr("Consonants, keeping complex vowels", "자음만 (겹모음 유지)"),
+		PROFILE_COMPLEX_VOWELS: _tr("Complex vowels only", "겹모음만"),
+	}
+	return labels.get(profile, profile)
+
+
+def _get_jamo_name_style_labels() -> dict[str, str]:
+	return {
+		NAME_STYLE_FULL: _tr("Letter names (giyeok, nieun, a)", "글자 이름 (기역, 니은, 아)"),
+		NAME_STYLE_SHORT: _tr("Short letter sounds (g, n, a)", "짧은 소리 (그, 느, 아)"),
+		NAME_STYLE_DESCRIPTION: _tr("NVDA character descriptions", "NVDA 문자 설명"),
+	}
 
 
 def _normalize_source_scope(scope: str) -> str:
@@ -97,13 +328,13 @@ def _normalize_source_scope(scope: str) -> str:
 
 
 def _get_default_source_scope() -> str:
-	conf = _get_conf_section()
-	return _normalize_source_scope(conf[KEY_DEFAULT_SOURCE_SCOPE])
+	return _settings.snapshot().defaultSourceScope
 
 
 def _save_default_source_scope(scope: str) -> None:
 	conf = _get_conf_section()
 	conf[KEY_DEFAULT_SOURCE_SCOPE] = _normalize_source_scope(scope)
+	_settings.invalidate()
 
 
 def _get_default_source_scope_labels() -> dict[str, str]:
@@ -119,47 +350,82 @@ def _scope_name_for_message(scope: str) -> str:
 	return labels.get(_normalize_source_scope(scope), labels[SCOPE_CHARACTER])
 
 
-def _get_text_container():
+def _get_text_container(trace: GestureTrace | None = None):
+	if trace is not None:
+		with trace.stage(STAGE_CONTAINER):
+			return _get_text_container()
 	obj = api.getFocusObject()
 	tree_interceptor = getattr(obj, "treeInterceptor", None)
-	if isinstance(tree_interceptor, treeInterceptorHandler.DocumentTreeInterceptor) and not tree_interceptor.passThrough:
+	if (
+		isinstance(tree_interceptor, treeInterceptorHandler.DocumentTreeInterceptor)
+		and not tree_interceptor.passThrough
+	):
 		return tree_interceptor
 	return obj
 
 
-def _get_caret_text_info():
-	obj = _get_text_container()
+def _get_caret_text_info(obj=None):
+	if obj is None:
+		obj = _get_text_container()
 	try:
 		return obj.makeTextInfo(textInfos.POSITION_CARET)
 	except (AttributeError, NotImplementedError, RuntimeError):
 		return None
 
 
-def _get_selection_text() -> str:
-	obj = _get_text_container()
+def _get_selection_or_caret_info(obj):
+	# A collapsed selection sits at the caret, so its bookmark also identifies the caret position.
 	try:
-		info = obj.makeTextInfo(textInfos.POSITION_SELECTION)
+		return obj.makeTextInfo(textInfos.POSITION_SELECTION)
 	except (AttributeError, NotImplementedError, RuntimeError):
-		return ""
+		return None
+
+
+def _get_selection_info():
+	info = _get_selection_or_caret_info(_get_text_container())
 	if getattr(info, "isCollapsed", True):
-		return ""
-	return info.text or ""
+		return None
+	return info
+
+
+def _iter_text_chunks(info) -> Iterator[str]:
+	# Reads a range line by line so very large selections are never fetched as one string.
+	produced = False
+	try:
+		for chunk in info.getTextInChunks(textInfos.UNIT_LINE):
+			produced = True
+			yield chunk
+	except (AttributeError, NotImplementedError, RuntimeError):
+		if not produced:
+			yield info.text or ""
+
+
+def _get_start_offset(info) -> int | None:
+	# Offset-based TextInfos expose their start through the bookmark; others return None.
+	offset = getattr(getattr(info, "bookmark", None), "startOffset", None)
+	return offset if isinstance(offset, int) else None
 
 
-def _get_current_line_text() -> str:
-	info = _get_caret_text_info()
+def _get_current_line(info=None) -> tuple[str, int | None]:
 	if info is None:
-		return ""
+		info = _get_caret_text_info()
+	if info is None:
+		return "", None
 	try:
 		line_info = info.copy()
 		line_info.expand(textInfos.UNIT_LINE)
-		return line_info.text or ""
+		return line_info.text or "", _get_start_offset(line_info)
 	except (AttributeError, RuntimeError):
-		return ""
+		return "", None
 
 
-def _get_current_word_text() -> str:
-	info = _get_caret_text_info()
+def _get_current_line_text(info=None) -> str:
+	return _get_current_line(info)[0]
+
+
+def _get_current_word_text(info=None) -> str:
+	if info is None:
+		info = _get_caret_text_info()
 	if info is None:
 		return ""
 	try:
@@ -170,6 +436,15 @@ def _get_current_word_text() -> str:
 		return ""
 
 
+def _get_character_at(info) -> str:
+	try:
+		char_info = info.copy()
+		char_info.expand(textInfos.UNIT_CHARACTER)
+		return char_info.text or ""
+	except (AttributeError, RuntimeError):
+		return ""
+
+
 def _extract_character_from_info(info) -> str:
 	try:
 		char_info = info.copy()
@@ -187,8 +462,9 @@ def _extract_character_from_info(info) -> str:
 	return ""
 
 
-def _get_character_under_cursor() -> str:
-	caret_info = _get_caret_text_info()
+def _get_character_under_cursor(caret_info=None) -> str:
+	if caret_info is None:
+		caret_info = _get_caret_text_info()
 	if caret_info is not None:
 		text = _extract_character_from_info(caret_info)
 		if text:
@@ -201,309 +477,225 @@ def _get_character_under_cursor() -> str:
 		return ""
 
 
-def _get_text_from_scope(scope: str) -> tuple[str, str]:
+def _get_text_from_scope(scope: str, obj=None) -> tuple[str, str]:
 	normalized_scope = _normalize_source_scope(scope)
+	info = _get_caret_text_info(obj)
 	if normalized_scope == SCOPE_LINE:
-		return _get_current_line_text(), SCOPE_LINE
+		return _get_current_line_text(info), SCOPE_LINE
 	if normalized_scope == SCOPE_WORD:
-		return _get_current_word_text(), SCOPE_WORD
-	return _get_character_under_cursor(), SCOPE_CHARACTER
-
-
-def _has_hangul_content(text: str) -> bool:
-	return any(not char.isspace() for char in keep_only_hangul(text, include_whitespace=False))
+		return _get_current_word_text(info), SCOPE_WORD
+	return _get_character_under_cursor(info), SCOPE_CHARACTER
 
 
 def _sanitize_for_split(text: str) -> str:
-	return keep_only_hangul(text, include_whitespace=True)
-
-
-def _get_split_source_text(scope: str | None = None) -> tuple[str, str]:
-	selection_text = _get_selection_text()
-	if selection_text:
-		return selection_text, SCOPE_SELECTION
-	return _get_text_from_scope(scope or _get_default_source_scope())
+	return "".join(text[start:end] for start, end, _kind in iter_hangul_runs(text))
 
 
-def _get_dialog_seed_text() -> str:
-	source_text, _source_kind = _get_split_source_text()
-	sanitized_text = _sanitize_for_split(source_text)
-	if _has_hangul_content(sanitized_text):
-		return sanitized_text
-	return ""
-
-
-class HangulSplitterSettingsPanel(gui.settingsDialogs.SettingsPanel):
-	title = _tr("Hangul Block Splitter", "한글 블록 분해기")
+def _prepare_split_source(text: str) -> str:
+	# Text without Hangul stops at the early-exit search and is never copied.
+	if not contains_hangul(text):
+		return ""
+	return _sanitize_for_split(text)
+
+
+def _iter_split_pieces(
+	chunks: Iterable[str],
+	options: SplitOptions,
+	trace: GestureTrace | None = None,
+) -> Iterator[str]:
+	sanitized = (_sanitize_for_split(chunk) for chunk in chunks)
+	if trace is None:
+		return iter_split_hangul_blocks(sanitized, options)
+	return trace.iter_stage(
+		STAGE_SPLIT,
+		iter_split_hangul_blocks(trace.iter_stage(STAGE_SANITIZE, sanitized), options),
+	)
 
-	def makeSettings(self, settingsSizer: wx.BoxSizer) -> None:
-		helper = guiHelper.BoxSizerHelper(self, sizer=settingsSizer)
-		conf = _get_conf_section()
-		scope_labels = _get_default_source_scope_labels()
-		self._default_scope_values = list(_DEFAULT_SCOPE_VALUES)
-
-		self._split_complex_checkbox = helper.addItem(
-			wx.CheckBox(
-				self,
-				label=_tr(
-					"Split complex letters by default (ㅘ -> ㅗㅏ, ㄳ -> ㄱㅅ, ㅄ -> ㅂㅅ)",
-					"겹모음/겹받침을 기본으로 더 잘게 분해하기 (ㅘ -> ㅗㅏ, ㄳ -> ㄱㅅ, ㅄ -> ㅂㅅ)",
-				),
-			),
-		)
-		self._split_complex_checkbox.SetValue(bool(conf[KEY_SPLIT_COMPLEX]))
-
-		self._insert_spaces_checkbox = helper.addItem(
-			wx.CheckBox(
-				self,
-				label=_tr(
-					"Insert spaces between Hangul letters by default",
-					"분해된 한글 글자 사이에 공백을 기본으로 넣기",
-				),
-			),
-		)
-		self._insert_spaces_checkbox.SetValue(bool(conf[KEY_INSERT_SPACES]))
-
-		self._live_update_checkbox = helper.addItem(
-			wx.CheckBox(
-				self,
-				label=_tr(
-					"Update splitter dialog output while typing",
-					"입력할 때 분해 결과를 실시간으로 갱신하기",
-				),
-			),
-		)
-		self._live_update_checkbox.SetValue(bool(conf[KEY_LIVE_UPDATE_IN_DIALOG]))
 
-		self._default_scope_choice = helper.addLabeledControl(
-			_tr(
-				"When no text is selected, split this range:",
-				"텍스트를 선택하지 않았을 때 분해할 범위:",
-			),
-			wx.Choice,
-			choices=[scope_labels[scope] for scope in self._default_scope_values],
-		)
-		current_scope = _get_default_source_scope()
-		try:
-			selected_index = self._default_scope_values.index(current_scope)
-		except ValueError:
-			selected_index = 0
-		self._default_scope_choice.SetSelection(selected_index)
+def _join_split_pieces(pieces: Iterable[str]) -> str:
+	result = "".join(pieces)
+	return result if contains_hangul(result) else ""
 
-	def onSave(self) -> None:
-		conf = _get_conf_section()
-		conf[KEY_SPLIT_COMPLEX] = self._split_complex_checkbox.GetValue()
-		conf[KEY_INSERT_SPACES] = self._insert_spaces_checkbox.GetValue()
-		conf[KEY_LIVE_UPDATE_IN_DIALOG] = self._live_update_checkbox.GetValue()
-		selected_index = self._default_scope_choice.GetSelection()
-		if selected_index < 0:
-			selected_scope = SCOPE_CHARACTER
-		else:
-			selected_scope = self._default_scope_values[selected_index]
-		_save_default_source_scope(selected_scope)
 
+class _SourceTextCache:
+	# Source text read by the latest gesture, reused by the next press while the focus object,
+	# the selection or caret bookmark and the scope are unchanged.
+	# Caret, focus and text change events clear it.
 
-class HangulSplitterDialog(wx.Dialog):
 	def __init__(
 		self,
-		parent: wx.Window | None,
-		initial_text: str,
-		on_close: Callable[[], None],
+		ttl: float = _SOURCE_CACHE_TTL_SECONDS,
+		max_chars: int = _SOURCE_CACHE_MAX_CHARS,
+		clock: Callable[[], float] = time.monotonic,
 	):
-		super().__init__(parent=parent, title=_tr("Hangul Block Splitter", "한글 블록 분해기"))
-		self._on_close = on_close
-		self._closed = False
-		self._normalizing_input = False
-		self._build_ui(initial_text)
-		self.Bind(wx.EVT_CLOSE, self._on_close_event)
-
-	def _build_ui(self, initial_text: str) -> None:
-		main_sizer = wx.BoxSizer(wx.VERTICAL)
-
-		input_label = wx.StaticText(self, label=_tr("Input text", "입력 텍스트"))
-		self._input_edit = wx.TextCtrl(self, style=wx.TE_MULTILINE)
-		self._input_edit.SetValue(initial_text)
-
-		options_sizer = wx.StaticBoxSizer(wx.VERTICAL, self, _tr("Options", "옵션"))
-		self._split_complex_checkbox = wx.CheckBox(
-			self,
-			label=_tr(
-				"Split complex letters (ㅘ -> ㅗㅏ, ㄳ -> ㄱㅅ, ㅄ -> ㅂㅅ)",
-				"겹모음/겹받침 분해하기 (ㅘ -> ㅗㅏ, ㄳ -> ㄱㅅ, ㅄ -> ㅂㅅ)",
-			),
-		)
-		self._insert_spaces_checkbox = wx.CheckBox(
-			self,
-			label=_tr("Insert spaces between letters", "글자 사이에 공백 넣기"),
-		)
-		self._live_update_checkbox = wx.CheckBox(
-			self,
-			label=_tr("Update output as you type", "입력할 때 결과 바로 갱신"),
-		)
-		conf = _get_conf_section()
-		self._split_complex_checkbox.SetValue(bool(conf[KEY_SPLIT_COMPLEX]))
-		self._insert_spaces_checkbox.SetValue(bool(conf[KEY_INSERT_SPACES]))
-		self._live_update_checkbox.SetValue(bool(conf[KEY_LIVE_UPDATE_IN_DIALOG]))
-		options_sizer.Add(self._split_complex_checkbox, border=2, flag=wx.BOTTOM)
-		options_sizer.Add(self._insert_spaces_checkbox, border=2, flag=wx.BOTTOM)
-		options_sizer.Add(self._live_update_checkbox)
-
-		output_label = wx.StaticText(
-			self,
-			label=_tr("Output text (read-only)", "결과 텍스트(읽기 전용)"),
-		)
-		self._output_edit = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY)
-
-		button_row = wx.BoxSizer(wx.HORIZONTAL)
-		self._split_button = wx.Button(self, label=_tr("&Split", "&분해"))
-		self._copy_button = wx.Button(self, label=_tr("&Copy output", "결과 &복사"))
-		self._clear_button = wx.Button(self, label=_tr("C&lear", "&지우기"))
-		close_button = wx.Button(self, wx.ID_CANCEL, _tr("&Close", "&닫기"))
-		button_row.Add(self._split_button, border=5, flag=wx.RIGHT)
-		button_row.Add(self._copy_button, border=5, flag=wx.RIGHT)
-		button_row.Add(self._clear_button, border=5, flag=wx.RIGHT)
-		button_row.Add(close_button)
-
-		self._status_label = wx.StaticText(self, label=_tr("Ready.", "준비됨."))
-
-		main_sizer.Add(input_label, border=6, flag=wx.LEFT | wx.TOP)
-		main_sizer.Add(self._input_edit, proportion=1, border=6, flag=wx.EXPAND | wx.LEFT | wx.RIGHT)
-		main_sizer.Add(options_sizer, border=6, flag=wx.EXPAND | wx.ALL)
-		main_sizer.Add(output_label, border=6, flag=wx.LEFT)
-		main_sizer.Add(
-			self._output_edit,
-			proportion=1,
-			border=6,
-			flag=wx.EXPAND | wx.LEFT | wx.RIGHT,
-		)
-		main_sizer.Add(button_row, border=6, flag=wx.LEFT | wx.RIGHT | wx.TOP)
-		main_sizer.Add(self._status_label, border=6, flag=wx.LEFT | wx.RIGHT | wx.BOTTOM)
-
-		self.SetSizer(main_sizer)
-		self.SetMinSize((640, 460))
-		self.SetSize((760, 560))
-
-		self._split_button.Bind(wx.EVT_BUTTON, self._on_split)
-		self._copy_button.Bind(wx.EVT_BUTTON, self._on_copy_output)
-		self._clear_button.Bind(wx.EVT_BUTTON, self._on_clear)
-		close_button.Bind(wx.EVT_BUTTON, lambda evt: self.Close())
-		self.Bind(wx.EVT_CHAR_HOOK, self._on_char_hook)
-		self._input_edit.Bind(wx.EVT_TEXT, self._on_input_text_change)
-		self._split_complex_checkbox.Bind(wx.EVT_CHECKBOX, self._on_live_update_change)
-		self._insert_spaces_checkbox.Bind(wx.EVT_CHECKBOX, self._on_live_update_change)
-		self._live_update_checkbox.Bind(wx.EVT_CHECKBOX, self._on_live_update_toggle)
-		self.SetEscapeId(wx.ID_CANCEL)
-
-		self._enforce_hangul_input()
-		self._update_output(announce=False)
-		wx.CallAfter(self._input_edit.SetFocus)
-
-	def _current_options(self) -> SplitOptions:
-		return SplitOptions(
-			splitComplexLetters=self._split_complex_checkbox.GetValue(),
-			insertSpacesBetweenLetters=self._insert_spaces_checkbox.GetValue(),
-		)
-
-	def _save_preferences(self) -> None:
-		_save_split_options(self._current_options())
-		_save_live_update_setting(self._live_update_checkbox.GetValue())
-
-	def get_input_text(self) -> str:
-		return self._input_edit.GetValue()
-
-	def set_input_text(self, text: str) -> None:
-		self._input_edit.SetValue(_sanitize_for_split(text))
-		self._update_output(announce=False)
-
-	def _enforce_hangul_input(self) -> bool:
-		current_text = self._input_edit.GetValue()
-		filtered_text = _sanitize_for_split(current_text)
-		if filtered_text == current_text:
-			return False
-		cursor_pos = self._input_edit.GetInsertionPoint()
-		self._normalizing_input = True
-		self._input_edit.ChangeValue(filtered_text)
-		self._input_edit.SetInsertionPoint(min(cursor_pos, len(filtered_text)))
-		self._normalizing_input = False
-		return True
+		self._ttl = ttl
+		self._clock = clock
+		self._max_chars = max_chars
+		self._generation = 0
+		self._key: tuple | None = None
+		self._chunks: tuple[str, ...] = ()
+		self._source_kind = ""
+		self._stored_at = 0.0
+		self.hits = 0
+		self.misses = 0
+
+	def clear(self) -> None:
+		self._generation += 1
+		self._key = None
+		self._chunks = ()
+
+	def lookup(self, key: tuple | None) -> tuple[tuple[str, ...], str] | None:
+		if key is None or key != self._key or self._clock() - self._stored_at > self._ttl:
+			self.misses += 1
+			return None
+		self.hits += 1
+		return self._chunks, self._source_kind
+
+	def store(self, key: tuple | None, chunks: Iterable[str], source_kind: str) -> None:
+		if key is None:
+			return
+		self._key = key
+		self._chunks = tuple(chunks)
+		self._source_kind = source_kind
+		self._stored_at = self._clock()
+
+	def record(self, key: tuple | None, chunks: Iterable[str], source_kind: str) -> Iterator[str]:
+		# Passes chunks through and keeps them once the whole range has been read,
+		# unless an event cleared the cache meanwhile or the range is too long to keep.
+		generation = self._generation
+		recorded: list[str] | None = [] if key is not None else None
+		size = 0
+		for chunk in chunks:
+			if recorded is not None:
+				size += len(chunk)
+				if size > self._max_chars:
+					recorded = None
+				else:
+					recorded.append(chunk)
+			yield chunk
+		if recorded is not None and generation == self._generation:
+			self.store(key, recorded, source_kind)
+
+
+class _LineSplitCache:
+	# Holds the split letters of every character on one line, keyed by text container and line start,
+	# so caret moves within that line are answered without fetching or splitting text again.
+	# Text can change without a text change event, so entries expire like source text and a hit
+	# must still have the same character under the caret.
+
+	def __init__(self, ttl: float = _SOURCE_CACHE_TTL_SECONDS, clock: Callable[[], float] = time.monotonic):
+		self._ttl = ttl
+		self._clock = clock
+		self._container_id: int | None = None
+		self._rules: DecompositionRules = ()
+		self._line_start = 0
+		self._line_text = ""
+		self._splits: list[str] = []
+		self._stored_at = 0.0
+
+	def clear(self) -> None:
+		self._container_id = None
+		self._line_text = ""
+		self._splits = []
+
+	def lookup(self, container, offset: int, char: str, rules: DecompositionRules) -> str | None:
+		if self._container_id != id(container) or self._rules != rules:
+			return None
+		if self._clock() - self._stored_at > self._ttl:
+			self.clear()
+			return None
+		index = offset - self._line_start
+		if not 0 <= index < len(self._splits) or self._line_text[index] != char:
+			return None
+		return self._splits[index]
+
+	def store(self, container, line_start: int, line_text: str, rules: DecompositionRules) -> None:
+		table = compile_syllable_table(rules)
+		self._container_id = id(container)
+		self._rules = rules
+		self._line_start = line_start
+		self._line_text = line_text
+		self._splits = [table[ord(char) - S_BASE] if S_BASE <= ord(char) <= S_END else "" for char in line_text]
+		self._stored_at = self._clock()
+
+
+class _JamoSpeechCache:
+	# Speech sequences of recent split results. Letters are spoken from a precomputed name table,
+	# so a whole sequence is built in one pass instead of NVDA describing each letter in turn.
+
+	def __init__(self, max_entries: int = _JAMO_SPEECH_CACHE_ENTRIES, max_chars: int = _JAMO_SPEECH_CACHE_MAX_CHARS):
+		self._max_entries = max_entries
+		self._max_chars = max_chars
+		self._sequences: dict[tuple[str, str, bool], tuple] = {}
+
+	def clear(self) -> None:
+		self._sequences.clear()
+
+	def sequence(self, text: str, style: str, korean: bool) -> tuple:
+		key = (text, style, korean)
+		sequence = self._sequences.get(key)
+		if sequence is None:
+			names = jamo_names(style, korean)
+			if names is None:
+				sequence = tuple(speech.getSpellingSpeech(text, useCharacterDescriptions=True))
+			else:
+				sequence = tuple(jamo_speech_sequence(text, names, _spell_with_descriptions, EndUtteranceCommand))
+			if len(text) > self._max_chars:
+				return sequence
+			if len(self._sequences) >= self._max_entries:
+				del self._sequences[next(iter(self._sequences))]
+			self._sequences[key] = sequence
+		return sequence
+
+
+def _spell_with_descriptions(text: str) -> list:
+	return list(speech.getSpellingSpeech(text, useCharacterDescriptions=True))
+
+
+_jamo_speech = _JamoSpeechCache()
+
+
+class _ChunkedSplitSpeaker:
+	# Speaks split pieces one at a time. When a piece starts speaking, the next piece is
+	# fetched, split and queued, so only one piece is ever waiting in the speech queue.
+	# Starting a new run or cancelling drops the rest of the previous one.
 
-	def _set_status(self, text: str) -> None:
-		self._status_label.SetLabel(text)
+	def __init__(self):
+		self._generation = 0
 
-	def _update_output(self, announce: bool) -> None:
-		output = split_hangul_blocks(self._input_edit.GetValue(), self._current_options())
-		self._output_edit.ChangeValue(output)
-		if announce:
-			self._set_status(_tr("Output updated.", "결과를 갱신했습니다."))
+	def cancel(self) -> None:
+		self._generation += 1
 
-	def _on_split(self, evt: wx.CommandEvent) -> None:
-		self._update_output(announce=True)
+	def start(self, pieces: Iterator[str], on_empty: Callable[[], None]) -> None:
+		self._generation += 1
+		self._queue_next(self._generation, pieces, on_empty)
 
-	def _on_copy_output(self, evt: wx.CommandEvent) -> None:
-		text = self._output_edit.GetValue()
-		if not text:
-			self._set_status(_tr("Nothing to copy.", "복사할 내용이 없습니다."))
-			ui.message(_tr("Nothing to copy.", "복사할 내용이 없습니다."))
+	@profiled
+	def _queue_next(self, generation: int, pieces: Iterator[str], on_empty: Callable[[], None] | None) -> None:
+		if generation != self._generation:
 			return
-		if api.copyToClip(text, notify=True):
-			self._set_status(_tr("Output copied to clipboard.", "결과를 클립보드에 복사했습니다."))
-		else:
-			self._set_status(_tr("Unable to copy output.", "결과를 복사하지 못했습니다."))
-
-	def _on_clear(self, evt: wx.CommandEvent) -> None:
-		self._input_edit.Clear()
-		self._output_edit.Clear()
-		self._input_edit.SetFocus()
-		self._set_status(_tr("Cleared.", "입력과 결과를 지웠습니다."))
-
-	def _on_live_update_toggle(self, evt: wx.CommandEvent) -> None:
-		if self._live_update_checkbox.GetValue():
-			self._update_output(announce=False)
-			self._set_status(_tr("Live update is on.", "실시간 갱신이 켜졌습니다."))
-		else:
-			self._set_status(
-				_tr(
-					"Live update is off. Press Split to refresh output.",
-					"실시간 갱신이 꺼졌습니다. 분해 버튼을 눌러 결과를 갱신하세요.",
-				),
-			)
+		piece = next((piece for piece in pieces if contains_hangul(piece)), None)
+		if piece is None:
+			if on_empty is not None:
+				on_empty()
+			return
+		sequence = [
+			CallbackCommand(lambda: wx.CallAfter(self._queue_next, generation, pieces, None)),
+		]
+		sequence.extend(_jamo_speech.sequence(piece, _settings.snapshot().jamoNameStyle, _settings.is_korean()))
+		speech.speak(sequence)
 
-	def _on_live_update_change(self, evt: wx.CommandEvent) -> None:
-		if self._live_update_checkbox.GetValue():
-			self._update_output(announce=False)
-		evt.Skip()
 
-	def _on_input_text_change(self, evt: wx.CommandEvent) -> None:
-		if self._normalizing_input:
-			evt.Skip()
-			return
-		if self._enforce_hangul_input():
-			self._set_status(
-				_tr(
-					"Only Hangul characters are accepted. Non-Hangul input was ignored.",
-					"한글만 입력할 수 있습니다. 한글이 아닌 문자는 자동으로 제외했습니다.",
-				),
-			)
-		if self._live_update_checkbox.GetValue():
-			self._update_output(announce=False)
-		evt.Skip()
+class HangulSplitterSettingsPanel(gui.settingsDialogs.SettingsPanel):
+	title = _tr("Hangul Block Splitter", "한글 블록 분해기")
 
-	def _on_char_hook(self, evt: wx.KeyEvent) -> None:
-		if evt.GetKeyCode() == wx.WXK_ESCAPE:
-			self.Close()
-			return
-		evt.Skip()
+	def makeSettings(self, settingsSizer: wx.BoxSizer) -> None:
+		from ._hangulSplitterSettingsPanel import SettingsPanelControls
 
-	def _on_close_event(self, evt: wx.CloseEvent) -> None:
-		if self._closed:
-			evt.Skip()
-			return
-		self._closed = True
-		self._save_preferences()
-		try:
-			self._on_close()
-		finally:
-			self.Destroy()
+		self._controls = SettingsPanelControls(self, settingsSizer)
+
+	def onSave(self) -> None:
+		self._controls.save()
 
 
 class GlobalPlugin(globalPluginHandler.GlobalPlugin):
@@ -512,12 +704,34 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 	def __init__(self):
 		super().__init__()
 		_ensure_config_spec()
+		_settings.invalidate()
+		config.post_configProfileSwitch.register(_on_config_changed)
+		config.post_configReset.register(_on_config_changed)
+		config.post_configSave.register(_on_config_saved)
 		self._dialog: HangulSplitterDialog | None = None
+		self._export: DocumentExport | None = None
 		self._tools_menu_item: wx.MenuItem | None = None
+		self._line_split_cache = _LineSplitCache()
+		self._source_cache = _SourceTextCache()
+		self._chunked_speaker = _ChunkedSplitSpeaker()
+		self._split_worker = SplitWorker(deliver=wx.CallAfter)
+		self._caret_timer: wx.CallLater | None = None
+		self._caret_generation = 0
+		self._last_caret_event_time = 0.0
+		self._last_caret_position: tuple[int, int] | None = None
+		self._terminated = False
 		self._register_settings_panel()
-		self._add_tools_menu_item()
+		# The menu item is added once NVDA's startup has finished rather than while plugins load.
+		wx.CallAfter(self._add_tools_menu_item)
 
 	def terminate(self):
+		self._terminated = True
+		self._cancel_caret_announcement()
+		self._chunked_speaker.cancel()
+		self._split_worker.terminate()
+		self._cancel_export()
+		if is_profiling():
+			self._save_profile()
 		if self._dialog:
 			dialog = self._dialog
 			self._dialog = None
@@ -528,9 +742,14 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 				pass
 		self._remove_tools_menu_item()
 		self._unregister_settings_panel()
+		config.post_configProfileSwitch.unregister(_on_config_changed)
+		config.post_configReset.unregister(_on_config_changed)
+		config.post_configSave.unregister(_on_config_saved)
 		super().terminate()
 
 	def _add_tools_menu_item(self) -> None:
+		if self._terminated or self._tools_menu_item:
+			return
 		main_frame = gui.mainFrame
 		if not main_frame:
 			return
@@ -572,7 +791,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		self._tools_menu_item = None
 
 	def _on_tools_menu_item(self, evt: wx.CommandEvent) -> None:
-		wx.CallAfter(self._show_dialog, _get_dialog_seed_text())
+		chunks, _source_kind = self._get_source_chunks()
+		wx.CallAfter(self._show_dialog, _prepare_split_source("".join(chunks)))
 
 	def _register_settings_panel(self) -> None:
 		categories = gui.settingsDialogs.NVDASettingsDialog.categoryClasses
@@ -594,6 +814,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			self._dialog.Raise()
 			self._dialog.SetFocus()
 			return
+		from ._hangulSplitterDialog import HangulSplitterDialog
+
 		self._dialog = HangulSplitterDialog(
 			parent=gui.mainFrame,
 			initial_text=initial_text,
@@ -602,14 +824,202 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		self._dialog.Show()
 		self._dialog.Raise()
 
-	def _get_split_result_from_context(self) -> tuple[str, str]:
-		source_text, source_kind = _get_split_source_text()
-		if not source_text:
-			return "", source_kind
-		sanitized_text = _sanitize_for_split(source_text)
-		if not _has_hangul_content(sanitized_text):
-			return "", source_kind
-		return split_hangul_blocks(sanitized_text, _get_split_options()), source_kind
+	def event_caret(self, obj, nextHandler):
+		self._source_cache.clear()
+		nextHandler()
+		if _get_announce_on_caret_setting():
+			self._schedule_caret_announcement()
+
+	def event_typedCharacter(self, obj, nextHandler, ch):
+		self._line_split_cache.clear()
+		self._source_cache.clear()
+		nextHandler()
+
+	def event_textChange(self, obj, nextHandler):
+		self._line_split_cache.clear()
+		self._source_cache.clear()
+		nextHandler()
+
+	def event_gainFocus(self, obj, nextHandler):
+		self._line_split_cache.clear()
+		self._source_cache.clear()
+		self._last_caret_position = None
+		nextHandler()
+		if _get_announce_on_caret_setting():
+			# Remember where the caret starts so the first character move is recognized.
+			self._last_caret_position = self._get_caret_position()
+
+	def _counters(self) -> dict[str, int]:
+		counters = _settings.counters()
+		counters["sourceCacheHits"] = self._source_cache.hits
+		counters["sourceCacheMisses"] = self._source_cache.misses
+		return counters
+
+	def _get_source_chunks(self, trace: GestureTrace | None = None) -> tuple[Iterator[str], str]:
+		container = _get_text_container(trace)
+		info = _get_selection_or_caret_info(container)
+		has_selection = info is not None and not getattr(info, "isCollapsed", True)
+		scope = SCOPE_SELECTION if has_selection else _get_default_source_scope()
+		bookmark = getattr(info, "bookmark", None)
+		key = (id(container), bookmark, scope) if bookmark is not None else None
+		cached = self._source_cache.lookup(key)
+		if cached is not None:
+			chunks, source_kind = cached
+			return iter(chunks), source_kind
+		if has_selection:
+			return self._source_cache.record(key, _iter_text_chunks(info), SCOPE_SELECTION), SCOPE_SELECTION
+		source_text, source_kind = _get_text_from_scope(scope, container)
+		self._source_cache.store(key, (source_text,), source_kind)
+		return iter((source_text,)), source_kind
+
+	def _get_caret_position(self) -> tuple[int, int] | None:
+		offset = _get_start_offset(_get_caret_text_info())
+		if offset is None:
+			return None
+		return id(_get_text_container()), offset
+
+	def _cancel_caret_announcement(self) -> None:
+		if self._caret_timer is not None:
+			self._caret_timer.Stop()
+			self._caret_timer = None
+
+	def _schedule_caret_announcement(self) -> None:
+		now = time.monotonic()
+		is_repeat = (now - self._last_caret_event_time) * 1000 < _CARET_REPEAT_INTERVAL_MS
+		self._last_caret_event_time = now
+		self._caret_generation += 1
+		# Only the newest event survives; during key repeat it waits until the repeat stops.
+		self._cancel_caret_announcement()
+		delay = _CARET_REPEAT_INTERVAL_MS if is_repeat else _CARET_ANNOUNCE_DELAY_MS
+		self._caret_timer = wx.CallLater(delay, self._announce_caret_split, self._caret_generation)
+
+	@profiled
+	def _announce_caret_split(self, generation: int) -> None:
+		self._caret_timer = None
+		if generation != self._caret_generation:
+			return
+		container = _get_text_container()
+		info = _get_caret_text_info()
+		offset = _get_start_offset(info)
+		previous_position = self._last_caret_position
+		if info is None or offset is None:
+			self._last_caret_position = None
+			return
+		self._last_caret_position = (id(container), offset)
+		# Announce character navigation only; longer jumps are read by NVDA as words or lines.
+		if (
+			previous_position is None
+			or previous_position[0] != id(container)
+			or abs(offset - previous_position[1]) != 1
+		):
+			self._line_split_cache.clear()
+			return
+		rules = _get_split_options().activeRules
+		char = _get_character_at(info)
+		letters = self._line_split_cache.lookup(container, offset, char, rules)
+		if letters is None:
+			line_text, line_start = _get_current_line(info)
+			if line_start is None:
+				return
+			self._line_split_cache.store(container, line_start, line_text, rules)
+			letters = self._line_split_cache.lookup(container, offset, char, rules)
+		if letters:
+			speech.speak(_jamo_speech.sequence(letters, _settings.snapshot().jamoNameStyle, _settings.is_korean()))
+
+	def _save_profile(self) -> str | None:
+		session = stop_profiling()
+		if session is None:
+			return None
+		directory = os.path.join(globalVars.appArgs.configPath, PROFILE_DIR_NAME)
+		try:
+			profile_path, summary_path = session.write(directory)
+		except OSError:
+			log.error("Unable to write Hangul splitter profile", exc_info=True)
+			return None
+		log.info(f"Hangul splitter profile saved to {profile_path} with summary {summary_path}")
+		return profile_path
+
+	def _cancel_pending_splits(self) -> None:
+		self._chunked_speaker.cancel()
+		self._split_worker.supersede()
+
+	def _run_split_job(
+		self,
+		trace: GestureTrace,
+		chunks: Iterator[str],
+		source_kind: str,
+		on_result: Callable[[str], None],
+	) -> None:
+		# Text is fetched here on the main thread; only sanitizing and splitting may move to the worker.
+		with trace.stage(STAGE_TEXT_INFO):
+			source_chunks = list(chunks)
+		options = _get_split_options()
+
+		@profiled
+		def split_job() -> str:
+			with trace.stage(STAGE_SANITIZE):
+				sanitized = [_sanitize_for_split(chunk) for chunk in source_chunks]
+			with trace.stage(STAGE_SPLIT):
+				return _join_split_pieces(iter_split_hangul_blocks(sanitized, options))
+
+		def deliver(result: str) -> None:
+			with trace.stage(STAGE_OUTPUT):
+				if not result:
+					self._announce_no_hangul_source(source_kind)
+				else:
+					on_result(result)
+			_latency.finish(trace)
+
+		self._split_worker.submit(split_job, deliver, size=sum(len(chunk) for chunk in source_chunks))
+
+	def _cancel_export(self) -> bool:
+		export = self._export
+		if export is None:
+			return False
+		export.cancel()
+		return True
+
+	def _on_export_end(self) -> None:
+		self._export = None
+
+	def _get_document_info(self):
+		container = _get_text_container()
+		try:
+			return container, container.makeTextInfo(textInfos.POSITION_ALL)
+		except (AttributeError, NotImplementedError, RuntimeError):
+			ui.message(_tr("Unable to read the focused document.", "포커스된 문서를 읽을 수 없습니다."))
+			return container, None
+
+	def _start_export(self, container, info, path: str | None) -> None:
+		from ._hangulSplitterExport import ClipboardTarget, DocumentExport, FileTarget, get_document_length
+
+		if self._terminated or self._export is not None:
+			return
+		if path is None:
+			target = ClipboardTarget()
+		else:
+			try:
+				target = FileTarget(path)
+			except OSError:
+				log.error("Unable to create split Hangul document file", exc_info=True)
+				ui.message(_tr("Unable to save the split document.", "분해한 문서를 저장하지 못했습니다."))
+				return
+		self._export = DocumentExport(
+			info,
+			_get_split_options(),
+			target,
+			get_document_length(container),
+			on_end=self._on_export_end,
+		)
+		self._export.start()
+		ui.message(_tr("Exporting document.", "문서를 내보내는 중입니다."))
+
+	def _speak_split_result(self, result: str) -> None:
+		self._chunked_speaker.start(iter((result,)), on_empty=lambda: None)
+
+	def _copy_split_result(self, result: str) -> None:
+		if not api.copyToClip(result, notify=True):
+			ui.message(_tr("Unable to copy split result.", "분해 결과를 복사하지 못했습니다."))
 
 	def _announce_no_hangul_source(self, source_kind: str) -> None:
 		if source_kind == SCOPE_SELECTION:
@@ -651,8 +1061,16 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		gesture="kb:NVDA+shift+h",
 		speakOnDemand=True,
 	)
+	@profiled
 	def script_openHangulSplitterDialog(self, gesture):
-		wx.CallAfter(self._show_dialog, _get_dialog_seed_text())
+		trace = _latency.begin("openHangulSplitterDialog")
+		with trace.stage(STAGE_TEXT_INFO):
+			chunks, _source_kind = self._get_source_chunks(trace)
+			source_text = "".join(chunks)
+		with trace.stage(STAGE_SANITIZE):
+			seed_text = _prepare_split_source(source_text)
+		wx.CallAfter(self._show_dialog, seed_text)
+		_latency.finish(trace)
 
 	@script(
 		description=_tr(
@@ -662,17 +1080,27 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		gesture="kb:NVDA+alt+h",
 		speakOnDemand=True,
 	)
+	@profiled
 	def script_describeSplitHangul(self, gesture):
-		result, source_kind = self._get_split_result_from_context()
-		if not result:
-			self._announce_no_hangul_source(source_kind)
+		self._cancel_pending_splits()
+		trace = _latency.begin("describeSplitHangul")
+		with trace.stage(STAGE_TEXT_INFO):
+			chunks, source_kind = self._get_source_chunks(trace)
+		if getLastScriptRepeatCount() > 0:
+			self._run_split_job(trace, chunks, source_kind, self._copy_split_result)
 			return
-		repeat_count = getLastScriptRepeatCount()
-		if repeat_count == 0:
-			speech.speakSpelling(result, useCharacterDescriptions=True)
+		if source_kind == SCOPE_SELECTION:
+			# Selections are fetched and split piece by piece as speech consumes them,
+			# so the timings cover the work done before the first piece is spoken.
+			pieces = _iter_split_pieces(trace.iter_stage(STAGE_TEXT_INFO, chunks), _get_split_options(), trace)
+			with trace.stage(STAGE_OUTPUT):
+				self._chunked_speaker.start(
+					pieces,
+					on_empty=lambda: self._announce_no_hangul_source(source_kind),
+				)
+			_latency.finish(trace)
 			return
-		if not api.copyToClip(result, notify=True):
-			ui.message(_tr("Unable to copy split result.", "분해 결과를 복사하지 못했습니다."))
+		self._run_split_job(trace, chunks, source_kind, self._speak_split_result)
 
 	@script(
 		description=_tr(
@@ -681,13 +1109,84 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		),
 		speakOnDemand=True,
 	)
+	@profiled
 	def script_copySplitHangulUnderCursor(self, gesture):
-		result, source_kind = self._get_split_result_from_context()
-		if not result:
-			self._announce_no_hangul_source(source_kind)
+		self._cancel_pending_splits()
+		trace = _latency.begin("copySplitHangulUnderCursor")
+		with trace.stage(STAGE_TEXT_INFO):
+			chunks, source_kind = self._get_source_chunks(trace)
+		self._run_split_job(trace, chunks, source_kind, self._copy_split_result)
+
+	@script(
+		description=_tr(
+			"Splits the whole focused document and copies the result to the clipboard. Press again while it runs to cancel.",
+			"포커스된 문서 전체를 분해해 클립보드에 복사합니다. 진행 중에 다시 누르면 취소합니다.",
+		),
+		speakOnDemand=True,
+	)
+	def script_exportSplitDocument(self, gesture):
+		if self._cancel_export():
 			return
-		if not api.copyToClip(result, notify=True):
-			ui.message(_tr("Unable to copy split result.", "분해 결과를 복사하지 못했습니다."))
+		container, info = self._get_document_info()
+		if info is not None:
+			self._start_export(container, info, None)
+
+	@script(
+		description=_tr(
+			"Splits the whole focused document and saves the result to a text file. Press again while it runs to cancel.",
+			"포커스된 문서 전체를 분해해 텍스트 파일로 저장합니다. 진행 중에 다시 누르면 취소합니다.",
+		),
+		speakOnDemand=True,
+	)
+	def script_exportSplitDocumentToFile(self, gesture):
+		if self._cancel_export():
+			return
+		# The document is taken now, before the save dialog moves the focus.
+		container, info = self._get_document_info()
+		if info is None:
+			return
+		from ._hangulSplitterExport import choose_export_path
+
+		choose_export_path(lambda path: self._start_export(container, info, path))
+
+	@script(
+		description=_tr(
+			"Reports how long the recent Hangul splitter gestures took in each stage.",
+			"최근 한글 분해기 명령이 단계별로 걸린 시간을 알려줍니다.",
+		),
+		speakOnDemand=True,
+	)
+	def script_reportGestureLatency(self, gesture):
+		summary = _latency.format_summary()
+		if not summary:
+			ui.message(_tr("No gesture timings recorded yet.", "기록된 명령 소요 시간이 없습니다."))
+			return
+		ui.message(summary)
+
+	@script(
+		description=_tr(
+			"Saves the recorded Hangul splitter gesture timings to a file in the NVDA user configuration folder.",
+			"기록된 한글 분해기 명령 소요 시간을 NVDA 사용자 설정 폴더의 파일로 저장합니다.",
+		),
+	)
+	def script_saveGestureLatencyLog(self, gesture):
+		path = os.path.join(globalVars.appArgs.configPath, LATENCY_LOG_FILE_NAME)
+		try:
+			count = _latency.dump(path, counters=self._counters())
+		except OSError:
+			log.error("Unable to write Hangul splitter latency log", exc_info=True)
+			ui.message(_tr("Unable to save gesture timings.", "명령 소요 시간을 저장하지 못했습니다."))
+			return
+		log.info(
+			f"Hangul splitter latency summary: {_latency.format_summary()}; "
+			f"cache counters: {self._counters()}",
+		)
+		ui.message(
+			_tr(
+				"Saved {count} gesture timings to {fileName}.",
+				"명령 소요 시간 {count}개를 {fileName} 파일에 저장했습니다.",
+			).format(count=count, fileName=LATENCY_LOG_FILE_NAME),
+		)
 
 	@script(
 		description=_tr(
@@ -697,15 +1196,33 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		speakOnDemand=True,
 	)
 	def script_toggleComplexLetterSplitting(self, gesture):
-		conf = _get_conf_section()
-		new_value = not bool(conf[KEY_SPLIT_COMPLEX])
-		conf[KEY_SPLIT_COMPLEX] = new_value
+		options = _get_split_options()
+		new_value = not options.splitComplexLetters
+		_save_split_options(replace(options, splitComplexLetters=new_value))
 		ui.message(
 			_tr("Split complex letters on.", "겹글자 분해 켜짐.")
 			if new_value
 			else _tr("Split complex letters off.", "겹글자 분해 꺼짐."),
 		)
 
+	@script(
+		description=_tr(
+			"Cycles the decomposition profile that decides which complex letters are split.",
+			"어떤 겹글자를 분해할지 정하는 분해 프로필을 순환 전환합니다.",
+		),
+		speakOnDemand=True,
+	)
+	def script_cycleDecompositionProfile(self, gesture):
+		settings = _settings.snapshot()
+		profiles = settings.decompositionProfiles
+		try:
+			current_index = profiles.index(settings.decompositionProfile)
+		except ValueError:
+			current_index = 0
+		next_profile = profiles[(current_index + 1) % len(profiles)]
+		_save_decomposition_profile(next_profile)
+		ui.message(_get_decomposition_profile_label(next_profile))
+
 	@script(
 		description=_tr(
 			"Toggles insertion of spaces between split Hangul letters for this add-on.",
@@ -714,9 +1231,9 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		speakOnDemand=True,
 	)
 	def script_toggleInsertSpaces(self, gesture):
-		conf = _get_conf_section()
-		new_value = not bool(conf[KEY_INSERT_SPACES])
-		conf[KEY_INSERT_SPACES] = new_value
+		options = _get_split_options()
+		new_value = not options.insertSpacesBetweenLetters
+		_save_split_options(replace(options, insertSpacesBetweenLetters=new_value))
 		ui.message(
 			_tr("Insert spaces on.", "공백 삽입 켜짐.")
 			if new_value
@@ -739,6 +1256,46 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			else _tr("Live update in dialog off.", "대화상자 실시간 갱신 꺼짐."),
 		)
 
+	@script(
+		description=_tr(
+			"Toggles announcing split letters of the character under the caret when moving by character.",
+			"글자 단위로 캐럿을 옮길 때 커서 아래 글자의 분해 결과 읽기를 켜거나 끕니다.",
+		),
+		speakOnDemand=True,
+	)
+	def script_toggleCaretSplitAnnouncements(self, gesture):
+		new_value = not _get_announce_on_caret_setting()
+		_save_announce_on_caret_setting(new_value)
+		if not new_value:
+			self._cancel_caret_announcement()
+		ui.message(
+			_tr("Split letters on caret move on.", "캐럿 이동 시 자모 읽기 켜짐.")
+			if new_value
+			else _tr("Split letters on caret move off.", "캐럿 이동 시 자모 읽기 꺼짐."),
+		)
+
+	@script(
+		description=_tr(
+			"Starts or stops profiling the Hangul splitter. Stopping saves the profile to the NVDA user configuration folder.",
+			"한글 분해기 프로파일링을 시작하거나 멈춥니다. 멈추면 결과를 NVDA 사용자 설정 폴더에 저장합니다.",
+		),
+	)
+	def script_toggleProfiling(self, gesture):
+		if not is_profiling():
+			start_profiling()
+			ui.message(_tr("Hangul splitter profiling started.", "한글 분해기 프로파일링을 시작했습니다."))
+			return
+		profile_path = self._save_profile()
+		if profile_path is None:
+			ui.message(_tr("Unable to save the profile.", "프로파일을 저장하지 못했습니다."))
+			return
+		ui.message(
+			_tr(
+				"Profiling stopped. Saved {fileName} in {folderName}.",
+				"프로파일링을 멈췄습니다. {folderName} 폴더에 {fileName} 파일을 저장했습니다.",
+			).format(fileName=os.path.basename(profile_path), folderName=PROFILE_DIR_NAME),
+		)
+
 	@script(
 		description=_tr(
 			"Cycles the default split range used when no text is selected.",
@@ -0,0 +1,98 @@
+"""Open time and random record lookups of a pre-split corpus file, against splitting at start-up.
+
+Usage:
+
+	python benchmarks/bench_corpus.py
+	python benchmarks/bench_corpus.py --records 200000 --record-chars 500 --lookups 5000 --json
+	python benchmarks/bench_corpus.py --corpus texts.txt --source-map
+
+Without a corpus file, seeded random mixed-script records from tests/split_engines.py are used.
+The corpus file is written to a temporary directory once; writing is timed but not part of a lookup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "addon"))
+sys.path.insert(0, str(PROJECT_ROOT / "tests"))
+
+from split_engines import make_mixed_text  # noqa: E402
+
+from globalPlugins._hangulCorpus import HangulCorpus, write_corpus  # noqa: E402
+from globalPlugins._hangulSplitterCore import SplitOptions, split_hangul_blocks  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description="Benchmark the memory-mapped pre-split corpus format.")
+	parser.add_argument("--records", type=int, default=10000, help="Generated records.")
+	parser.add_argument("--record-chars", type=int, default=200, help="Characters per generated record.")
+	parser.add_argument("--corpus", help="Read records from this UTF-8 file, one per line, instead.")
+	parser.add_argument("--lookups", type=int, default=2000, help="Random records read after opening.")
+	parser.add_argument("--source-map", action="store_true", help="Store and read source maps too.")
+	parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+	args = parser.parse_args(argv)
+
+	if args.corpus:
+		texts = Path(args.corpus).read_text(encoding="utf-8").splitlines()
+	else:
+		text = make_mixed_text(args.records * args.record_chars, seed=0)
+		texts = [text[start : start + args.record_chars] for start in range(0, len(text), args.record_chars)]
+	options = SplitOptions()
+	rng = random.Random(1)
+	indexes = [rng.randrange(len(texts)) for _index in range(args.lookups)]
+
+	with tempfile.TemporaryDirectory() as directory:
+		path = os.path.join(directory, "corpus.hbs")
+		started = time.perf_counter()
+		write_corpus(path, texts, options, source_map=args.source_map)
+		write_seconds = time.perf_counter() - started
+
+		started = time.perf_counter()
+		# What a service pays at start-up without the file.
+		split = [split_hangul_blocks(text, options) for text in texts]
+		split_seconds = time.perf_counter() - started
+		del split
+
+		started = time.perf_counter()
+		with HangulCorpus(path) as corpus:
+			open_seconds = time.perf_counter() - started
+			started = time.perf_counter()
+			for index in indexes:
+				corpus.output(index)
+				if args.source_map:
+					corpus.source_map(index)
+			lookup_seconds = time.perf_counter() - started
+		file_bytes = os.path.getsize(path)
+
+	result = {
+		"records": len(texts),
+		"chars": sum(map(len, texts)),
+		"file_mib": file_bytes / 1024 / 1024,
+		"write_s": write_seconds,
+		"split_all_s": split_seconds,
+		"open_ms": open_seconds * 1000,
+		"lookup_us": lookup_seconds / max(1, len(indexes)) * 1e6,
+	}
+	if args.json:
+		print(json.dumps(result))
+		return 0
+	print(
+		f"{result['records']} records, {result['chars']} chars, {result['file_mib']:.1f} MiB file written in "
+		f"{result['write_s']:.2f} s\nsplitting everything at start-up: {result['split_all_s']:.2f} s\n"
+		f"opening the file: {result['open_ms']:.2f} ms, then {result['lookup_us']:.1f} us per record"
+	)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,155 @@
+"""End-to-end gesture benchmark for the global plugin, run headlessly on the NVDA stubs.
+
+Usage:
+
+	python benchmarks/bench_gestures.py
+	python benchmarks/bench_gestures.py --sizes 1000 100000 --latency-ms 0.5 --repeat 20
+	python benchmarks/bench_gestures.py --json
+
+Each scenario focuses a fake document of the given size and presses a gesture script,
+then runs the simulated main loop until the worker, queued calls and speech have settled.
+Reported times cover the whole gesture; peak memory is measured with tracemalloc in a separate pass.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import json
+import math
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "tests"))
+
+from nvda_harness import FakeDocument, PluginHarness, make_document_text  # noqa: E402
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+	if not sorted_values:
+		return 0.0
+	# Nearest-rank percentile.
+	rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+	return sorted_values[rank]
+
+
+def _scenarios(size: int, latency: float) -> dict[str, Callable[[PluginHarness], None]]:
+	text = make_document_text(size)
+	middle = len(text) // 2
+
+	def describe_character(harness: PluginHarness) -> None:
+		harness.focus(FakeDocument(text, caret=middle, latency=latency))
+		harness.press("describeSplitHangul")
+
+	def describe_line(harness: PluginHarness) -> None:
+		harness.set_option(harness.module.KEY_DEFAULT_SOURCE_SCOPE, harness.module.SCOPE_LINE)
+		harness.focus(FakeDocument(text, caret=middle, latency=latency))
+		harness.press("describeSplitHangul")
+
+	def describe_selection(harness: PluginHarness) -> None:
+		harness.focus(FakeDocument(text, selection=(0, len(text)), latency=latency))
+		harness.press("describeSplitHangul")
+
+	def copy_selection(harness: PluginHarness) -> None:
+		harness.focus(FakeDocument(text, selection=(0, len(text)), latency=latency))
+		harness.press("copySplitHangulUnderCursor")
+
+	def describe_twice(harness: PluginHarness) -> None:
+		# The second press copies the text the first one read.
+		harness.focus(FakeDocument(text, selection=(0, len(text)), latency=latency))
+		harness.press("describeSplitHangul")
+		harness.press("describeSplitHangul", repeat=1)
+
+	def export_document(harness: PluginHarness) -> None:
+		harness.focus(FakeDocument(text, caret=middle, latency=latency))
+		harness.press("exportSplitDocument")
+
+	def dialog_typing(harness: PluginHarness) -> None:
+		harness.focus(FakeDocument(text, selection=(0, len(text)), latency=latency))
+		harness.press("openHangulSplitterDialog")
+		for _index in range(20):
+			harness.dialog._input_edit.type_text("한")
+
+	return {
+		"describeCharacter": describe_character,
+		"describeLine": describe_line,
+		"describeSelection": describe_selection,
+		"copySelection": copy_selection,
+		"describeTwice": describe_twice,
+		"exportDocument": export_document,
+		"dialogTyping": dialog_typing,
+	}
+
+
+def _run_once(scenario: Callable[[PluginHarness], None]) -> float:
+	harness = PluginHarness()
+	try:
+		started = time.perf_counter()
+		scenario(harness)
+		return time.perf_counter() - started
+	finally:
+		harness.close()
+
+
+def _peak_memory(scenario: Callable[[PluginHarness], None]) -> int:
+	harness = PluginHarness()
+	try:
+		tracemalloc.start()
+		try:
+			scenario(harness)
+			return tracemalloc.get_traced_memory()[1]
+		finally:
+			tracemalloc.stop()
+	finally:
+		harness.close()
+
+
+def run(sizes: list[int], latency: float, repeat: int, only: list[str] | None) -> list[dict[str, float | str]]:
+	results: list[dict[str, float | str]] = []
+	for size in sizes:
+		for name, scenario in _scenarios(size, latency).items():
+			if only and name not in only:
+				continue
+			_run_once(scenario)
+			timings = sorted(_run_once(scenario) for _index in range(repeat))
+			results.append(
+				{
+					"scenario": name,
+					"size": float(size),
+					"p50_ms": percentile(timings, 0.50) * 1000,
+					"p99_ms": percentile(timings, 0.99) * 1000,
+					"max_ms": timings[-1] * 1000,
+					"peak_kib": _peak_memory(scenario) / 1024,
+				},
+			)
+	return results
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description="Benchmark gesture scripts headlessly on the NVDA stubs.")
+	parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 20000], help="Document sizes.")
+	parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated delay per TextInfo call.")
+	parser.add_argument("--repeat", type=int, default=5, help="Timed runs per scenario.")
+	parser.add_argument("--only", nargs="+", help="Run only these scenarios.")
+	parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+	args = parser.parse_args(argv)
+
+	results = run(args.sizes, args.latency_ms / 1000, args.repeat, args.only)
+	if args.json:
+		print(json.dumps(results))
+		return 0
+	for result in results:
+		print(
+			f"{result['scenario']:<18} {int(result['size']):>8} chars  "
+			f"p50 {result['p50_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms  "
+			f"max {result['max_ms']:8.2f} ms  peak {result['peak_kib']:9.1f} KiB"
+		)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,131 @@
+"""Fuzzy matching throughput of JamoVocabulary on a large vocabulary, checked against minimums.
+
+Usage:
+
+	python benchmarks/bench_jamo_match.py
+	python benchmarks/bench_jamo_match.py --words 500000 --distances 1 2 --check
+	python benchmarks/bench_jamo_match.py --lexicon words.txt --min-qps 2=500 --json
+
+Without a lexicon file, the reproducible lexicon of bench_jamo_trie.py is used.
+Each query is a vocabulary word with one random jamo typed wrong, left out or added,
+so every query has at least one match. The piece index of each distance is built by the
+first query at that distance; its build time is reported separately and not counted in
+the throughput. With --check, the exit status is 1 when a distance falls below its minimum.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import time
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "addon"))
+
+from bench_jamo_trie import make_lexicon  # noqa: E402
+from globalPlugins._hangulJamoMatch import JamoVocabulary  # noqa: E402
+from globalPlugins._hangulSplitterCore import decompose_syllables  # noqa: E402
+
+
+# Queries per second on the default 500k-word lexicon, with room for slower machines.
+DEFAULT_MIN_QPS = {0: 5000.0, 1: 1000.0, 2: 100.0}
+
+
+def make_queries(words: list[str], count: int, seed: int = 1) -> list[str]:
+	rng = random.Random(seed)
+	letters = sorted(set(decompose_syllables("".join(words[:2000]), True)))
+	queries: list[str] = []
+	for _index in range(count):
+		jamo = list(decompose_syllables(rng.choice(words), True))
+		position = rng.randrange(len(jamo))
+		operation = rng.randrange(3)
+		if operation == 0:
+			jamo[position] = rng.choice(letters)
+		elif operation == 1:
+			del jamo[position]
+		else:
+			jamo.insert(position, rng.choice(letters))
+		queries.append("".join(jamo))
+	return queries
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description="Benchmark jamo fuzzy matching on a large vocabulary.")
+	parser.add_argument("--words", type=int, default=500000, help="Generated lexicon size.")
+	parser.add_argument("--lexicon", help="Read words from this UTF-8 file, one per line, instead.")
+	parser.add_argument("--queries", type=int, default=2000, help="Queries per distance.")
+	parser.add_argument("--distances", type=int, nargs="+", default=[1, 2], help="Maximum distances to measure.")
+	parser.add_argument("--limit", type=int, default=10, help="Matches returned per query.")
+	parser.add_argument(
+		"--min-qps",
+		action="append",
+		default=[],
+		metavar="DISTANCE=QPS",
+		help="Override the minimum throughput of one distance; may be repeated.",
+	)
+	parser.add_argument("--check", action="store_true", help="Exit with status 1 when a minimum is not met.")
+	parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+	args = parser.parse_args(argv)
+
+	minimums = dict(DEFAULT_MIN_QPS)
+	for override in args.min_qps:
+		distance, _separator, qps = override.partition("=")
+		try:
+			minimums[int(distance)] = float(qps)
+		except ValueError:
+			parser.error(f"Invalid minimum {override!r}")
+
+	if args.lexicon:
+		words = [line.strip() for line in Path(args.lexicon).read_text(encoding="utf-8").splitlines() if line.strip()]
+	else:
+		words = make_lexicon(args.words)
+
+	started = time.perf_counter()
+	vocabulary = JamoVocabulary(words)
+	build_seconds = time.perf_counter() - started
+	queries = make_queries(vocabulary.words, args.queries)
+
+	results = []
+	for distance in args.distances:
+		started = time.perf_counter()
+		vocabulary.match(queries[0], distance, args.limit)
+		index_seconds = time.perf_counter() - started
+		matches = 0
+		started = time.perf_counter()
+		for query in queries:
+			matches += len(vocabulary.match(query, distance, args.limit))
+		elapsed = time.perf_counter() - started
+		qps = len(queries) / elapsed if elapsed else float("inf")
+		minimum = minimums.get(distance)
+		results.append(
+			{
+				"distance": distance,
+				"index_s": index_seconds,
+				"qps": qps,
+				"mean_matches": matches / len(queries),
+				"min_qps": minimum,
+				"below_minimum": minimum is not None and qps < minimum,
+			},
+		)
+
+	failures = [result for result in results if result["below_minimum"]]
+	if args.json:
+		print(json.dumps({"words": len(vocabulary), "build_s": build_seconds, "results": results}))
+	else:
+		print(f"{len(vocabulary)} words, decomposed in {build_seconds:.2f} s")
+		for result in results:
+			minimum = "" if result["min_qps"] is None else f" (minimum {result['min_qps']:g})"
+			marker = "  BELOW MINIMUM" if result["below_minimum"] else ""
+			print(
+				f"distance {result['distance']}: {result['qps']:.0f} queries/s{minimum}, "
+				f"index built in {result['index_s']:.2f} s, {result['mean_matches']:.1f} matches per query{marker}"
+			)
+	return 1 if args.check and failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,139 @@
+"""Build time, memory and per-keystroke query time of the jamo completion trie.
+
+Usage:
+
+	python benchmarks/bench_jamo_trie.py
+	python benchmarks/bench_jamo_trie.py --words 1000000 --queries 2000
+	python benchmarks/bench_jamo_trie.py --lexicon words.txt --json
+
+Without a lexicon file, a reproducible lexicon of random two to four syllable words is generated.
+Each query replays typing a word letter by letter, as an input method composes it
+("ㅎ", "하", "한", "한ㄱ", "한그", "한글"), and completes after every keystroke.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from pathlib import Path
+import random
+import sys
+import time
+import tracemalloc
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "addon"))
+
+from globalPlugins._hangulJamoTrie import JamoTrie  # noqa: E402
+from globalPlugins._hangulSplitterCore import (  # noqa: E402
+	LEADING_COMPAT,
+	N_COUNT,
+	S_BASE,
+	T_COUNT,
+	VOWEL_COMPAT,
+)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+	if not sorted_values:
+		return 0.0
+	# Nearest-rank percentile.
+	rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+	return sorted_values[rank]
+
+
+def make_lexicon(size: int, seed: int = 0) -> list[str]:
+	rng = random.Random(seed)
+	# A few hundred common-looking syllables keep prefixes shared, as in a real lexicon.
+	syllables = [
+		chr(S_BASE + (lead * len(VOWEL_COMPAT) + vowel) * T_COUNT + tail)
+		for lead in range(len(LEADING_COMPAT))
+		for vowel in (0, 4, 8, 13, 18, 20)
+		for tail in (0, 4, 8, 16, 21)
+	]
+	words: set[str] = set()
+	while len(words) < size:
+		length = rng.choice((2, 2, 3, 3, 3, 4))
+		words.add("".join(rng.choice(syllables) for _index in range(length)))
+	return sorted(words)
+
+
+def typing_steps(word: str) -> list[str]:
+	# The text an input method shows after each keystroke while composing word.
+	steps: list[str] = []
+	for index, syllable in enumerate(word):
+		done = word[:index]
+		s_index = ord(syllable) - S_BASE
+		lead = s_index // N_COUNT
+		vowel = (s_index % N_COUNT) // T_COUNT
+		tail = s_index % T_COUNT
+		steps.append(done + LEADING_COMPAT[lead])
+		steps.append(done + chr(S_BASE + (lead * len(VOWEL_COMPAT) + vowel) * T_COUNT))
+		if tail:
+			steps.append(done + syllable)
+	return steps
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description="Benchmark the jamo completion trie.")
+	parser.add_argument("--words", type=int, default=200000, help="Generated lexicon size.")
+	parser.add_argument("--lexicon", help="Read words from this UTF-8 file, one per line, instead.")
+	parser.add_argument("--queries", type=int, default=1000, help="Words to replay typing for.")
+	parser.add_argument("--limit", type=int, default=10, help="Completions returned per keystroke.")
+	parser.add_argument("--memory", action="store_true", help="Also build once under tracemalloc for memory.")
+	parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+	args = parser.parse_args(argv)
+
+	if args.lexicon:
+		words = [line.strip() for line in Path(args.lexicon).read_text(encoding="utf-8").splitlines() if line.strip()]
+	else:
+		words = make_lexicon(args.words)
+
+	started = time.perf_counter()
+	trie = JamoTrie(words)
+	build_seconds = time.perf_counter() - started
+	memory = 0
+	if args.memory:
+		# tracemalloc slows the build down several times, so it is timed separately.
+		tracemalloc.start()
+		measured = JamoTrie(words)
+		memory = tracemalloc.get_traced_memory()[0]
+		tracemalloc.stop()
+		del measured
+
+	rng = random.Random(1)
+	samples = [rng.choice(trie.words) for _index in range(args.queries)]
+	timings: list[float] = []
+	for word in samples:
+		for text in typing_steps(word):
+			started = time.perf_counter()
+			trie.complete(text, args.limit)
+			timings.append(time.perf_counter() - started)
+	timings.sort()
+
+	result = {
+		"words": len(trie),
+		"nodes": trie.node_count,
+		"build_s": build_seconds,
+		"memory_mib": memory / 1024 / 1024,
+		"keystrokes": len(timings),
+		"p50_us": percentile(timings, 0.50) * 1e6,
+		"p99_us": percentile(timings, 0.99) * 1e6,
+		"max_us": timings[-1] * 1e6 if timings else 0.0,
+	}
+	if args.json:
+		print(json.dumps(result))
+		return 0
+	memory_text = f", {result['memory_mib']:.1f} MiB" if args.memory else ""
+	print(
+		f"{result['words']} words, {result['nodes']} nodes, built in {result['build_s']:.2f} s{memory_text}\n"
+		f"{result['keystrokes']} keystrokes: p50 {result['p50_us']:.1f} us  "
+		f"p99 {result['p99_us']:.1f} us  max {result['max_us']:.1f} us"
+	)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
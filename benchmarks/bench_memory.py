@@ -0,0 +1,153 @@
+"""Peak memory of the core text functions, measured with tracemalloc, checked against budgets.
+
+Usage:
+
+	python benchmarks/bench_memory.py
+	python benchmarks/bench_memory.py --sizes 1000000 10000000 100000000 --check
+	python benchmarks/bench_memory.py --budget split=30 --json
+
+Sizes are input characters of mixed Korean and ASCII text. For every function and size this reports
+the tracemalloc peak over the call, per byte of the input string in memory, and the peak number of
+live small-object blocks (sampled at each garbage collection), per input character.
+The output itself is included, so a function that copies its input once costs at least about 1;
+tables compiled on first use are built before measuring and are not.
+Budgets are ratios of peak to input bytes, read from memory_budgets.json next to this file;
+with --check, the exit status is 1 when any function goes over its budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+from pathlib import Path
+import sys
+import tracemalloc
+from typing import Callable
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "addon"))
+
+from globalPlugins._hangulSplitterCore import (  # noqa: E402
+	SplitOptions,
+	is_hangul_script_char,
+	iter_split_hangul_blocks,
+	keep_only_hangul,
+	split_hangul_blocks,
+	split_hangul_blocks_with_source_map,
+	translate_hangul_blocks,
+)
+
+BUDGETS_FILE = Path(__file__).resolve().parent / "memory_budgets.json"
+
+_SAMPLE_WORDS = ("한글", "분해기", "읽기", "괜찮아요", "값", "NVDA", "테스트", "닭", "123", "훑어보기")
+_OPTIONS = SplitOptions(insertSpacesBetweenLetters=True)
+
+
+def make_text(size: int) -> str:
+	line = " ".join(_SAMPLE_WORDS) + "\n"
+	return (line * (size // len(line) + 1))[:size]
+
+
+def _split_in_lines(text: str) -> str:
+	return "".join(iter_split_hangul_blocks(text.splitlines(keepends=True), _OPTIONS))
+
+
+CASES: dict[str, Callable[[str], object]] = {
+	"split": lambda text: split_hangul_blocks(text, _OPTIONS),
+	"translate": lambda text: translate_hangul_blocks(text, _OPTIONS),
+	"splitInLines": _split_in_lines,
+	"sourceMap": lambda text: split_hangul_blocks_with_source_map(text, _OPTIONS),
+	"keepOnlyHangul": keep_only_hangul,
+	"filterScriptChars": lambda text: "".join(filter(is_hangul_script_char, text)),
+}
+
+
+def load_budgets(path: Path = BUDGETS_FILE) -> dict[str, float]:
+	with open(path, encoding="utf-8") as file:
+		return {name: float(ratio) for name, ratio in json.load(file).items()}
+
+
+def measure(function: Callable[[str], object], text: str) -> dict[str, float]:
+	input_bytes = sys.getsizeof(text)
+	# Compiled tables are built once per process, not per call, so they are left out.
+	function(text[:1000])
+	gc.collect()
+	baseline_blocks = sys.getallocatedblocks()
+	peak_blocks = baseline_blocks
+
+	def sample(phase: str, _info: dict) -> None:
+		nonlocal peak_blocks
+		if phase == "start":
+			peak_blocks = max(peak_blocks, sys.getallocatedblocks())
+
+	gc.callbacks.append(sample)
+	tracemalloc.start()
+	try:
+		result = function(text)
+		peak_blocks = max(peak_blocks, sys.getallocatedblocks())
+		peak = tracemalloc.get_traced_memory()[1]
+	finally:
+		tracemalloc.stop()
+		gc.callbacks.remove(sample)
+	del result
+	return {
+		"input_bytes": input_bytes,
+		"peak_bytes": peak,
+		"peak_per_input_byte": peak / input_bytes,
+		"blocks_per_char": (peak_blocks - baseline_blocks) / max(1, len(text)),
+	}
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description="Measure peak memory of the core text functions.")
+	parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+	parser.add_argument("--cases", nargs="+", choices=sorted(CASES), help="Functions to measure; all by default.")
+	parser.add_argument("--budgets", type=Path, default=BUDGETS_FILE, help="JSON file of peak-per-input-byte budgets.")
+	parser.add_argument(
+		"--budget",
+		action="append",
+		default=[],
+		metavar="CASE=RATIO",
+		help="Override one budget; may be repeated.",
+	)
+	parser.add_argument("--check", action="store_true", help="Exit with status 1 when a budget is exceeded.")
+	parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+	args = parser.parse_args(argv)
+
+	budgets = load_budgets(args.budgets)
+	for override in args.budget:
+		name, _sep, ratio = override.partition("=")
+		if name not in CASES or not ratio:
+			parser.error(f"Invalid budget {override!r}")
+		budgets[name] = float(ratio)
+
+	results = []
+	for size in args.sizes:
+		text = make_text(size)
+		for name in args.cases or CASES:
+			result = {"case": name, "chars": len(text), **measure(CASES[name], text)}
+			budget = budgets.get(name)
+			result["budget"] = budget
+			result["over_budget"] = budget is not None and result["peak_per_input_byte"] > budget
+			results.append(result)
+		del text
+
+	failures = [result for result in results if result["over_budget"]]
+	if args.json:
+		print(json.dumps(results))
+	else:
+		for result in results:
+			budget = "" if result["budget"] is None else f" (budget {result['budget']:g})"
+			marker = "  OVER BUDGET" if result["over_budget"] else ""
+			print(
+				f"{result['case']:>17} {result['chars']:>11} chars: peak {result['peak_bytes'] / 1024 / 1024:9.1f} MiB, "
+				f"x{result['peak_per_input_byte']:.2f} input{budget}, "
+				f"{result['blocks_per_char']:.2f} blocks/char{marker}",
+			)
+	return 1 if args.check and failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,135 @@
+"""Thread scaling of split_hangul_blocks_parallel on one large text.
+
+Usage:
+
+	python benchmarks/bench_parallel_split.py
+	python benchmarks/bench_parallel_split.py --size 50000000 --workers 1 2 4 8 --spaces
+	python benchmarks/bench_parallel_split.py --interpreters python3.13 python3.13t
+
+Threads only run the split at the same time on a free-threaded build (3.13t and later, with the GIL
+disabled); on a GIL build the extra threads show what cutting and stitching cost.
+With --interpreters, the benchmark runs once under each interpreter and prints the results side by side,
+so a free-threaded build can be compared with the GIL build of the same version.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import sysconfig
+import time
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "addon"))
+
+from globalPlugins._hangulSplitterCore import (  # noqa: E402
+	SplitOptions,
+	split_hangul_blocks_parallel,
+	translate_hangul_blocks,
+)
+
+_SAMPLE_WORDS = ("한글", "분해기", "읽기", "괜찮아요", "값", "NVDA", "테스트", "닭", "123", "훑어보기")
+
+
+def make_text(size: int) -> str:
+	line = " ".join(_SAMPLE_WORDS) + "\n"
+	return (line * (size // len(line) + 1))[:size]
+
+
+def gil_enabled() -> bool:
+	is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+	return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def run(args: argparse.Namespace) -> dict:
+	text = make_text(args.size)
+	options = SplitOptions(insertSpacesBetweenLetters=args.spaces)
+	expected = translate_hangul_blocks(text, options)
+	started = time.perf_counter()
+	for _round in range(args.repeat):
+		translate_hangul_blocks(text, options)
+	baseline = (time.perf_counter() - started) / args.repeat
+	results = []
+	for workers in args.workers:
+		with ThreadPoolExecutor(max_workers=workers) as executor:
+			if split_hangul_blocks_parallel(text, options, workers, executor, min_chunk_chars=1) != expected:
+				raise SystemExit(f"Parallel split with {workers} workers differs from the serial result")
+			started = time.perf_counter()
+			for _round in range(args.repeat):
+				split_hangul_blocks_parallel(text, options, workers, executor, min_chunk_chars=1)
+			seconds = (time.perf_counter() - started) / args.repeat
+		results.append({
+			"workers": workers,
+			"ms": seconds * 1000,
+			"mchars_per_s": len(text) / seconds / 1e6,
+			"speedup": baseline / seconds,
+		})
+	return {
+		"python": sys.version.split()[0],
+		"free_threaded_build": bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+		"gil_enabled": gil_enabled(),
+		"cpus": os.cpu_count(),
+		"chars": len(text),
+		"serial_ms": baseline * 1000,
+		"results": results,
+	}
+
+
+def describe(result: dict) -> str:
+	build = "free-threaded" if result["free_threaded_build"] else "GIL build"
+	gil = "GIL enabled" if result["gil_enabled"] else "GIL disabled"
+	lines = [
+		f"Python {result['python']} ({build}, {gil}), {result['cpus']} CPUs, {result['chars']} characters, "
+		f"serial {result['serial_ms']:.1f} ms",
+	]
+	for row in result["results"]:
+		lines.append(
+			f"  {row['workers']:>3} workers: {row['ms']:8.1f} ms  {row['mchars_per_s']:7.1f} Mchar/s  "
+			f"x{row['speedup']:.2f}",
+		)
+	return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description="Benchmark thread scaling of the parallel Hangul split.")
+	parser.add_argument("--size", type=int, default=20_000_000, help="Characters in the text.")
+	parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Thread counts to time.")
+	parser.add_argument("--repeat", type=int, default=3, help="Timed runs per thread count.")
+	parser.add_argument("--spaces", action="store_true", help="Insert spaces between letters.")
+	parser.add_argument("--interpreters", nargs="+", help="Run under each of these Python executables instead.")
+	parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+	args = parser.parse_args(argv)
+
+	if not args.interpreters:
+		result = run(args)
+		print(json.dumps(result) if args.json else describe(result))
+		return 0
+
+	forwarded = ["--size", str(args.size), "--repeat", str(args.repeat), "--workers", *map(str, args.workers)]
+	if args.spaces:
+		forwarded.append("--spaces")
+	results = []
+	for interpreter in args.interpreters:
+		output = subprocess.run(
+			[interpreter, "-X", "utf8", __file__, *forwarded, "--json"],
+			check=True,
+			capture_output=True,
+			text=True,
+		).stdout
+		results.append({"interpreter": interpreter, **json.loads(output.strip().splitlines()[-1])})
+	if args.json:
+		print(json.dumps(results))
+		return 0
+	for result in results:
+		print(f"{result['interpreter']}: {describe(result)}")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,68 @@
+"""Check every split engine against split_hangul_blocks on large random text, and time them.
+
+Usage:
+
+	python benchmarks/bench_split_engines.py
+	python benchmarks/bench_split_engines.py --sizes 1000000 5000000 --seed 3 --json
+
+The text is seeded random mixed-script text from tests/split_engines.py. All four option sets are
+checked at every size; the exit status is 1 when any engine differs from the reference.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "tests"))
+
+from split_engines import OPTION_SETS, check_engines, make_mixed_text, time_engines  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description="Differential check and timing of the Hangul split engines.")
+	parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000], help="Text sizes in characters.")
+	parser.add_argument("--seed", type=int, default=0, help="Seed of the random text.")
+	parser.add_argument("--repeat", type=int, default=3, help="Timed runs per engine; the best is reported.")
+	parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+	args = parser.parse_args(argv)
+
+	results = []
+	failures: list[str] = []
+	for size in args.sizes:
+		text = make_mixed_text(size, args.seed)
+		failures.extend(mismatch.describe() for mismatch in check_engines(text))
+		for options in OPTION_SETS:
+			results.append({
+				"chars": len(text),
+				"splitComplexLetters": options.splitComplexLetters,
+				"insertSpacesBetweenLetters": options.insertSpacesBetweenLetters,
+				"seconds": time_engines(text, options, repeat=args.repeat),
+			})
+
+	if args.json:
+		print(json.dumps({"results": results, "mismatches": failures}))
+	else:
+		for result in results:
+			timings = result["seconds"]
+			reference = timings["reference"]
+			engines = "  ".join(
+				f"{name} {seconds * 1000:.1f} ms (x{reference / seconds:.0f})"
+				for name, seconds in timings.items()
+				if name != "reference"
+			)
+			print(
+				f"{result['chars']:>9} chars, complex {int(result['splitComplexLetters'])}, "
+				f"spaces {int(result['insertSpacesBetweenLetters'])}: reference {reference * 1000:.1f} ms  {engines}",
+			)
+		for failure in failures:
+			print(f"MISMATCH: {failure}")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
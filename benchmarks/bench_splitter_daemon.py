@@ -0,0 +1,149 @@
+"""Latency and throughput benchmark for scripts/splitter_daemon.py.
+
+Usage:
+
+	python benchmarks/bench_splitter_daemon.py --spawn --concurrency 16 --requests 500
+	python benchmarks/bench_splitter_daemon.py --port 8765 --text-size 2000
+
+Each simulated client keeps one connection open and sends its requests back to back,
+so the numbers include connection reuse and server-side batching.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+from pathlib import Path
+import random
+import sys
+import time
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DAEMON_SCRIPT = PROJECT_ROOT / "scripts" / "splitter_daemon.py"
+
+_SAMPLE_WORDS = ("한글", "분해기", "읽기", "괜찮아요", "값", "NVDA", "테스트", "닭", "123", "훑어보기")
+
+
+def make_text(size: int, seed: int) -> str:
+	rng = random.Random(seed)
+	parts: list[str] = []
+	length = 0
+	while length < size:
+		word = rng.choice(_SAMPLE_WORDS)
+		parts.append(word)
+		length += len(word) + 1
+	return " ".join(parts)[:size]
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+	if not sorted_values:
+		return 0.0
+	# Nearest-rank percentile.
+	rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+	return sorted_values[rank]
+
+
+async def _open_connection(args: argparse.Namespace) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+	if args.unix:
+		return await asyncio.open_unix_connection(args.unix, limit=64 * 1024 * 1024)
+	return await asyncio.open_connection(args.host, args.port, limit=64 * 1024 * 1024)
+
+
+async def _run_client(client_index: int, args: argparse.Namespace, latencies: list[float]) -> None:
+	reader, writer = await _open_connection(args)
+	text = make_text(args.text_size, seed=client_index)
+	try:
+		for request_index in range(args.requests):
+			request = {
+				"jsonrpc": "2.0",
+				"id": request_index,
+				"method": args.method,
+				"params": {"text": text, "insertSpacesBetweenLetters": args.insert_spaces},
+			}
+			started = time.perf_counter()
+			writer.write(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+			await writer.drain()
+			response = json.loads(await reader.readline())
+			latencies.append(time.perf_counter() - started)
+			if "error" in response:
+				raise RuntimeError(f"Server error: {response['error']}")
+	finally:
+		writer.close()
+		await writer.wait_closed()
+
+
+async def _run(args: argparse.Namespace) -> dict[str, float]:
+	latencies: list[float] = []
+	started = time.perf_counter()
+	await asyncio.gather(*(_run_client(index, args, latencies) for index in range(args.concurrency)))
+	elapsed = time.perf_counter() - started
+	latencies.sort()
+	return {
+		"requests": float(len(latencies)),
+		"seconds": elapsed,
+		"throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+		"p50_ms": percentile(latencies, 0.50) * 1000,
+		"p99_ms": percentile(latencies, 0.99) * 1000,
+		"max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+	}
+
+
+async def _spawn_daemon() -> tuple[asyncio.subprocess.Process, int]:
+	process = await asyncio.create_subprocess_exec(
+		sys.executable,
+		str(DAEMON_SCRIPT),
+		"--port",
+		"0",
+		stdout=asyncio.subprocess.PIPE,
+	)
+	assert process.stdout is not None
+	banner = (await process.stdout.readline()).decode("utf-8").strip()
+	if not banner.startswith("listening on "):
+		process.kill()
+		raise RuntimeError(f"Unexpected daemon output: {banner!r}")
+	return process, int(banner.rsplit(":", 1)[1])
+
+
+async def _main_async(args: argparse.Namespace) -> dict[str, float]:
+	process: asyncio.subprocess.Process | None = None
+	if args.spawn:
+		process, args.port = await _spawn_daemon()
+	try:
+		return await _run(args)
+	finally:
+		if process is not None:
+			process.terminate()
+			await process.wait()
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description="Benchmark the Hangul splitter daemon.")
+	parser.add_argument("--host", default="127.0.0.1")
+	parser.add_argument("--port", type=int, default=8765)
+	parser.add_argument("--unix", help="Connect to this Unix socket instead of TCP.")
+	parser.add_argument("--spawn", action="store_true", help="Start a daemon on a free port for this run.")
+	parser.add_argument("--concurrency", type=int, default=8, help="Number of simultaneous connections.")
+	parser.add_argument("--requests", type=int, default=200, help="Requests sent by each connection.")
+	parser.add_argument("--text-size", type=int, default=200, help="Characters per request text.")
+	parser.add_argument("--method", default="split", choices=("split", "keepOnlyHangul", "classify"))
+	parser.add_argument("--insert-spaces", action="store_true")
+	parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+	args = parser.parse_args(argv)
+
+	results = asyncio.run(_main_async(args))
+	if args.json:
+		print(json.dumps(results))
+		return 0
+	print(
+		f"{int(results['requests'])} requests in {results['seconds']:.3f}s "
+		f"({results['throughput_rps']:.0f} req/s) with {args.concurrency} connections"
+	)
+	print(f"p50 {results['p50_ms']:.3f} ms, p99 {results['p99_ms']:.3f} ms, max {results['max_ms']:.3f} ms")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,62 @@
+"""Import and construction time of the global plugin, measured on the NVDA stubs.
+
+Usage:
+
+	python benchmarks/bench_startup.py --runs 20
+
+Every run starts a fresh interpreter, pre-imports the stub modules (NVDA has them loaded already),
+then times importing hangulBlockSplitter and constructing GlobalPlugin.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from pathlib import Path
+import sys
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "tests"))
+
+from nvda_harness import measure_startup  # noqa: E402
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+	if not sorted_values:
+		return 0.0
+	# Nearest-rank percentile.
+	rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+	return sorted_values[rank]
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description="Measure add-on import and GlobalPlugin construction time.")
+	parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters to measure.")
+	parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+	args = parser.parse_args(argv)
+
+	runs = [measure_startup() for _index in range(args.runs)]
+	import_ms = sorted(run["importMs"] for run in runs)
+	init_ms = sorted(run["initMs"] for run in runs)
+	addon_modules = [name for name in runs[-1]["modules"] if name.startswith("globalPlugins.")]
+	results = {
+		"runs": args.runs,
+		"import_p50_ms": percentile(import_ms, 0.50),
+		"import_max_ms": import_ms[-1],
+		"init_p50_ms": percentile(init_ms, 0.50),
+		"init_max_ms": init_ms[-1],
+		"addonModules": addon_modules,
+	}
+	if args.json:
+		print(json.dumps(results))
+		return 0
+	print(f"import p50 {results['import_p50_ms']:.2f} ms, max {results['import_max_ms']:.2f} ms")
+	print(f"init   p50 {results['init_p50_ms']:.3f} ms, max {results['init_max_ms']:.3f} ms")
+	print("add-on modules loaded at startup: " + ", ".join(addon_modules))
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
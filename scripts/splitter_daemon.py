@@ -0,0 +1,334 @@
+"""Long-running Hangul splitter daemon speaking newline-delimited JSON-RPC 2.0.
+
+Usage:
+
+	python scripts/splitter_daemon.py --port 8765
+	python scripts/splitter_daemon.py --unix /tmp/hangul-splitter.sock
+	python scripts/splitter_daemon.py --lexicon words.txt
+
+Each request is one JSON object on its own line, for example:
+
+	{"jsonrpc": "2.0", "id": 1, "method": "split", "params": {"text": "한글"}}
+
+Supported methods:
+
+- split: params `text`, optional `splitComplexLetters` and `insertSpacesBetweenLetters`.
+- keepOnlyHangul: params `text`, optional `includeWhitespace`.
+- classify: params `text`; returns `[kind, length]` runs of `classify_char` kinds.
+- complete: params `prefix`, optional `limit` (default 10); returns `{"count": n, "words": [...]}`,
+  the words of the `--lexicon` file whose jamo spelling starts with that of the prefix,
+  so a partly composed last syllable such as "하ㄴ" completes to both 한글 and 하나.
+- ping: returns "pong".
+
+Connections stay open for any number of requests, and requests may be pipelined.
+Requests without an "id" are notifications and get no response.
+Responses carry the request id and can arrive out of order.
+Split requests that arrive together, from one or many connections,
+are decomposed in a single `translate_hangul_blocks` pass per option set.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from itertools import groupby
+import json
+from pathlib import Path
+import sys
+import traceback
+from typing import Any
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+sys.path.insert(0, str(ADDON_DIR))
+
+from globalPlugins._hangulSplitterCore import (  # noqa: E402
+	SplitOptions,
+	classify_char,
+	keep_only_hangul,
+	translate_hangul_blocks,
+)
+from globalPlugins._hangulJamoTrie import JamoTrie  # noqa: E402
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_COMPLETION_LIMIT = 10
+MAX_COMPLETION_LIMIT = 1000
+# Lines longer than this are rejected by asyncio streams; large enough for whole documents.
+STREAM_LIMIT = 64 * 1024 * 1024
+
+# NUL is neither whitespace nor Hangul, so it passes through the splitter unchanged
+# and resets the letter spacing state, which makes it a safe batch separator.
+_BATCH_SEPARATOR = "\x00"
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RequestError(Exception):
+	def __init__(self, code: int, message: str):
+		super().__init__(message)
+		self.code = code
+		self.message = message
+
+
+def split_batch(texts: list[str], options: SplitOptions) -> list[str]:
+	results: list[str] = [""] * len(texts)
+	batch_indexes: list[int] = []
+	for index, text in enumerate(texts):
+		if _BATCH_SEPARATOR in text:
+			results[index] = translate_hangul_blocks(text, options)
+		else:
+			batch_indexes.append(index)
+	if not batch_indexes:
+		return results
+	joined = translate_hangul_blocks(_BATCH_SEPARATOR.join(texts[index] for index in batch_indexes), options)
+	for index, part in zip(batch_indexes, joined.split(_BATCH_SEPARATOR)):
+		results[index] = part
+	return results
+
+
+def classify_runs(text: str) -> list[list[Any]]:
+	return [[kind, sum(1 for _char in group)] for kind, group in groupby(text, key=classify_char)]
+
+
+class SplitBatcher:
+	def __init__(self, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, batch_window: float = 0.0):
+		self._max_batch_size = max_batch_size
+		self._batch_window = batch_window
+		self._pending: list[tuple[str, SplitOptions, asyncio.Future[str]]] = []
+		self._flush_handle: asyncio.Handle | None = None
+		self.batches = 0
+		self.batched_requests = 0
+
+	def submit(self, text: str, options: SplitOptions) -> asyncio.Future[str]:
+		loop = asyncio.get_running_loop()
+		future: asyncio.Future[str] = loop.create_future()
+		self._pending.append((text, options, future))
+		if len(self._pending) >= self._max_batch_size:
+			self.flush()
+		elif self._flush_handle is None:
+			# Deferring to the next loop iteration lets every request already read
+			# from any connection join this batch.
+			if self._batch_window > 0:
+				self._flush_handle = loop.call_later(self._batch_window, self.flush)
+			else:
+				self._flush_handle = loop.call_soon(self.flush)
+		return future
+
+	def flush(self) -> None:
+		if self._flush_handle is not None:
+			self._flush_handle.cancel()
+			self._flush_handle = None
+		pending, self._pending = self._pending, []
+		if not pending:
+			return
+		grouped: dict[SplitOptions, list[tuple[str, asyncio.Future[str]]]] = {}
+		for text, options, future in pending:
+			grouped.setdefault(options, []).append((text, future))
+		for options, items in grouped.items():
+			try:
+				results = split_batch([text for text, _future in items], options)
+			except Exception as error:
+				for _text, future in items:
+					if not future.done():
+						future.set_exception(error)
+				continue
+			for (_text, future), result in zip(items, results):
+				if not future.done():
+					future.set_result(result)
+		self.batches += 1
+		self.batched_requests += len(pending)
+
+
+def _require_text(params: dict[str, Any]) -> str:
+	text = params.get("text")
+	if not isinstance(text, str):
+		raise RequestError(INVALID_PARAMS, "params.text must be a string")
+	return text
+
+
+def _optional_bool(params: dict[str, Any], key: str, default: bool) -> bool:
+	value = params.get(key, default)
+	if not isinstance(value, bool):
+		raise RequestError(INVALID_PARAMS, f"params.{key} must be a boolean")
+	return value
+
+
+def _optional_limit(params: dict[str, Any]) -> int:
+	value = params.get("limit", DEFAULT_COMPLETION_LIMIT)
+	if isinstance(value, bool) or not isinstance(value, int) or not 0 < value <= MAX_COMPLETION_LIMIT:
+		raise RequestError(INVALID_PARAMS, f"params.limit must be an integer from 1 to {MAX_COMPLETION_LIMIT}")
+	return value
+
+
+def load_lexicon(path: str) -> JamoTrie:
+	with open(path, encoding="utf-8") as file:
+		return JamoTrie(line.strip() for line in file)
+
+
+class SplitterServer:
+	def __init__(self, batcher: SplitBatcher | None = None, lexicon: JamoTrie | None = None):
+		self.batcher = batcher or SplitBatcher()
+		self.lexicon = lexicon
+
+	async def dispatch(self, method: str, params: dict[str, Any]) -> Any:
+		if method == "split":
+			text = _require_text(params)
+			options = SplitOptions(
+				splitComplexLetters=_optional_bool(params, "splitComplexLetters", True),
+				insertSpacesBetweenLetters=_optional_bool(params, "insertSpacesBetweenLetters", False),
+			)
+			return await self.batcher.submit(text, options)
+		if method == "keepOnlyHangul":
+			text = _require_text(params)
+			return keep_only_hangul(text, include_whitespace=_optional_bool(params, "includeWhitespace", True))
+		if method == "classify":
+			return classify_runs(_require_text(params))
+		if method == "complete":
+			prefix = params.get("prefix")
+			if not isinstance(prefix, str):
+				raise RequestError(INVALID_PARAMS, "params.prefix must be a string")
+			limit = _optional_limit(params)
+			if self.lexicon is None:
+				raise RequestError(INVALID_REQUEST, "No lexicon loaded; start the daemon with --lexicon")
+			return {"count": self.lexicon.count(prefix), "words": self.lexicon.complete(prefix, limit)}
+		if method == "ping":
+			return "pong"
+		raise RequestError(METHOD_NOT_FOUND, f"Unknown method: {method}")
+
+	async def handle_line(self, line: bytes) -> dict[str, Any] | None:
+		# Returns None for notifications, requests without an id, which get no response even on error.
+		request_id: Any = None
+		is_notification = False
+		try:
+			try:
+				request = json.loads(line)
+			except ValueError:
+				raise RequestError(PARSE_ERROR, "Invalid JSON") from None
+			if not isinstance(request, dict):
+				raise RequestError(INVALID_REQUEST, "Request must be a JSON object")
+			is_notification = "id" not in request
+			request_id = request.get("id")
+			method = request.get("method")
+			params = request.get("params", {})
+			if not isinstance(method, str):
+				raise RequestError(INVALID_REQUEST, "method must be a string")
+			if not isinstance(params, dict):
+				raise RequestError(INVALID_PARAMS, "params must be an object")
+			result = await self.dispatch(method, params)
+		except RequestError as error:
+			response = {"jsonrpc": "2.0", "id": request_id, "error": {"code": error.code, "message": error.message}}
+		except Exception as error:
+			traceback.print_exc()
+			response = {
+				"jsonrpc": "2.0",
+				"id": request_id,
+				"error": {"code": INTERNAL_ERROR, "message": f"Internal error: {type(error).__name__}"},
+			}
+		else:
+			response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+		return None if is_notification else response
+
+	async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+		write_lock = asyncio.Lock()
+		tasks: set[asyncio.Task[None]] = set()
+
+		async def respond(line: bytes) -> None:
+			response = await self.handle_line(line)
+			if response is None:
+				return
+			payload = json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
+			async with write_lock:
+				writer.write(payload)
+				await writer.drain()
+
+		try:
+			while True:
+				try:
+					line = await reader.readline()
+				except (asyncio.LimitOverrunError, ValueError):
+					break
+				if not line:
+					break
+				if not line.strip():
+					continue
+				task = asyncio.create_task(respond(line))
+				tasks.add(task)
+				task.add_done_callback(tasks.discard)
+			if tasks:
+				await asyncio.gather(*tasks, return_exceptions=True)
+		except ConnectionError:
+			pass
+		finally:
+			writer.close()
+			try:
+				await writer.wait_closed()
+			except ConnectionError:
+				pass
+
+	async def start(
+		self,
+		host: str = DEFAULT_HOST,
+		port: int = DEFAULT_PORT,
+		unix_path: str | None = None,
+	) -> asyncio.AbstractServer:
+		if unix_path:
+			return await asyncio.start_unix_server(self.handle_connection, path=unix_path, limit=STREAM_LIMIT)
+		return await asyncio.start_server(self.handle_connection, host=host, port=port, limit=STREAM_LIMIT)
+
+
+def _describe_address(server: asyncio.AbstractServer) -> str:
+	sockets = server.sockets or ()
+	if not sockets:
+		return ""
+	address = sockets[0].getsockname()
+	if isinstance(address, tuple):
+		return f"{address[0]}:{address[1]}"
+	return str(address)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+	batcher = SplitBatcher(max_batch_size=args.max_batch_size, batch_window=args.batch_window_ms / 1000)
+	lexicon = load_lexicon(args.lexicon) if args.lexicon else None
+	server = await SplitterServer(batcher, lexicon).start(host=args.host, port=args.port, unix_path=args.unix)
+	# Benchmarks and wrappers read this first line to find an ephemeral port.
+	print(f"listening on {_describe_address(server)}", flush=True)
+	async with server:
+		await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(description="Serve Hangul splitting over newline-delimited JSON-RPC.")
+	parser.add_argument("--host", default=DEFAULT_HOST, help="TCP host to bind (default: %(default)s).")
+	parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port, 0 for any free port.")
+	parser.add_argument("--unix", help="Listen on this Unix socket path instead of TCP.")
+	parser.add_argument(
+		"--max-batch-size",
+		type=int,
+		default=DEFAULT_MAX_BATCH_SIZE,
+		help="Flush a split batch once this many requests are queued.",
+	)
+	parser.add_argument(
+		"--batch-window-ms",
+		type=float,
+		default=0.0,
+		help="Wait this long for more requests before splitting a batch (default: next loop iteration).",
+	)
+	parser.add_argument("--lexicon", help="UTF-8 word list, one word per line, for the complete method.")
+	args = parser.parse_args(argv)
+	try:
+		asyncio.run(_serve(args))
+	except KeyboardInterrupt:
+		pass
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -3,7 +3,8 @@ This tool generates NVDA extensions.
 
 Builders:
 
-- NVDAAddon: Creates a .nvda-addon zip file. Requires the `excludePatterns` environment variable.
+- NVDAAddon: Creates a reproducible .nvda-addon zip file and prints which files changed since the last one.
+  Requires the `excludePatterns` environment variable.
 - NVDAManifest: Creates the manifest.ini file.
 - NVDATranslatedManifest: Creates the manifest.ini file with only translated information.
 - md2html: Build HTML from Markdown
@@ -20,8 +21,14 @@ The following environment variables are required to build the HTML:
 - mdExtensions: list[str]
 - addon_info: .typings.AddonInfo
 
+Compressed add-on entries are cached under `addonCacheDir` (default `.cache/addon`) by file content.
+Rendered HTML is cached under `docsCacheDir` (default `.cache/docs`), keyed on the markdown, the catalog,
+the extensions and the add-on fields; set it to None to always render.
+
 """
 
+import os
+
 from SCons.Script import Environment, Builder
 
 from .addon import createAddonBundleFromPath
@@ -32,11 +39,12 @@ from .docs import md2html
 
 def generate(env: Environment):
 	env.SetDefault(excludePatterns=tuple())
+	env.SetDefault(addonCacheDir=os.path.join(".cache", "addon"))
 
 	addonAction = env.Action(
-		lambda target, source, env: createAddonBundleFromPath(
-			source[0].abspath, target[0].abspath, env["excludePatterns"]
-		) and None,
+		lambda target, source, env: print(createAddonBundleFromPath(
+			source[0].abspath, target[0].abspath, env["excludePatterns"], env["addonCacheDir"]
+		).describe()),
 		lambda target, source, env: f"Generating Addon {target[0]}",
 	)
 	env["BUILDERS"]["NVDAAddon"] = Builder(
@@ -83,6 +91,7 @@ def generate(env: Environment):
 	)
 
 	env.SetDefault(mdExtensions = {})
+	env.SetDefault(docsCacheDir=os.path.join(".cache", "docs"))
 
 	mdAction = env.Action(
 		lambda target, source, env: md2html(
@@ -91,6 +100,7 @@ def generate(env: Environment):
 			moFile=env["moFile"].path if env["moFile"] else None,
 			mdExtensions=env["mdExtensions"],
 			addon_info=env["addon_info"],
+			cacheDir=env["docsCacheDir"],
 		) and None,
 		lambda target, source, env: f"Generating {target[0]}",
 	)
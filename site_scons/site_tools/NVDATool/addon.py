@@ -1,7 +1,28 @@
-import zipfile
+import json
+import os
+import struct
+import zlib
 from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from .buildCache import ContentCache, contentKey
+
+
+# Part of every cache key; change it whenever the compressed data for the same file content changes.
+BUNDLE_FORMAT_VERSION = "1"
+COMPRESSION_LEVEL = 9
+# 1980-01-01 00:00:00, the earliest zip timestamp: years since 1980 << 9 | month << 5 | day.
+_FIXED_DOS_TIME = 0
+_FIXED_DOS_DATE = 1 << 5 | 1
+# A regular rw-r--r-- file, in the Unix attributes of an entry made on Unix (3).
+_EXTERNAL_ATTRIBUTES = 0o100644 << 16
+_VERSION_MADE_BY = 3 << 8 | 20
+_VERSION_NEEDED = 20
+_UTF8_NAME_FLAG = 1 << 11
+_ZIP_DEFLATED = 8
+_ZIP32_LIMIT = 0xFFFFFFFF
+_ZIP32_ENTRY_LIMIT = 0xFFFF
 
 
 def matchesNoPatterns(path: Path, patterns: Iterable[str]) -> bool:
@@ -9,16 +30,146 @@ def matchesNoPatterns(path: Path, patterns: Iterable[str]) -> bool:
 	return not any((path.match(pattern) for pattern in patterns))
 
 
-def createAddonBundleFromPath(path: str | Path, dest: str, excludePatterns: Iterable[str]):
-	"""Creates a bundle from a directory that contains an addon manifest file."""
+@dataclass
+class BundleChanges:
+	"""Entries of a bundle compared with the previous bundle built from the same directory."""
+	added: list[str] = field(default_factory=list)
+	changed: list[str] = field(default_factory=list)
+	removed: list[str] = field(default_factory=list)
+	unchanged: int = 0
+	# Entries whose compressed data was taken from the cache instead of being compressed again.
+	reused: int = 0
+
+	def describe(self) -> str:
+		lines = [
+			f"{len(self.added)} added, {len(self.changed)} changed, {len(self.removed)} removed, "
+			f"{self.unchanged} unchanged; {self.reused} entries reused from the cache"
+		]
+		lines.extend(f"  added: {name}" for name in self.added)
+		lines.extend(f"  changed: {name}" for name in self.changed)
+		lines.extend(f"  removed: {name}" for name in self.removed)
+		return "\n".join(lines)
+
+
+def _compress(data: bytes) -> bytes:
+	compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+	return compressor.compress(data) + compressor.flush()
+
+
+def _localHeader(name: bytes, flags: int, crc: int, compressedSize: int, size: int) -> bytes:
+	return struct.pack(
+		"<IHHHHHIIIHH",
+		0x04034B50,
+		_VERSION_NEEDED,
+		flags,
+		_ZIP_DEFLATED,
+		_FIXED_DOS_TIME,
+		_FIXED_DOS_DATE,
+		crc,
+		compressedSize,
+		size,
+		len(name),
+		0,
+	) + name
+
+
+def _centralHeader(name: bytes, flags: int, crc: int, compressedSize: int, size: int, offset: int) -> bytes:
+	return struct.pack(
+		"<IHHHHHHIIIHHHHHII",
+		0x02014B50,
+		_VERSION_MADE_BY,
+		_VERSION_NEEDED,
+		flags,
+		_ZIP_DEFLATED,
+		_FIXED_DOS_TIME,
+		_FIXED_DOS_DATE,
+		crc,
+		compressedSize,
+		size,
+		len(name),
+		0,
+		0,
+		0,
+		0,
+		_EXTERNAL_ATTRIBUTES,
+		offset,
+	) + name
+
+
+def createAddonBundleFromPath(
+		path: str | Path,
+		dest: str,
+		excludePatterns: Iterable[str],
+		cacheDir: str | Path | None = None,
+	) -> BundleChanges:
+	"""Creates a bundle from a directory that contains an addon manifest file.
+
+	Entries are sorted by name and carry a fixed timestamp and attributes, so the same files always give
+	the same bundle. With a cache directory, files compressed by an earlier build are not compressed again,
+	and the returned changes are relative to the previous bundle built from this directory.
+	"""
 	if isinstance(path, str):
 		path = Path(path)
 	basedir = path.absolute()
-	with zipfile.ZipFile(dest, "w", zipfile.ZIP_DEFLATED) as z:
-		for p in basedir.rglob("*"):
-			if p.is_dir():
-				continue
-			pathInBundle = p.relative_to(basedir)
-			if matchesNoPatterns(pathInBundle, excludePatterns):
-				z.write(p, pathInBundle)
-	return dest
+	excludePatterns = tuple(excludePatterns)
+	files: dict[str, Path] = {}
+	for p in basedir.rglob("*"):
+		if p.is_dir():
+			continue
+		pathInBundle = p.relative_to(basedir)
+		if matchesNoPatterns(pathInBundle, excludePatterns):
+			files[pathInBundle.as_posix()] = p
+
+	cache = ContentCache(cacheDir) if cacheDir else None
+	manifestKey = contentKey(BUNDLE_FORMAT_VERSION, "manifest", str(basedir))
+	previous: dict[str, str] = {}
+	if cache is not None and (stored := cache.get(manifestKey)) is not None:
+		previous = json.loads(stored)
+
+	changes = BundleChanges()
+	entryKeys: dict[str, str] = {}
+	parts: list[bytes] = []
+	central: list[bytes] = []
+	offset = 0
+	for name in sorted(files):
+		data = files[name].read_bytes()
+		key = contentKey(BUNDLE_FORMAT_VERSION, str(COMPRESSION_LEVEL), data)
+		entryKeys[name] = key
+		if name not in previous:
+			changes.added.append(name)
+		elif previous[name] != key:
+			changes.changed.append(name)
+		else:
+			changes.unchanged += 1
+		compressed = cache.get(key) if cache is not None else None
+		if compressed is None:
+			compressed = _compress(data)
+			if cache is not None:
+				cache.put(key, compressed)
+		else:
+			changes.reused += 1
+		if offset + len(compressed) > _ZIP32_LIMIT or len(data) > _ZIP32_LIMIT:
+			raise ValueError(f"{name} does not fit in a bundle without ZIP64 extensions")
+		encodedName = name.encode("utf-8")
+		flags = 0 if name.isascii() else _UTF8_NAME_FLAG
+		crc = zlib.crc32(data)
+		header = _localHeader(encodedName, flags, crc, len(compressed), len(data))
+		central.append(_centralHeader(encodedName, flags, crc, len(compressed), len(data), offset))
+		parts.append(header)
+		parts.append(compressed)
+		offset += len(header) + len(compressed)
+	changes.removed = sorted(set(previous) - set(entryKeys))
+	if len(central) > _ZIP32_ENTRY_LIMIT:
+		raise ValueError(f"{len(central)} files do not fit in a bundle without ZIP64 extensions")
+
+	directory = b"".join(central)
+	parts.append(directory)
+	parts.append(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central), len(directory), offset, 0))
+	# Written under a temporary name first, so an interrupted build never leaves a truncated bundle.
+	partial = f"{dest}.{os.getpid()}.tmp"
+	with open(partial, "wb") as f:
+		f.write(b"".join(parts))
+	os.replace(partial, dest)
+	if cache is not None:
+		cache.put(manifestKey, json.dumps(entryKeys, sort_keys=True).encode("utf-8"))
+	return changes
@@ -0,0 +1,39 @@
+import hashlib
+import os
+from pathlib import Path
+import threading
+
+
+
+def contentKey(*parts: bytes | str) -> str:
+	"""Returns a hex digest of the parts, each length-prefixed so that no two part lists collide."""
+	digest = hashlib.sha256()
+	for part in parts:
+		data = part.encode("utf-8") if isinstance(part, str) else part
+		digest.update(len(data).to_bytes(8, "little"))
+		digest.update(data)
+	return digest.hexdigest()
+
+
+class ContentCache:
+	"""Build outputs stored under their content key, kept between builds and restorable in CI."""
+
+	def __init__(self, directory: str | Path):
+		self.directory = Path(directory)
+
+	def _path(self, key: str) -> Path:
+		return self.directory / key[:2] / key
+
+	def get(self, key: str) -> bytes | None:
+		try:
+			return self._path(key).read_bytes()
+		except FileNotFoundError:
+			return None
+
+	def put(self, key: str, data: bytes) -> None:
+		path = self._path(key)
+		path.parent.mkdir(parents=True, exist_ok=True)
+		# Written under a name unique to this thread first, so parallel jobs never read a partial entry.
+		partial = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+		partial.write_bytes(data)
+		os.replace(partial, path)
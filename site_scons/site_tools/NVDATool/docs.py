@@ -1,12 +1,23 @@
 
 import gettext
+import json
 from pathlib import Path
 
 import markdown
 
+from .buildCache import ContentCache, contentKey
 from .typings import AddonInfo
 
 
+# Part of every cache key; change it whenever the HTML produced for the same inputs changes.
+DOCS_FORMAT_VERSION = "1"
+
+
+def docCacheKey(mdBytes: bytes, moBytes: bytes, mdExtensions: list[str], addon_info: AddonInfo, lang: str) -> str:
+	fields = json.dumps([addon_info["addon_summary"], addon_info["addon_version"], list(mdExtensions), lang])
+	return contentKey(DOCS_FORMAT_VERSION, fields, mdBytes, moBytes)
+
+
 
 def md2html(
 		source: str | Path,
@@ -14,7 +25,8 @@ def md2html(
 		*,
 		moFile: str | Path|None,
 		mdExtensions: list[str],
-		addon_info: AddonInfo
+		addon_info: AddonInfo,
+		cacheDir: str | Path | None = None,
 	):
 	if isinstance(source, str):
 		source = Path(source)
@@ -22,6 +34,17 @@ def md2html(
 		dest = Path(dest)
 	if isinstance(moFile, str):
 		moFile = Path(moFile)
+	lang = source.parent.name.replace("_", "-")
+
+	# HTML rendered before from the same markdown, catalog, extensions and add-on fields is reused.
+	cache = ContentCache(cacheDir) if cacheDir else None
+	if cache is not None:
+		mdBytes = source.read_bytes()
+		moBytes = moFile.read_bytes() if moFile is not None and moFile.is_file() else b""
+		key = docCacheKey(mdBytes, moBytes, mdExtensions, addon_info, lang)
+		if (cached := cache.get(key)) is not None:
+			dest.write_bytes(cached)
+			return
 
 	try:
 		with moFile.open("rb") as f:
@@ -32,7 +55,6 @@ def md2html(
 		summary = _(addon_info["addon_summary"])
 	version = addon_info["addon_version"]
 	title = f"{summary} {version}"
-	lang = source.parent.name.replace("_", "-")
 	headerDic = {
 		'[[!meta title="': "# ",
 		'"]]': " #",
@@ -57,5 +79,7 @@ def md2html(
 			"</body>\n</html>",
 		)
 	)
-	with dest.open("w", encoding="utf-8") as f:
-		f.write(docText) # type: ignore
+	docBytes = docText.encode("utf-8")
+	dest.write_bytes(docBytes)
+	if cache is not None:
+		cache.put(key, docBytes)
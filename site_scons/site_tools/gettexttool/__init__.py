@@ -13,172 +13,32 @@ To properly configure get text, define the following variables:
 - gettext_package_name
 - gettext_package_version
 
+Compiled .mo files are also kept in gettext_mo_cache_dir (default .cache/gettext), keyed on a hash
+of the .po content, so a fresh checkout or CI run copies unchanged locales instead of compiling them.
+Set it to an empty string to disable the cache.
+
 
 """
 
-import ast
-import struct
+import os
 
 from SCons.Action import Action
 
+from .mo import MSGFMT_COMPILER, PYTHON_COMPILER, compile_mo
+
 
 def exists(env):
 	return True
 
 
-def _finalize_message(
-	messages: dict[str, str],
-	*,
-	msgctxt: str | None,
-	msgid: str,
-	msgstr: str,
-	fuzzy: bool,
-) -> None:
-	if fuzzy:
-		return
-	if msgid == "":
-		# Keep the header message only when it has actual content.
-		if not msgstr:
-			return
-		key = msgid if msgctxt is None else f"{msgctxt}\x04{msgid}"
-		messages[key] = msgstr
-		return
-	if not msgstr:
-		return
-	key = msgid if msgctxt is None else f"{msgctxt}\x04{msgid}"
-	messages[key] = msgstr
-
-
-def _parse_po_file(po_path: str) -> dict[str, str]:
-	messages: dict[str, str] = {}
-	section: str | None = None
-	msgctxt: str | None = None
-	msgid = ""
-	msgstr = ""
-	fuzzy = False
-
-	with open(po_path, "r", encoding="utf-8") as po_file:
-		for line in po_file:
-			line = line.rstrip("\n")
-			stripped = line.strip()
-
-			if not stripped:
-				_finalize_message(
-					messages,
-					msgctxt=msgctxt,
-					msgid=msgid,
-					msgstr=msgstr,
-					fuzzy=fuzzy,
-				)
-				section = None
-				msgctxt = None
-				msgid = ""
-				msgstr = ""
-				fuzzy = False
-				continue
-
-			if stripped.startswith("#,") and "fuzzy" in stripped:
-				fuzzy = True
-				continue
-			if stripped.startswith("#"):
-				continue
-
-			if stripped.startswith("msgctxt "):
-				section = "msgctxt"
-				msgctxt = ast.literal_eval(stripped[7:].strip())
-				continue
-			if stripped.startswith("msgid_plural "):
-				section = "msgid"
-				msgid += "\x00" + ast.literal_eval(stripped[12:].strip())
-				continue
-			if stripped.startswith("msgid "):
-				_finalize_message(
-					messages,
-					msgctxt=msgctxt,
-					msgid=msgid,
-					msgstr=msgstr,
-					fuzzy=fuzzy,
-				)
-				section = "msgid"
-				msgid = ast.literal_eval(stripped[5:].strip())
-				msgstr = ""
-				fuzzy = False
-				continue
-			if stripped.startswith("msgstr["):
-				section = "msgstr"
-				payload = stripped.split("]", 1)[1].strip()
-				chunk = ast.literal_eval(payload)
-				if msgstr:
-					msgstr += "\x00"
-				msgstr += chunk
-				continue
-			if stripped.startswith("msgstr "):
-				section = "msgstr"
-				msgstr = ast.literal_eval(stripped[6:].strip())
-				continue
-			if stripped.startswith('"'):
-				chunk = ast.literal_eval(stripped)
-				if section == "msgctxt":
-					msgctxt = (msgctxt or "") + chunk
-				elif section == "msgid":
-					msgid += chunk
-				elif section == "msgstr":
-					msgstr += chunk
-				continue
-
-	_finalize_message(
-		messages,
-		msgctxt=msgctxt,
-		msgid=msgid,
-		msgstr=msgstr,
-		fuzzy=fuzzy,
+def _compile_mo(target, source, env):
+	compile_mo(
+		str(source[0]),
+		str(target[0]),
+		env["gettext_mo_compiler"],
+		cache_dir=env.subst("$gettext_mo_cache_dir") or None,
+		msgfmt=env["gettext_msgfmt"] or "msgfmt",
 	)
-	return messages
-
-
-def _write_mo_file(messages: dict[str, str], mo_path: str) -> None:
-	keys_blob = b""
-	vals_blob = b""
-	offsets: list[tuple[int, int, int, int]] = []
-	for key in sorted(messages):
-		key_data = key.encode("utf-8")
-		val_data = messages[key].encode("utf-8")
-		offsets.append((len(key_data), len(keys_blob), len(val_data), len(vals_blob)))
-		keys_blob += key_data + b"\x00"
-		vals_blob += val_data + b"\x00"
-
-	count = len(offsets)
-	ids_table_offset = 7 * 4
-	strs_table_offset = ids_table_offset + count * 8
-	keys_offset = strs_table_offset + count * 8
-	vals_offset = keys_offset + len(keys_blob)
-
-	with open(mo_path, "wb") as mo_file:
-		mo_file.write(
-			struct.pack(
-				"<Iiiiiii",
-				0x950412DE,
-				0,
-				count,
-				ids_table_offset,
-				strs_table_offset,
-				0,
-				0,
-			),
-		)
-		for key_len, key_pos, _, _ in offsets:
-			mo_file.write(struct.pack("<ii", key_len, keys_offset + key_pos))
-		for _, _, val_len, val_pos in offsets:
-			mo_file.write(struct.pack("<ii", val_len, vals_offset + val_pos))
-		mo_file.write(keys_blob)
-		mo_file.write(vals_blob)
-
-
-def _compile_mo_with_python(target, source, env):
-	po_path = str(source[0])
-	mo_path = str(target[0])
-	messages = _parse_po_file(po_path)
-	_write_mo_file(messages, mo_path)
 	return 0
 
 
@@ -196,12 +56,17 @@ def generate(env):
 	env.SetDefault(gettext_package_name="")
 	env.SetDefault(gettext_package_version="")
 
+	env.SetDefault(gettext_mo_cache_dir=os.path.join(".cache", "gettext"))
+
 	msgfmt_cmd = env.WhereIs("msgfmt")
+	env["gettext_msgfmt"] = msgfmt_cmd
 	if msgfmt_cmd:
-		mo_action = Action("msgfmt -o $TARGET $SOURCE", "Compiling translation $SOURCE")
+		env["gettext_mo_compiler"] = MSGFMT_COMPILER
+		mo_action = Action(_compile_mo, "Compiling translation $SOURCE")
 	else:
+		env["gettext_mo_compiler"] = PYTHON_COMPILER
 		mo_action = Action(
-			_compile_mo_with_python,
+			_compile_mo,
 			"Compiling translation $SOURCE (python fallback, msgfmt not found)",
 		)
 
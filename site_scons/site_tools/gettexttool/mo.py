@@ -0,0 +1,244 @@
+"""Compiling .po files to .mo files, with a cache of compiled files keyed on their content.
+
+Nothing here imports SCons, so the tests can load this module directly.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import struct
+import subprocess
+import unicodedata
+
+# Part of every cache key; change it whenever the Python compiler's output changes.
+PYTHON_COMPILER = "python-1"
+MSGFMT_COMPILER = "msgfmt"
+
+# The quoted string of a keyword or continuation line.
+_STRING_RE = re.compile(r'"((?:[^"\\]|\\.)*)"')
+_ESCAPE_RE = re.compile(
+	r"\\(?:([0-7]{1,3})|x([0-9A-Fa-f]{2})|u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|N\{([^}]*)\}|(.))",
+	re.DOTALL,
+)
+_SIMPLE_ESCAPES = {
+	"\n": "",
+	"\\": "\\",
+	"'": "'",
+	'"': '"',
+	"a": "\a",
+	"b": "\b",
+	"f": "\f",
+	"n": "\n",
+	"r": "\r",
+	"t": "\t",
+	"v": "\v",
+}
+
+
+def _replace_escape(match: re.Match) -> str:
+	octal, hex_byte, short_unicode, long_unicode, name, char = match.groups()
+	if octal is not None:
+		return chr(int(octal, 8))
+	if hex_byte is not None or short_unicode is not None or long_unicode is not None:
+		return chr(int(hex_byte or short_unicode or long_unicode, 16))
+	if name is not None:
+		return unicodedata.lookup(name)
+	# Unknown escapes keep their backslash, as Python string literals do.
+	return _SIMPLE_ESCAPES.get(char, "\\" + char)
+
+
+def _unescape(text: str) -> str:
+	# Same result as ast.literal_eval on the quoted string, without parsing Python.
+	if "\\" not in text:
+		return text
+	return _ESCAPE_RE.sub(_replace_escape, text)
+
+
+def _quoted(line: str, start: int) -> str:
+	match = _STRING_RE.search(line, start)
+	if match is None:
+		raise ValueError(f"Expected a quoted string: {line!r}")
+	return _unescape(match.group(1))
+
+
+def _finalize_message(
+	messages: dict[str, str],
+	*,
+	msgctxt: str | None,
+	msgid: str,
+	msgstr: str,
+	fuzzy: bool,
+) -> None:
+	if fuzzy:
+		return
+	if msgid == "":
+		# Keep the header message only when it has actual content.
+		if not msgstr:
+			return
+		key = msgid if msgctxt is None else f"{msgctxt}\x04{msgid}"
+		messages[key] = msgstr
+		return
+	if not msgstr:
+		return
+	key = msgid if msgctxt is None else f"{msgctxt}\x04{msgid}"
+	messages[key] = msgstr
+
+
+def _parse_po_file(po_path: str) -> dict[str, str]:
+	messages: dict[str, str] = {}
+	section: str | None = None
+	msgctxt: str | None = None
+	msgid = ""
+	msgstr = ""
+	fuzzy = False
+
+	with open(po_path, "r", encoding="utf-8") as po_file:
+		# Only newlines end a line; str.splitlines would also split quoted strings at U+2028 or form feeds.
+		lines = po_file.read().split("\n")
+
+	for line in lines:
+		stripped = line.strip()
+
+		if not stripped:
+			_finalize_message(
+				messages,
+				msgctxt=msgctxt,
+				msgid=msgid,
+				msgstr=msgstr,
+				fuzzy=fuzzy,
+			)
+			section = None
+			msgctxt = None
+			msgid = ""
+			msgstr = ""
+			fuzzy = False
+			continue
+
+		first = stripped[0]
+		if first == '"':
+			chunk = _quoted(stripped, 0)
+			if section == "msgctxt":
+				msgctxt = (msgctxt or "") + chunk
+			elif section == "msgid":
+				msgid += chunk
+			elif section == "msgstr":
+				msgstr += chunk
+			continue
+		if first == "#":
+			if stripped.startswith("#,") and "fuzzy" in stripped:
+				fuzzy = True
+			continue
+
+		if stripped.startswith("msgctxt "):
+			section = "msgctxt"
+			msgctxt = _quoted(stripped, 7)
+			continue
+		if stripped.startswith("msgid_plural "):
+			section = "msgid"
+			msgid += "\x00" + _quoted(stripped, 12)
+			continue
+		if stripped.startswith("msgid "):
+			_finalize_message(
+				messages,
+				msgctxt=msgctxt,
+				msgid=msgid,
+				msgstr=msgstr,
+				fuzzy=fuzzy,
+			)
+			section = "msgid"
+			msgid = _quoted(stripped, 5)
+			msgstr = ""
+			fuzzy = False
+			continue
+		if stripped.startswith("msgstr["):
+			section = "msgstr"
+			chunk = _quoted(stripped, stripped.index("]") + 1)
+			if msgstr:
+				msgstr += "\x00"
+			msgstr += chunk
+			continue
+		if stripped.startswith("msgstr "):
+			section = "msgstr"
+			msgstr = _quoted(stripped, 6)
+			continue
+
+	_finalize_message(
+		messages,
+		msgctxt=msgctxt,
+		msgid=msgid,
+		msgstr=msgstr,
+		fuzzy=fuzzy,
+	)
+	return messages
+
+
+def _write_mo_file(messages: dict[str, str], mo_path: str) -> None:
+	keys: list[bytes] = []
+	values: list[bytes] = []
+	offsets: list[tuple[int, int, int, int]] = []
+	keys_size = 0
+	values_size = 0
+	for key in sorted(messages):
+		key_data = key.encode("utf-8")
+		val_data = messages[key].encode("utf-8")
+		offsets.append((len(key_data), keys_size, len(val_data), values_size))
+		keys.append(key_data + b"\x00")
+		values.append(val_data + b"\x00")
+		keys_size += len(key_data) + 1
+		values_size += len(val_data) + 1
+
+	count = len(offsets)
+	ids_table_offset = 7 * 4
+	strs_table_offset = ids_table_offset + count * 8
+	keys_offset = strs_table_offset + count * 8
+	vals_offset = keys_offset + keys_size
+
+	parts = [
+		struct.pack(
+			"<Iiiiiii",
+			0x950412DE,
+			0,
+			count,
+			ids_table_offset,
+			strs_table_offset,
+			0,
+			0,
+		),
+	]
+	parts.extend(struct.pack("<ii", key_len, keys_offset + key_pos) for key_len, key_pos, _, _ in offsets)
+	parts.extend(struct.pack("<ii", val_len, vals_offset + val_pos) for _, _, val_len, val_pos in offsets)
+	parts.extend(keys)
+	parts.extend(values)
+	with open(mo_path, "wb") as mo_file:
+		mo_file.write(b"".join(parts))
+
+
+def content_hash(po_path: str, compiler: str) -> str:
+	digest = hashlib.sha256(compiler.encode("utf-8") + b"\x00")
+	with open(po_path, "rb") as po_file:
+		digest.update(po_file.read())
+	return digest.hexdigest()
+
+
+def compile_mo(po_path: str, mo_path: str, compiler: str, cache_dir: str | None = None, msgfmt: str = "msgfmt") -> bool:
+	# Compiles po_path with msgfmt or the Python compiler into mo_path.
+	# With a cache directory, a .po whose content was compiled before is copied from the cache instead;
+	# returns whether it was. Raises RuntimeError when msgfmt fails.
+	cached = os.path.join(cache_dir, content_hash(po_path, compiler) + ".mo") if cache_dir else None
+	if cached and os.path.isfile(cached):
+		shutil.copyfile(cached, mo_path)
+		return True
+	if compiler == MSGFMT_COMPILER:
+		result = subprocess.run([msgfmt, "-o", mo_path, po_path], capture_output=True, text=True)
+		if result.returncode:
+			raise RuntimeError(f"msgfmt failed for {po_path}: {result.stderr.strip()}")
+	else:
+		_write_mo_file(_parse_po_file(po_path), mo_path)
+	if cached:
+		os.makedirs(cache_dir, exist_ok=True)
+		# Written under a temporary name first, so parallel builds never read a partial file.
+		partial = f"{cached}.{os.getpid()}.tmp"
+		shutil.copyfile(mo_path, partial)
+		os.replace(partial, cached)
+	return False
@@ -0,0 +1,30 @@
+"""This tool generates the precomputed syllable tables of the add-on.
+
+One builder is added into the constructed environment:
+
+- HangulTables: writes the target tables module, normally addon/globalPlugins/_hangulTables.py,
+  from Unicode data, given the path to _hangulSplitterCore.py as the source.
+  The tables are checked against the L/V/T arithmetic of the core for all 11,172 syllables,
+  and the build fails if any syllable disagrees.
+
+"""
+
+from SCons.Script import Builder, Environment
+
+from .tables import writeTablesModule
+
+
+def generate(env: Environment):
+	tablesAction = env.Action(
+		lambda target, source, env: writeTablesModule(source[0].abspath, target[0].abspath) and None,
+		lambda target, source, env: f"Generating Hangul tables {target[0]}",
+	)
+	env["BUILDERS"]["HangulTables"] = Builder(
+		action=tablesAction,
+		suffix=".py",
+		src_suffix=".py",
+	)
+
+
+def exists(env):
+	return True
@@ -0,0 +1,119 @@
+"""Generation and checking of addon/globalPlugins/_hangulTables.py.
+
+The jamo of every syllable are read from Unicode data: the canonical decomposition of the syllable
+into conjoining jamo, each mapped by name to its compatibility letter (HANGUL CHOSEONG KIYEOK to
+HANGUL LETTER KIYEOK). The split tables then apply the default decomposition rules of the core.
+Nothing here imports SCons, so the tests can load this module directly.
+"""
+
+import importlib.util
+from pathlib import Path
+import sys
+from types import ModuleType
+import unicodedata
+
+
+S_BASE = 0xAC00
+S_COUNT = 11172
+# Syllables per leading consonant; the generated strings break lines there.
+_LINE_SYLLABLES = 21 * 28
+_JAMO_NAME_PARTS = ("CHOSEONG ", "JUNGSEONG ", "JONGSEONG ")
+
+
+def loadCoreModule(corePath: str | Path) -> ModuleType:
+	# Loaded on its own, outside the globalPlugins package, so it cannot pick up a previously
+	# generated tables module and always computes its tables from the L/V/T arithmetic.
+	spec = importlib.util.spec_from_file_location("_hangulSplitterCoreForTables", corePath)
+	module = importlib.util.module_from_spec(spec)
+	# Dataclasses look their module up while the module is executing.
+	sys.modules[spec.name] = module
+	try:
+		spec.loader.exec_module(module)
+	finally:
+		del sys.modules[spec.name]
+	return module
+
+
+def compatibilityLetter(jamo: str) -> str:
+	name = unicodedata.name(jamo)
+	for part in _JAMO_NAME_PARTS:
+		name = name.replace(part, "LETTER ")
+	return unicodedata.lookup(name)
+
+
+def unicodeSyllableJamo() -> list[str]:
+	return [
+		"".join(compatibilityLetter(jamo) for jamo in unicodedata.normalize("NFD", chr(S_BASE + index)))
+		for index in range(S_COUNT)
+	]
+
+
+def applyRules(table: list[str], rules: tuple[tuple[str, str], ...]) -> list[str]:
+	letterTable = {ord(letter): replacement for letter, replacement in rules}
+	return [jamo.translate(letterTable) for jamo in table]
+
+
+def _stringLiteral(entries: list[str]) -> str:
+	# One source line per leading consonant; adjacent literals compile to a single constant.
+	lines: list[str] = []
+	for start in range(0, len(entries), _LINE_SYLLABLES):
+		text = "\n".join(entries[start : start + _LINE_SYLLABLES])
+		if start + _LINE_SYLLABLES < len(entries):
+			text += "\n"
+		lines.append("\t" + repr(text))
+	return "(\n" + "\n".join(lines) + "\n)"
+
+
+def _spaced(table: list[str]) -> list[str]:
+	return [" ".join(jamo) for jamo in table]
+
+
+def renderTablesModule(splitRules: tuple[tuple[str, str], ...]) -> str:
+	plain = unicodeSyllableJamo()
+	split = applyRules(plain, splitRules)
+	return (
+		f"# Generated by site_scons/site_tools/hangulTables from Unicode {unicodedata.unidata_version} data. Do not edit.\n"
+		"# Jamo of each syllable from U+AC00 in order, one syllable per line of each string;\n"
+		"# the _SPLIT tables apply SPLIT_RULES and the _SPACED ones put spaces between letters.\n"
+		"\n"
+		f"UNICODE_VERSION = {unicodedata.unidata_version!r}\n"
+		f"SPLIT_RULES = {splitRules!r}\n"
+		"\n"
+		f"SYLLABLE_JAMO = {_stringLiteral(plain)}\n"
+		"\n"
+		f"SYLLABLE_JAMO_SPACED = {_stringLiteral(_spaced(plain))}\n"
+		"\n"
+		f"SYLLABLE_JAMO_SPLIT = {_stringLiteral(split)}\n"
+		"\n"
+		f"SYLLABLE_JAMO_SPLIT_SPACED = {_stringLiteral(_spaced(split))}\n"
+	)
+
+
+def checkTables(tables: ModuleType, core: ModuleType) -> list[str]:
+	# Differences between the generated tables and the arithmetic of the core, one line each.
+	problems: list[str] = []
+	if tables.SPLIT_RULES != core.DEFAULT_DECOMPOSITION_RULES:
+		problems.append("SPLIT_RULES differ from DEFAULT_DECOMPOSITION_RULES")
+	for name, rules in (("SYLLABLE_JAMO", ()), ("SYLLABLE_JAMO_SPLIT", core.DEFAULT_DECOMPOSITION_RULES)):
+		expected = core.compile_syllable_table(rules)
+		for tableName, expectedTable in ((name, expected), (f"{name}_SPACED", _spaced(list(expected)))):
+			generated = getattr(tables, tableName).split("\n")
+			if len(generated) != S_COUNT:
+				problems.append(f"{tableName} has {len(generated)} syllables instead of {S_COUNT}")
+				continue
+			for index, (jamo, expectedJamo) in enumerate(zip(generated, expectedTable)):
+				if jamo != expectedJamo:
+					problems.append(f"{tableName}: U+{S_BASE + index:04X} is {jamo!r}, the core computes {expectedJamo!r}")
+	return problems
+
+
+def writeTablesModule(corePath: str | Path, targetPath: str | Path) -> None:
+	# Raises ValueError, which fails the build, when the tables disagree with the core.
+	core = loadCoreModule(corePath)
+	source = renderTablesModule(core.DEFAULT_DECOMPOSITION_RULES)
+	tables = ModuleType("_hangulTables")
+	exec(compile(source, str(targetPath), "exec"), tables.__dict__)
+	problems = checkTables(tables, core)
+	if problems:
+		raise ValueError("Generated Hangul tables disagree with the core:\n" + "\n".join(problems[:20]))
+	Path(targetPath).write_text(source, encoding="utf-8", newline="\n")
@@ -0,0 +1,334 @@
+"""Headless driver for the global plugin, built on the stub modules in tests/nvda_stubs.
+
+Usage:
+
+	from nvda_harness import FakeDocument, PluginHarness
+
+	with PluginHarness() as harness:
+		harness.focus(FakeDocument("한글 문서\\n둘째 줄", caret=1, latency=0.001))
+		harness.press("describeSplitHangul")
+		print(harness.speech.spoken_text())
+
+`FakeDocument` answers `makeTextInfo` with offset-based TextInfos over an in-memory string.
+Every TextInfo call that would cross into the application in real NVDA sleeps for `latency` seconds
+and is counted in `document.calls`, so slow applications can be simulated.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+import importlib
+import json
+from pathlib import Path
+import random
+import subprocess
+import sys
+import time
+from types import ModuleType
+from typing import Any
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+STUBS_DIR = Path(__file__).resolve().parent / "nvda_stubs"
+
+PLUGIN_MODULE = "globalPlugins.hangulBlockSplitter"
+# Imported before timing startup; in NVDA these are loaded long before any add-on.
+STUB_MODULES = (
+	"addonHandler",
+	"api",
+	"config",
+	"globalPluginHandler",
+	"globalVars",
+	"gui",
+	"languageHandler",
+	"logHandler",
+	"scriptHandler",
+	"speech",
+	"textInfos",
+	"treeInterceptorHandler",
+	"ui",
+	"wx",
+)
+
+_STARTUP_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {harness_dir!r})
+import nvda_harness
+nvda_harness.install()
+for name in nvda_harness.STUB_MODULES:
+	__import__(name)
+before = set(sys.modules)
+started = time.perf_counter()
+module = nvda_harness.load_plugin_module()
+imported = time.perf_counter()
+plugin = module.GlobalPlugin()
+initialized = time.perf_counter()
+loaded = sorted(set(sys.modules) - before)
+print(json.dumps({{
+	"importMs": (imported - started) * 1000,
+	"initMs": (initialized - imported) * 1000,
+	"modules": loaded,
+}}))
+"""
+
+_SAMPLE_WORDS = ("한글", "분해기", "읽기", "괜찮아요", "값", "NVDA", "테스트", "닭", "123", "훑어보기")
+
+
+def install() -> None:
+	for path in (str(ADDON_DIR), str(STUBS_DIR)):
+		if path not in sys.path:
+			sys.path.insert(0, path)
+
+
+def load_plugin_module() -> ModuleType:
+	install()
+	return importlib.import_module(PLUGIN_MODULE)
+
+
+def stub(name: str) -> Any:
+	install()
+	return importlib.import_module(name)
+
+
+def reset_stubs() -> None:
+	install()
+	stub("wx").reset()
+	stub("speech").reset()
+	stub("gui").reset()
+	stub("config").conf.reset()
+	stub("ui").messages.clear()
+	stub("logHandler").log.records.clear()
+	api = stub("api")
+	api.focusObject = None
+	api.reviewPosition = None
+	api.clipboard.clear()
+	api.clipboardWorks = True
+	stub("scriptHandler").lastScriptRepeatCount = 0
+	stub("languageHandler").language = "en"
+	plugin_module = sys.modules.get(PLUGIN_MODULE)
+	if plugin_module is not None:
+		# Module-level caches outlive a plugin instance, as they do across NVDA plugin reloads.
+		plugin_module._settings.invalidate()
+		plugin_module._settings.invalidate_language()
+
+
+def measure_startup() -> dict[str, Any]:
+	# Imports the plugin and constructs GlobalPlugin in a fresh interpreter, as NVDA does at startup.
+	script = _STARTUP_SCRIPT.format(harness_dir=str(Path(__file__).resolve().parent))
+	output = subprocess.run(
+		[sys.executable, "-X", "utf8", "-c", script],
+		check=True,
+		capture_output=True,
+		text=True,
+	).stdout
+	return json.loads(output.strip().splitlines()[-1])
+
+
+def make_document_text(size: int, seed: int = 0, line_length: int = 80) -> str:
+	rng = random.Random(seed)
+	lines: list[str] = []
+	length = 0
+	while length < size:
+		words: list[str] = []
+		line_size = 0
+		while line_size < line_length:
+			word = rng.choice(_SAMPLE_WORDS)
+			words.append(word)
+			line_size += len(word) + 1
+		line = " ".join(words)
+		lines.append(line)
+		length += len(line) + 1
+	return "\n".join(lines)[:size]
+
+
+@dataclass(frozen=True)
+class _Bookmark:
+	# Equal for equal ranges, like NVDA's offsets bookmarks.
+	startOffset: int
+	endOffset: int
+
+
+class FakeTextInfo:
+	def __init__(self, document: FakeDocument, start: int, end: int):
+		self.document = document
+		self._start = start
+		self._end = end
+
+	@property
+	def isCollapsed(self) -> bool:
+		return self._start == self._end
+
+	@property
+	def bookmark(self) -> _Bookmark:
+		return _Bookmark(self._start, self._end)
+
+	@property
+	def text(self) -> str:
+		self.document._call("text")
+		return self.document.text[self._start : self._end]
+
+	def copy(self) -> FakeTextInfo:
+		return FakeTextInfo(self.document, self._start, self._end)
+
+	def expand(self, unit: str) -> None:
+		self.document._call("expand")
+		self._start, self._end = self.document._unit_bounds(self._start, unit)
+
+	def collapse(self, end: bool = False) -> None:
+		if end:
+			self._start = self._end
+		else:
+			self._end = self._start
+
+	def move(self, unit: str, direction: int, endPoint: str | None = None) -> int:
+		self.document._call("move")
+		position = self._start
+		moved = 0
+		while moved != direction:
+			if direction > 0:
+				next_position = self.document._unit_bounds(position, unit)[1]
+				if next_position == position:
+					break
+				moved += 1
+			else:
+				if position == 0:
+					break
+				next_position = self.document._unit_bounds(position - 1, unit)[0]
+				moved -= 1
+			position = next_position
+		self._start = self._end = position
+		return moved
+
+	def getTextInChunks(self, unit: str):
+		position = self._start
+		while position < self._end:
+			self.document._call("chunk")
+			_start, end = self.document._unit_bounds(position, unit)
+			end = min(max(end, position + 1), self._end)
+			yield self.document.text[position:end]
+			position = end
+
+
+class FakeDocument:
+	def __init__(
+		self,
+		text: str,
+		caret: int = 0,
+		selection: tuple[int, int] | None = None,
+		latency: float = 0.0,
+	):
+		self.text = text
+		self.caret = caret
+		self.selection = selection
+		self.latency = latency
+		self.treeInterceptor = None
+		self.calls: Counter[str] = Counter()
+
+	def _call(self, kind: str) -> None:
+		self.calls[kind] += 1
+		if self.latency:
+			time.sleep(self.latency)
+
+	def makeTextInfo(self, position: Any) -> FakeTextInfo:
+		self._call("makeTextInfo")
+		textInfos = stub("textInfos")
+		if position == textInfos.POSITION_CARET:
+			return FakeTextInfo(self, self.caret, self.caret)
+		if position == textInfos.POSITION_SELECTION:
+			start, end = self.selection or (self.caret, self.caret)
+			return FakeTextInfo(self, start, end)
+		if position == textInfos.POSITION_ALL:
+			return FakeTextInfo(self, 0, len(self.text))
+		if position == textInfos.POSITION_FIRST:
+			return FakeTextInfo(self, 0, 0)
+		if position == textInfos.POSITION_LAST:
+			return FakeTextInfo(self, len(self.text), len(self.text))
+		raise NotImplementedError(position)
+
+	def _unit_bounds(self, offset: int, unit: str) -> tuple[int, int]:
+		textInfos = stub("textInfos")
+		text = self.text
+		offset = max(0, min(offset, len(text)))
+		if unit == textInfos.UNIT_STORY:
+			return 0, len(text)
+		if unit == textInfos.UNIT_CHARACTER:
+			return offset, min(offset + 1, len(text))
+		if unit in (textInfos.UNIT_LINE, textInfos.UNIT_PARAGRAPH):
+			start = text.rfind("\n", 0, offset) + 1
+			end = text.find("\n", offset)
+			return start, len(text) if end < 0 else end + 1
+		if unit == textInfos.UNIT_WORD:
+			start = offset
+			while start > 0 and not text[start - 1].isspace():
+				start -= 1
+			end = offset
+			while end < len(text) and not text[end].isspace():
+				end += 1
+			while end < len(text) and text[end] == " ":
+				end += 1
+			return start, end
+		raise NotImplementedError(unit)
+
+
+class PluginHarness:
+	# Owns one GlobalPlugin instance over freshly reset stubs.
+
+	def __init__(self):
+		reset_stubs()
+		self.module = load_plugin_module()
+		self.api = stub("api")
+		self.config = stub("config")
+		self.languageHandler = stub("languageHandler")
+		self.scriptHandler = stub("scriptHandler")
+		self.speech = stub("speech")
+		self.ui = stub("ui")
+		self.wx = stub("wx")
+		self.plugin = self.module.GlobalPlugin()
+
+	def __enter__(self) -> PluginHarness:
+		return self
+
+	def __exit__(self, *exc_info: Any) -> None:
+		self.close()
+
+	def close(self) -> None:
+		self.plugin.terminate()
+		self.wx.run_pending()
+
+	def focus(self, document: FakeDocument) -> None:
+		self.api.focusObject = document
+		self.plugin.event_gainFocus(document, lambda: None)
+
+	def set_option(self, key: str, value: Any) -> None:
+		self.module._get_conf_section()[key] = value
+
+	def press(self, script_name: str, repeat: int = 0, settle: bool = True) -> None:
+		self.scriptHandler.lastScriptRepeatCount = repeat
+		getattr(self.plugin, f"script_{script_name}")(None)
+		if settle:
+			self.settle()
+
+	def move_caret(self, document: FakeDocument, offset: int, settle: bool = True) -> None:
+		document.caret = offset
+		self.plugin.event_caret(document, lambda: None)
+		if settle:
+			self.settle()
+
+	def settle(self, timeout: float = 10.0) -> None:
+		# Runs the main loop until the worker is idle, no calls are queued and speech has drained.
+		deadline = time.monotonic() + timeout
+		while True:
+			if not self.plugin._split_worker.wait_idle(max(0.0, deadline - time.monotonic())):
+				raise TimeoutError("Split worker did not finish")
+			ran = self.wx.run_pending()
+			ran += self.speech.reach_callbacks()
+			if not ran and self.plugin._split_worker.wait_idle(0) and not self.wx.pending_calls:
+				return
+			if time.monotonic() > deadline:
+				raise TimeoutError("Plugin did not settle")
+
+	@property
+	def dialog(self) -> Any:
+		return self.plugin._dialog
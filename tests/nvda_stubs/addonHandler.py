@@ -0,0 +1,5 @@
+import builtins
+
+
+def initTranslation() -> None:
+	builtins.__dict__.setdefault("_", lambda text: text)
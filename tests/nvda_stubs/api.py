@@ -0,0 +1,21 @@
+focusObject = None
+reviewPosition = None
+clipboard: list[str] = []
+clipboardWorks = True
+
+
+def getFocusObject():
+	return focusObject
+
+
+def getReviewPosition():
+	if reviewPosition is None:
+		raise RuntimeError("No review position")
+	return reviewPosition
+
+
+def copyToClip(text: str, notify: bool = False) -> bool:
+	if not clipboardWorks:
+		return False
+	clipboard.append(text)
+	return True
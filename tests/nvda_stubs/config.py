@@ -0,0 +1,75 @@
+import re
+
+
+_DEFAULT_RE = re.compile(r"^(?P<kind>\w+)\(default=(?P<value>.*)\)$")
+
+
+def _default_for(spec: str):
+	match = _DEFAULT_RE.match(spec)
+	if match is None:
+		return None
+	kind, value = match.group("kind"), match.group("value")
+	if kind == "boolean":
+		return value == "True"
+	if kind == "integer":
+		return int(value)
+	return value.strip("\"'")
+
+
+class _Section(dict):
+	def __init__(self, spec: dict):
+		super().__init__()
+		self._spec = spec
+		self.writes = 0
+		self.reads = 0
+
+	def __getitem__(self, key):
+		self.reads += 1
+		if key not in self:
+			return _default_for(self._spec[key])
+		return super().__getitem__(key)
+
+	def __setitem__(self, key, value):
+		self.writes += 1
+		super().__setitem__(key, value)
+
+
+class _Config:
+	def __init__(self):
+		self.spec: dict = {}
+		self._sections: dict[str, _Section] = {}
+
+	def __getitem__(self, name: str) -> _Section:
+		section = self._sections.get(name)
+		if section is None:
+			section = self._sections[name] = _Section(self.spec.setdefault(name, {}))
+		return section
+
+	def reset(self) -> None:
+		self.spec.clear()
+		self._sections.clear()
+
+
+conf = _Config()
+
+
+class _Action:
+	def __init__(self):
+		self.handlers: list = []
+
+	def register(self, handler) -> None:
+		if handler not in self.handlers:
+			self.handlers.append(handler)
+
+	def unregister(self, handler) -> None:
+		if handler in self.handlers:
+			self.handlers.remove(handler)
+
+	def notify(self, **kwargs) -> None:
+		for handler in list(self.handlers):
+			handler(**kwargs)
+
+
+post_configProfileSwitch = _Action()
+post_configReset = _Action()
+post_configSave = _Action()
@@ -0,0 +1,6 @@
+class GlobalPlugin:
+	def __init__(self):
+		self.terminated = False
+
+	def terminate(self):
+		self.terminated = True
@@ -0,0 +1,33 @@
+import types
+
+import wx
+
+from . import guiHelper, settingsDialogs
+
+
+def _make_main_frame():
+	sys_tray_icon = wx.Window()
+	sys_tray_icon.toolsMenu = wx.Menu()
+	return types.SimpleNamespace(sysTrayIcon=sys_tray_icon)
+
+
+mainFrame = _make_main_frame()
+
+
+def runScriptModalDialog(dialog, callback=None) -> None:
+	def run() -> None:
+		result = dialog.ShowModal()
+		if callback:
+			callback(result)
+		dialog.Destroy()
+
+	wx.CallAfter(run)
+
+
+def reset() -> None:
+	global mainFrame
+	mainFrame = _make_main_frame()
+	settingsDialogs.NVDASettingsDialog.categoryClasses.clear()
+
+
+__all__ = ["guiHelper", "mainFrame", "runScriptModalDialog", "settingsDialogs"]
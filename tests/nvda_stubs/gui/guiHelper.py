@@ -0,0 +1,17 @@
+import wx
+
+
+class BoxSizerHelper:
+	def __init__(self, parent, orientation=None, sizer=None):
+		self.parent = parent
+		self.sizer = sizer or wx.BoxSizer(orientation)
+
+	def addItem(self, item, **kwargs):
+		self.sizer.Add(item, **kwargs)
+		return item
+
+	def addLabeledControl(self, labelText: str, wxCtrlClass, **kwargs):
+		control = wxCtrlClass(self.parent, **kwargs)
+		control.labelText = labelText
+		self.sizer.Add(control)
+		return control
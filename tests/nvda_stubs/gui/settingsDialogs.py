@@ -0,0 +1,20 @@
+import wx
+
+
+class SettingsPanel(wx.Panel):
+	title = ""
+
+	def __init__(self, parent=None):
+		super().__init__(parent)
+		self.settingsSizer = wx.BoxSizer(wx.VERTICAL)
+		self.makeSettings(self.settingsSizer)
+
+	def makeSettings(self, settingsSizer) -> None:
+		raise NotImplementedError
+
+	def onSave(self) -> None:
+		pass
+
+
+class NVDASettingsDialog:
+	categoryClasses: list = []
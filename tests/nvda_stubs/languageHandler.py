@@ -0,0 +1,5 @@
+language = "en"
+
+
+def getLanguage() -> str:
+	return language
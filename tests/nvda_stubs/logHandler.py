@@ -0,0 +1,24 @@
+class _Log:
+	def __init__(self):
+		self.records: list[tuple[str, str]] = []
+
+	def _record(self, level: str, message: str, *args, **kwargs) -> None:
+		self.records.append((level, message))
+
+	def debug(self, message: str, *args, **kwargs) -> None:
+		self._record("debug", message)
+
+	def info(self, message: str, *args, **kwargs) -> None:
+		self._record("info", message)
+
+	def warning(self, message: str, *args, **kwargs) -> None:
+		self._record("warning", message)
+
+	def error(self, message: str, *args, **kwargs) -> None:
+		self._record("error", message)
+
+	def exception(self, message: str, *args, **kwargs) -> None:
+		self._record("error", message)
+
+
+log = _Log()
@@ -0,0 +1,16 @@
+lastScriptRepeatCount = 0
+
+
+def getLastScriptRepeatCount() -> int:
+	return lastScriptRepeatCount
+
+
+def script(description: str = "", gesture: str | None = None, gestures=None, **kwargs):
+	def decorator(func):
+		func.__doc__ = description
+		func.category = kwargs.get("category")
+		func.gestures = [gesture] if gesture else list(gestures or ())
+		func.speakOnDemand = kwargs.get("speakOnDemand", False)
+		return func
+
+	return decorator
@@ -0,0 +1,53 @@
+from .commands import CallbackCommand
+
+
+# Every sequence passed to speak, in order. Callback commands stay in place so the harness
+# can run them as if the synthesizer had reached that point.
+spoken: list[list] = []
+spelled: list[str] = []
+
+
+def getSpellingSpeech(text: str, locale=None, useCharacterDescriptions: bool = False):
+	return list(text)
+
+
+def speak(sequence, *args, **kwargs) -> None:
+	spoken.append(list(sequence))
+
+
+def speakSpelling(text: str, *args, **kwargs) -> None:
+	spelled.append(text)
+
+
+def cancelSpeech() -> None:
+	pass
+
+
+def spoken_text() -> str:
+	return "".join(item for sequence in spoken for item in sequence if isinstance(item, str))
+
+
+_reached = 0
+
+
+def reach_callbacks() -> int:
+	# Runs callback commands of sequences not yet reached, in queue order, as if they had been spoken.
+	global _reached
+	count = 0
+	while _reached < len(spoken):
+		for item in spoken[_reached]:
+			if isinstance(item, CallbackCommand) and not item.ran:
+				item.run()
+				count += 1
+		_reached += 1
+	return count
+
+
+def reset() -> None:
+	global _reached
+	spoken.clear()
+	spelled.clear()
+	_reached = 0
+
+
+__all__ = ["CallbackCommand", "getSpellingSpeech", "speak", "speakSpelling", "spoken", "spelled"]
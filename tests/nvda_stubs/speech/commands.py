@@ -0,0 +1,14 @@
+class CallbackCommand:
+	def __init__(self, callback, name: str | None = None):
+		self._callback = callback
+		self.name = name
+		self.ran = False
+
+	def run(self) -> None:
+		self.ran = True
+		self._callback()
+
+
+class EndUtteranceCommand:
+	def __repr__(self) -> str:
+		return "EndUtteranceCommand()"
@@ -0,0 +1,15 @@
+POSITION_FIRST = "first"
+POSITION_LAST = "last"
+POSITION_CARET = "caret"
+POSITION_SELECTION = "selection"
+POSITION_ALL = "all"
+
+UNIT_CHARACTER = "character"
+UNIT_WORD = "word"
+UNIT_LINE = "line"
+UNIT_PARAGRAPH = "paragraph"
+UNIT_STORY = "story"
+
+
+class TextInfo:
+	pass
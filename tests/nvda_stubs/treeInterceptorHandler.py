@@ -0,0 +1,6 @@
+class TreeInterceptor:
+	passThrough = False
+
+
+class DocumentTreeInterceptor(TreeInterceptor):
+	pass
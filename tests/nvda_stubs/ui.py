@@ -0,0 +1,5 @@
+messages: list[str] = []
+
+
+def message(text: str, *args, **kwargs) -> None:
+	messages.append(text)
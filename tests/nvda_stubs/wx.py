@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Callable
+
+
+ID_ANY = -1
+ID_OK = 5100
+ID_CANCEL = 5101
+
+VERTICAL = 8
+HORIZONTAL = 4
+LEFT = 0x10
+RIGHT = 0x20
+TOP = 0x40
+BOTTOM = 0x80
+ALL = LEFT | RIGHT | TOP | BOTTOM
+EXPAND = 0x2000
+TE_MULTILINE = 0x20
+TE_READONLY = 0x10
+WXK_ESCAPE = 27
+FD_SAVE = 0x2
+FD_OVERWRITE_PROMPT = 0x4
+
+EVT_BUTTON = "EVT_BUTTON"
+EVT_CHECKBOX = "EVT_CHECKBOX"
+EVT_CHAR_HOOK = "EVT_CHAR_HOOK"
+EVT_CLOSE = "EVT_CLOSE"
+EVT_MENU = "EVT_MENU"
+EVT_TEXT = "EVT_TEXT"
+
+# Calls queued by CallAfter, and timers started by CallLater, until the harness runs them.
+pending_calls: deque[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]] = deque()
+pending_timers: list[CallLater] = []
+
+
+def CallAfter(func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+	pending_calls.append((func, args, kwargs))
+
+
+class CallLater:
+	def __init__(self, millis: int, func: Callable[..., Any], *args: Any, **kwargs: Any):
+		self.millis = millis
+		self._func = func
+		self._args = args
+		self._kwargs = kwargs
+		self.running = True
+		pending_timers.append(self)
+
+	def Stop(self) -> None:
+		self.running = False
+
+	def IsRunning(self) -> bool:
+		return self.running
+
+	def fire(self) -> None:
+		if self.running:
+			self.running = False
+			self._func(*self._args, **self._kwargs)
+
+
+def run_pending(include_timers: bool = True, limit: int = 100000) -> int:
+	# Runs queued calls, and then due timers, until nothing is left.
+	ran = 0
+	while ran < limit:
+		if pending_calls:
+			func, args, kwargs = pending_calls.popleft()
+			func(*args, **kwargs)
+			ran += 1
+			continue
+		if include_timers:
+			timers = [timer for timer in pending_timers if timer.running]
+			pending_timers.clear()
+			if timers:
+				for timer in timers:
+					timer.fire()
+					ran += 1
+				continue
+		break
+	return ran
+
+
+def reset() -> None:
+	pending_calls.clear()
+	pending_timers.clear()
+	FileDialog.next_path = None
+
+
+class Event:
+	def __init__(self, source: Any = None, keyCode: int = 0):
+		self.source = source
+		self._key_code = keyCode
+		self.skipped = False
+
+	def Skip(self, skip: bool = True) -> None:
+		self.skipped = skip
+
+	def GetKeyCode(self) -> int:
+		return self._key_code
+
+
+CommandEvent = Event
+KeyEvent = Event
+CloseEvent = Event
+
+
+class _Bindable:
+	def __init__(self):
+		self._handlers: dict[str, list[tuple[Callable[[Event], Any], Any]]] = {}
+
+	def Bind(self, event_type: str, handler: Callable[[Event], Any], source: Any = None, *args: Any) -> None:
+		self._handlers.setdefault(event_type, []).append((handler, source))
+
+	def Unbind(self, event_type: str, source: Any = None, handler: Any = None, *args: Any) -> bool:
+		handlers = self._handlers.get(event_type, [])
+		kept = [
+			(bound, bound_source)
+			for bound, bound_source in handlers
+			if not ((handler is None or bound == handler) and (source is None or bound_source is source))
+		]
+		self._handlers[event_type] = kept
+		return len(kept) != len(handlers)
+
+	def fire(self, event_type: str, event: Event | None = None, source: Any = None) -> Event:
+		event = event or Event(source)
+		for handler, bound_source in list(self._handlers.get(event_type, ())):
+			if bound_source is None or bound_source is source:
+				handler(event)
+		return event
+
+
+class Window(_Bindable):
+	def __init__(self, parent: Window | None = None, *args: Any, **kwargs: Any):
+		super().__init__()
+		self.parent = parent
+		self.label = kwargs.get("label", "")
+		self.destroyed = False
+		self.shown = False
+
+	def SetSizer(self, sizer: Any) -> None:
+		self.sizer = sizer
+
+	def SetMinSize(self, size: Any) -> None:
+		pass
+
+	def SetSize(self, size: Any) -> None:
+		pass
+
+	def SetFocus(self) -> None:
+		pass
+
+	def Raise(self) -> None:
+		pass
+
+	def Show(self, show: bool = True) -> bool:
+		self.shown = show
+		return True
+
+	def Destroy(self) -> bool:
+		self.destroyed = True
+		return True
+
+	def SetLabel(self, label: str) -> None:
+		self.label = label
+
+	def GetLabel(self) -> str:
+		return self.label
+
+	def __bool__(self) -> bool:
+		return not self.destroyed
+
+
+class Panel(Window):
+	pass
+
+
+class Dialog(Window):
+	def __init__(self, parent: Window | None = None, *args: Any, **kwargs: Any):
+		super().__init__(parent, *args, **kwargs)
+		self.title = kwargs.get("title", "")
+
+	def SetEscapeId(self, id: int) -> None:
+		pass
+
+	def Close(self, force: bool = False) -> bool:
+		event = self.fire(EVT_CLOSE, CloseEvent(self))
+		return not event.skipped or self.destroyed
+
+
+class FileDialog(Dialog):
+	# The path the next dialog returns when shown; None cancels it.
+	next_path: str | None = None
+
+	def __init__(self, parent: Window | None = None, *args: Any, **kwargs: Any):
+		super().__init__(parent, *args, **kwargs)
+		self._path = ""
+
+	def ShowModal(self) -> int:
+		self.shown = True
+		path = FileDialog.next_path
+		if path is None:
+			return ID_CANCEL
+		self._path = path
+		return ID_OK
+
+	def GetPath(self) -> str:
+		return self._path
+
+
+class StaticText(Window):
+	pass
+
+
+class Button(Window):
+	def __init__(self, parent: Window | None = None, id: int = ID_ANY, label: str = "", *args: Any, **kwargs: Any):
+		super().__init__(parent, label=label or kwargs.get("label", ""))
+		self.id = id
+
+	def click(self) -> None:
+		self.fire(EVT_BUTTON, CommandEvent(self))
+
+
+class CheckBox(Window):
+	def __init__(self, parent: Window | None = None, *args: Any, **kwargs: Any):
+		super().__init__(parent, *args, **kwargs)
+		self._value = False
+
+	def GetValue(self) -> bool:
+		return self._value
+
+	def SetValue(self, value: bool) -> None:
+		self._value = bool(value)
+
+	def toggle(self) -> None:
+		self._value = not self._value
+		self.fire(EVT_CHECKBOX, CommandEvent(self))
+
+
+class Choice(Window):
+	def __init__(self, parent: Window | None = None, *args: Any, choices: list[str] | None = None, **kwargs: Any):
+		super().__init__(parent, *args, **kwargs)
+		self.choices = list(choices or ())
+		self._selection = -1
+
+	def GetSelection(self) -> int:
+		return self._selection
+
+	def SetSelection(self, index: int) -> None:
+		self._selection = index
+
+
+class TextCtrl(Window):
+	def __init__(self, parent: Window | None = None, *args: Any, **kwargs: Any):
+		super().__init__(parent, *args, **kwargs)
+		self._value = ""
+		self._insertion_point = 0
+
+	def GetValue(self) -> str:
+		return self._value
+
+	def ChangeValue(self, value: str) -> None:
+		self._value = value
+		self._insertion_point = len(value)
+
+	def SetValue(self, value: str) -> None:
+		self.ChangeValue(value)
+		self.fire(EVT_TEXT, CommandEvent(self))
+
+	def Clear(self) -> None:
+		self.SetValue("")
+
+	def GetInsertionPoint(self) -> int:
+		return self._insertion_point
+
+	def SetInsertionPoint(self, position: int) -> None:
+		self._insertion_point = position
+
+	def type_text(self, text: str) -> None:
+		# Inserts at the insertion point and fires EVT_TEXT, as one keystroke or paste would.
+		point = self._insertion_point
+		self._value = self._value[:point] + text + self._value[point:]
+		self._insertion_point = point + len(text)
+		self.fire(EVT_TEXT, CommandEvent(self))
+
+
+class Sizer:
+	def __init__(self, *args: Any, **kwargs: Any):
+		self.items: list[Any] = []
+
+	def Add(self, item: Any, *args: Any, **kwargs: Any) -> None:
+		self.items.append(item)
+
+
+class BoxSizer(Sizer):
+	pass
+
+
+class StaticBoxSizer(Sizer):
+	pass
+
+
+class MenuItem:
+	def __init__(self, id: int, text: str):
+		self._id = id
+		self.text = text
+
+	def GetId(self) -> int:
+		return self._id
+
+
+class Menu(_Bindable):
+	def __init__(self):
+		super().__init__()
+		self.items: list[MenuItem] = []
+		self._next_id = 1000
+
+	def Append(self, id: int, text: str = "", *args: Any) -> MenuItem:
+		self._next_id += 1
+		item = MenuItem(self._next_id if id == ID_ANY else id, text)
+		self.items.append(item)
+		return item
+
+	def Remove(self, id: int) -> None:
+		self.items = [item for item in self.items if item.GetId() != id]
@@ -0,0 +1,189 @@
+"""Differential checks of the optimized split engines against split_hangul_blocks.
+
+Usage:
+
+	from split_engines import ENGINES, OPTION_SETS, check_engines, make_mixed_text
+
+	mismatches = check_engines(make_mixed_text(100_000, seed=1))
+	assert not mismatches, mismatches[0].describe()
+
+Every engine in `ENGINES` takes a text and `SplitOptions` and must return exactly what
+`split_hangul_blocks` returns. `exhaustive_texts()` covers every syllable and every `HANGUL_RANGES`
+code point, and `make_mixed_text` builds seeded random mixed-script text with runs of syllables,
+jamo, astral characters and the whitespace `str.isspace` knows about.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import random
+import sys
+import time
+from typing import Callable, Iterator
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+if str(ADDON_DIR) not in sys.path:
+	sys.path.insert(0, str(ADDON_DIR))
+
+from globalPlugins._hangulSplitterCore import (  # noqa: E402
+	HANGUL_RANGES,
+	S_BASE,
+	S_END,
+	SplitOptions,
+	decompose_syllables,
+	iter_split_hangul_blocks,
+	split_hangul_blocks,
+	split_hangul_blocks_parallel,
+	split_hangul_blocks_with_source_map,
+	translate_hangul_blocks,
+)
+
+
+OPTION_SETS = tuple(
+	SplitOptions(splitComplexLetters=split_complex, insertSpacesBetweenLetters=spaces)
+	for split_complex in (False, True)
+	for spaces in (False, True)
+)
+
+_WHITESPACE = (" ", " ", " ", "\n", "\t", "\r\n", "\u3000", "\xa0", "\u2028", "\x1c")
+_OTHER = ("a", "Z", "7", ".", ",", "!", "中", "日", "é", "\u0301", "\U0001F600", "\U00020000", "\x00", "\ufeff")
+
+
+def _cut_points(text: str) -> list[str]:
+	# Cuts at pseudo-random places that depend only on the text, including inside syllable runs.
+	rng = random.Random(len(text))
+	chunks: list[str] = []
+	position = 0
+	while position < len(text):
+		end = position + rng.randint(0, 40)
+		chunks.append(text[position:end])
+		position = end
+	return chunks
+
+
+def _source_map_engine(text: str, options: SplitOptions) -> str:
+	output, source_map = split_hangul_blocks_with_source_map(text, options)
+	if (
+		len(source_map) != len(output)
+		or any(later < earlier for earlier, later in zip(source_map, source_map[1:]))
+		or (source_map and source_map[-1] >= len(text))
+	):
+		raise AssertionError("Source map does not line up with its output")
+	return output
+
+
+def _decompose_engine(text: str, options: SplitOptions) -> str | None:
+	# decompose_syllables never spaces letters, so it is only compared when spacing is off.
+	if options.insertSpacesBetweenLetters:
+		return None
+	return decompose_syllables(text, options.splitComplexLetters, options.decompositionRules)
+
+
+# An engine returns None for options it does not support.
+Engine = Callable[[str, SplitOptions], "str | None"]
+
+ENGINES: dict[str, Engine] = {
+	"translate": translate_hangul_blocks,
+	"sourceMap": _source_map_engine,
+	"chunked": lambda text, options: "".join(iter_split_hangul_blocks(_cut_points(text), options)),
+	"parallel": lambda text, options: split_hangul_blocks_parallel(text, options, max_workers=4, min_chunk_chars=1),
+	"decompose": _decompose_engine,
+}
+
+
+@dataclass(frozen=True)
+class Mismatch:
+	engine: str
+	options: SplitOptions
+	text: str
+	expected: str
+	actual: str
+
+	@property
+	def offset(self) -> int:
+		# First output offset where the engine differs from the reference.
+		for index, (expected, actual) in enumerate(zip(self.expected, self.actual)):
+			if expected != actual:
+				return index
+		return min(len(self.expected), len(self.actual))
+
+	def describe(self) -> str:
+		start = max(0, self.offset - 20)
+		return (
+			f"{self.engine} with {self.options} differs at output offset {self.offset} "
+			f"(input of {len(self.text)} characters): expected {self.expected[start : self.offset + 20]!r}, "
+			f"got {self.actual[start : self.offset + 20]!r}"
+		)
+
+
+def all_syllables() -> str:
+	return "".join(chr(scalar) for scalar in range(S_BASE, S_END + 1))
+
+
+def all_hangul_range_chars() -> str:
+	return "".join(chr(scalar) for start, end in HANGUL_RANGES for scalar in range(start, end + 1))
+
+
+def exhaustive_texts() -> Iterator[str]:
+	# Every syllable and every code point of HANGUL_RANGES as one run, and each of them
+	# between a syllable, whitespace and a non-Hangul letter, so spacing is checked on both sides.
+	for chars in (all_syllables(), all_hangul_range_chars()):
+		yield chars
+		yield "".join(f"가{char}\n{char}a" for char in chars)
+
+
+def make_mixed_text(size: int, seed: int = 0) -> str:
+	rng = random.Random(seed)
+	pieces: list[str] = []
+	length = 0
+	hangul_ranges = [range(start, end + 1) for start, end in HANGUL_RANGES]
+	while length < size:
+		kind = rng.random()
+		if kind < 0.5:
+			piece = "".join(chr(rng.randint(S_BASE, S_END)) for _index in range(rng.randint(1, 12)))
+		elif kind < 0.65:
+			piece = "".join(chr(rng.choice(rng.choice(hangul_ranges))) for _index in range(rng.randint(1, 4)))
+		elif kind < 0.85:
+			piece = rng.choice(_WHITESPACE)
+		else:
+			piece = "".join(rng.choice(_OTHER) for _index in range(rng.randint(1, 6)))
+		pieces.append(piece)
+		length += len(piece)
+	return "".join(pieces)[:size]
+
+
+def check_engines(
+	text: str,
+	engines: dict[str, Engine] | None = None,
+	option_sets: tuple[SplitOptions, ...] = OPTION_SETS,
+) -> list[Mismatch]:
+	mismatches: list[Mismatch] = []
+	for options in option_sets:
+		expected = split_hangul_blocks(text, options)
+		for name, engine in (engines or ENGINES).items():
+			actual = engine(text, options)
+			if actual is not None and actual != expected:
+				mismatches.append(Mismatch(name, options, text, expected, actual))
+	return mismatches
+
+
+def time_engines(
+	text: str,
+	options: SplitOptions,
+	engines: dict[str, Engine] | None = None,
+	repeat: int = 3,
+) -> dict[str, float]:
+	# Best of repeat runs in seconds, for the reference and every engine that supports the options.
+	timings: dict[str, float] = {}
+	for name, engine in {"reference": split_hangul_blocks, **(engines or ENGINES)}.items():
+		best = float("inf")
+		for _round in range(repeat):
+			started = time.perf_counter()
+			output = engine(text, options)
+			best = min(best, time.perf_counter() - started)
+		if output is not None:
+			timings[name] = best
+	return timings
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import ast
+import gettext
+import importlib.util
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MO_MODULE_PATH = PROJECT_ROOT / "site_scons" / "site_tools" / "gettexttool" / "mo.py"
+KO_PO_PATH = PROJECT_ROOT / "addon" / "locale" / "ko" / "LC_MESSAGES" / "nvda.po"
+
+_spec = importlib.util.spec_from_file_location("gettexttoolMo", MO_MODULE_PATH)
+mo = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mo)
+
+SAMPLE_PO = r'''msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\n"
+
+msgctxt "menu"
+msgid "Open"
+msgstr "열기"
+
+msgid "Tab\there \"quoted\" back\\slash \101 \x41"
+msgstr "탭\t\"인용\"\n"
+"둘째 줄"
+
+msgid "One file"
+msgid_plural "{n} files"
+msgstr[0] "파일 {n}개"
+
+msgid "Untranslated"
+msgstr ""
+'''
+
+
+class PoParserTests(unittest.TestCase):
+	def test_unescape_matches_python_literals(self) -> None:
+		for literal in (r"plain 한글", r"a\nb\tc", r"\"q\" \\ \'", r"\101\7\x41ㄱ\U0001F600", r"\N{HANGUL LETTER KIYEOK}", r"\a\b\f\v\r"):
+			with self.subTest(literal=literal):
+				self.assertEqual(mo._unescape(literal), ast.literal_eval(f'"{literal}"'))
+
+	def test_parse_sample(self) -> None:
+		with tempfile.TemporaryDirectory() as directory:
+			po_path = os.path.join(directory, "sample.po")
+			Path(po_path).write_text(SAMPLE_PO, encoding="utf-8")
+			messages = mo._parse_po_file(po_path)
+		self.assertEqual(
+			messages,
+			{
+				"": "Content-Type: text/plain; charset=UTF-8\n",
+				"menu\x04Open": "열기",
+				'Tab\there "quoted" back\\slash A A': '탭\t"인용"\n둘째 줄',
+				"One file\x00{n} files": "파일 {n}개",
+			},
+		)
+
+	def test_line_separators_inside_strings(self) -> None:
+		with tempfile.TemporaryDirectory() as directory:
+			po_path = os.path.join(directory, "separators.po")
+			Path(po_path).write_text('msgid "a\u2028b"\nmsgstr "x\u2028y"\n\nmsgid "p\x0cq"\nmsgstr "r"\n', encoding="utf-8")
+			messages = mo._parse_po_file(po_path)
+		self.assertEqual(messages, {"a\u2028b": "x\u2028y", "p\x0cq": "r"})
+
+	def test_compiled_file_is_readable(self) -> None:
+		with tempfile.TemporaryDirectory() as directory:
+			mo_path = os.path.join(directory, "nvda.mo")
+			mo.compile_mo(str(KO_PO_PATH), mo_path, mo.PYTHON_COMPILER)
+			with open(mo_path, "rb") as mo_file:
+				translations = gettext.GNUTranslations(mo_file)
+		self.assertEqual(translations.gettext("Hangul Block Splitter"), "한글 블록 분해기")
+
+
+class MoCacheTests(unittest.TestCase):
+	def test_unchanged_po_is_copied_from_cache(self) -> None:
+		with tempfile.TemporaryDirectory() as directory:
+			po_path = os.path.join(directory, "nvda.po")
+			cache_dir = os.path.join(directory, "cache")
+			Path(po_path).write_text(SAMPLE_PO, encoding="utf-8")
+			first = os.path.join(directory, "first.mo")
+			second = os.path.join(directory, "second.mo")
+			self.assertFalse(mo.compile_mo(po_path, first, mo.PYTHON_COMPILER, cache_dir))
+			self.assertTrue(mo.compile_mo(po_path, second, mo.PYTHON_COMPILER, cache_dir))
+			self.assertEqual(Path(first).read_bytes(), Path(second).read_bytes())
+			self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+			Path(po_path).write_text(SAMPLE_PO.replace("열기", "여는 중"), encoding="utf-8")
+			self.assertFalse(mo.compile_mo(po_path, second, mo.PYTHON_COMPILER, cache_dir))
+			self.assertNotEqual(Path(first).read_bytes(), Path(second).read_bytes())
+			# The cache key includes the compiler, whose output differs.
+			self.assertNotEqual(
+				mo.content_hash(po_path, mo.PYTHON_COMPILER),
+				mo.content_hash(po_path, mo.MSGFMT_COMPILER),
+			)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+sys.path.insert(0, str(ADDON_DIR))
+sys.path.insert(0, str(PROJECT_ROOT / "tests"))
+
+from split_engines import OPTION_SETS, make_mixed_text  # noqa: E402
+
+from globalPlugins._hangulCorpus import HangulCorpus, write_corpus  # noqa: E402
+from globalPlugins._hangulSplitterCore import (  # noqa: E402
+	SplitOptions,
+	normalize_rules,
+	split_hangul_blocks,
+	split_hangul_blocks_with_source_map,
+)
+
+
+TEXTS = ["한글 값", "", "abc 😀 닭", "가" * 10, make_mixed_text(3_000, seed=4)]
+
+
+class HangulCorpusTests(unittest.TestCase):
+	def setUp(self) -> None:
+		directory = tempfile.TemporaryDirectory()
+		self.addCleanup(directory.cleanup)
+		self.path = os.path.join(directory.name, "corpus.hbs")
+
+	def open(self) -> HangulCorpus:
+		corpus = HangulCorpus(self.path)
+		self.addCleanup(corpus.close)
+		return corpus
+
+	def test_round_trip(self) -> None:
+		for options in OPTION_SETS:
+			with self.subTest(options=options):
+				self.assertEqual(write_corpus(self.path, iter(TEXTS), options, source_map=True), len(TEXTS))
+				with HangulCorpus(self.path) as corpus:
+					self.assertEqual(corpus.options, options)
+					self.assertEqual(len(corpus), len(TEXTS))
+					for index, text in enumerate(TEXTS):
+						output, source_map = split_hangul_blocks_with_source_map(text, options)
+						self.assertEqual(corpus.source(index), text)
+						self.assertEqual(corpus.output(index), split_hangul_blocks(text, options))
+						self.assertEqual(corpus.source_map(index), source_map)
+						self.assertEqual(corpus.output_length(index), len(output))
+
+	def test_jamo_ranges(self) -> None:
+		options = SplitOptions(insertSpacesBetweenLetters=True)
+		write_corpus(self.path, TEXTS, options, source_map=True)
+		corpus = self.open()
+		output = split_hangul_blocks(TEXTS[0], options)
+		self.assertEqual(corpus.output(0, 2, 5), output[2:5])
+		self.assertEqual(corpus.output(0, -3), output[-3:])
+		self.assertEqual(corpus.output(-2, 5, 3), "")
+		self.assertEqual(corpus.source_map(0, 6, 9), [1, 1, 1])
+		# Output "ㄱ ㅡ ㄹ" of 글, and the space before 값 up to the end.
+		self.assertEqual(corpus.source_span(0, 6, 11), (1, 2))
+		self.assertEqual(corpus.source_span(0, 11, 100), (2, 4))
+		self.assertEqual(corpus.source_span(1, 0, 0), (0, 0))
+
+	def test_without_source_map(self) -> None:
+		rules = normalize_rules({"ㄲ": "ㄱㄱ"})
+		options = SplitOptions(decompositionRules=rules)
+		write_corpus(self.path, ["깎아 값"], options)
+		corpus = self.open()
+		self.assertEqual(corpus.options.decompositionRules, rules)
+		self.assertFalse(corpus.has_source_map)
+		self.assertEqual(corpus.output(0), "ㄱㄱㅏㄱㄱㅇㅏ ㄱㅏㅄ")
+		with self.assertRaises(ValueError):
+			corpus.source_map(0)
+		with self.assertRaises(IndexError):
+			corpus.source(1)
+
+	def test_failed_write_leaves_no_files(self) -> None:
+		def texts():
+			yield TEXTS[0]
+			raise RuntimeError("source failed")
+
+		with self.assertRaises(RuntimeError):
+			write_corpus(self.path, texts(), SplitOptions(), source_map=True)
+		self.assertEqual(os.listdir(os.path.dirname(self.path)), [])
+
+	def test_rejects_other_files(self) -> None:
+		Path(self.path).write_bytes(b"not a corpus file" * 8)
+		with self.assertRaises(ValueError):
+			HangulCorpus(self.path)
+		write_corpus(self.path, TEXTS, SplitOptions())
+		Path(self.path).write_bytes(Path(self.path).read_bytes()[:-8])
+		with self.assertRaises(ValueError):
+			HangulCorpus(self.path)
+
+
+if __name__ == "__main__":
+	unittest.main()
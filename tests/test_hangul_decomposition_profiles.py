@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+sys.path.insert(0, str(ADDON_DIR))
+
+from globalPlugins._hangulDecompositionProfiles import (  # noqa: E402
+	BUILTIN_PROFILES,
+	PROFILE_CONSONANTS,
+	PROFILE_FULL,
+	load_profiles,
+	parse_profiles,
+)
+
+
+class ParseProfilesTests(unittest.TestCase):
+	def test_builtin_consonants_keep_complex_vowels(self):
+		rules = dict(BUILTIN_PROFILES[PROFILE_CONSONANTS])
+		self.assertEqual(rules["ㄲ"], "ㄱㄱ")
+		self.assertEqual(rules["ㄳ"], "ㄱㅅ")
+		self.assertNotIn("ㅘ", rules)
+
+	def test_profile_extends_base(self):
+		profiles = parse_profiles(
+			{"profiles": {"teacher": {"base": PROFILE_CONSONANTS, "rules": {"ㅐ": "ㅏㅣ", "ㄲ": None}}}},
+		)
+		rules = dict(profiles["teacher"])
+		self.assertEqual(rules["ㅐ"], "ㅏㅣ")
+		self.assertNotIn("ㄲ", rules)
+		self.assertEqual(rules["ㄳ"], "ㄱㅅ")
+
+	def test_profile_without_base_starts_empty(self):
+		self.assertEqual(parse_profiles({"profiles": {"ae": {"rules": {"ㅐ": "ㅏㅣ"}}}}), {"ae": (("ㅐ", "ㅏㅣ"),)})
+
+	def test_invalid_definitions(self):
+		invalid = (
+			[],
+			{"profiles": {PROFILE_FULL: {}}},
+			{"profiles": {"x": {"base": "unknown"}}},
+			{"profiles": {"x": {"rules": {"a": "b"}}}},
+			{"profiles": {"x": {"rules": {"ㅐ": ""}}}},
+			{"profiles": {"x": {"rules": {"ㅐ": "ㅏ ㅣ"}}}},
+		)
+		for data in invalid:
+			with self.subTest(data=data), self.assertRaises(ValueError):
+				parse_profiles(data)
+
+
+class LoadProfilesTests(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+		self.path = os.path.join(self.directory.name, "profiles.json")
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def _write(self, data, mtime_ns: int) -> None:
+		with open(self.path, "w", encoding="utf-8") as file:
+			json.dump(data, file, ensure_ascii=False)
+		os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+	def test_missing_file_gives_builtin_profiles(self):
+		self.assertEqual(load_profiles(self.path), BUILTIN_PROFILES)
+
+	def test_file_is_parsed_again_only_after_it_changes(self):
+		self._write({"profiles": {"a": {"rules": {"ㅐ": "ㅏㅣ"}}}}, 1_000_000_000)
+		first = load_profiles(self.path)
+		self.assertIs(load_profiles(self.path)["a"], first["a"])
+		self._write({"profiles": {"a": {"rules": {"ㅔ": "ㅓㅣ"}}}}, 2_000_000_000)
+		self.assertEqual(load_profiles(self.path)["a"], (("ㅔ", "ㅓㅣ"),))
+		self.assertEqual(list(load_profiles(self.path))[: len(BUILTIN_PROFILES)], list(BUILTIN_PROFILES))
+
+	def test_invalid_json_raises(self):
+		with open(self.path, "w", encoding="utf-8") as file:
+			file.write("{")
+		with self.assertRaises(ValueError):
+			load_profiles(self.path)
+
+
+if __name__ == "__main__":
+	unittest.main()
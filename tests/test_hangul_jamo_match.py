@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from pathlib import Path
+import random
+import sys
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+sys.path.insert(0, str(ADDON_DIR))
+
+from globalPlugins._hangulJamoMatch import (  # noqa: E402
+	JamoPattern,
+	JamoVocabulary,
+	fuzzy_match,
+	jamo_edit_distance,
+)
+from globalPlugins._hangulSplitterCore import (  # noqa: E402
+	SplitOptions,
+	decompose_syllables,
+	split_hangul_blocks,
+	split_hangul_blocks_with_source_map,
+)
+
+
+def _levenshtein(first: str, second: str) -> int:
+	previous = list(range(len(second) + 1))
+	for row, first_char in enumerate(first, start=1):
+		current = [row]
+		for column, second_char in enumerate(second, start=1):
+			current.append(
+				min(
+					previous[column] + 1,
+					current[column - 1] + 1,
+					previous[column - 1] + (first_char != second_char),
+				),
+			)
+		previous = current
+	return previous[-1]
+
+
+class DecompositionTests(unittest.TestCase):
+	def test_decompose_matches_split(self) -> None:
+		text = "괜찮아요, 값 ABC ㄱ 닭"
+		for split_complex in (False, True):
+			options = SplitOptions(splitComplexLetters=split_complex, insertSpacesBetweenLetters=False)
+			self.assertEqual(decompose_syllables(text, split_complex), split_hangul_blocks(text, options))
+
+	def test_source_map_matches_split(self) -> None:
+		text = "한글 a값!괜"
+		for split_complex in (False, True):
+			for spaces in (False, True):
+				options = SplitOptions(splitComplexLetters=split_complex, insertSpacesBetweenLetters=spaces)
+				output, source_map = split_hangul_blocks_with_source_map(text, options)
+				self.assertEqual(output, split_hangul_blocks(text, options))
+				self.assertEqual(len(source_map), len(output))
+		output, source_map = split_hangul_blocks_with_source_map("한a", SplitOptions())
+		self.assertEqual(output, "ㅎㅏㄴa")
+		self.assertEqual(source_map, [0, 0, 0, 1])
+
+
+class JamoEditDistanceTests(unittest.TestCase):
+	def test_one_jamo_typo_is_distance_one(self) -> None:
+		self.assertEqual(jamo_edit_distance("한글", "한굴"), 1)
+		self.assertEqual(jamo_edit_distance("값", "갑"), 1)
+		self.assertEqual(jamo_edit_distance("값", "갑", split_complex_letters=False), 1)
+		self.assertEqual(jamo_edit_distance("", "한"), 3)
+
+	def test_matches_dynamic_programming(self) -> None:
+		rng = random.Random(7)
+		alphabet = "ㄱㄴㄷㅏㅓㅗab"
+		for _ in range(300):
+			first = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 70)))
+			second = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 70)))
+			self.assertEqual(JamoPattern(first).distance(second), _levenshtein(first, second))
+
+	def test_standalone_complex_letters(self) -> None:
+		self.assertEqual(jamo_edit_distance("까", "ㄲㅏ"), 0)
+		self.assertEqual(jamo_edit_distance("ㄲ", "까"), 1)
+		self.assertEqual(jamo_edit_distance("ㄱㅘ", "과"), 0)
+		self.assertEqual(jamo_edit_distance("ㄳ", "ㄱㅅ"), 0)
+		self.assertEqual(jamo_edit_distance("ㄲ", "ㄱㄱ", split_complex_letters=False), 2)
+
+	def test_max_distance_cutoff(self) -> None:
+		pattern = JamoPattern("안녕하세요")
+		self.assertEqual(pattern.distance("안녕", max_distance=2), 3)
+		self.assertEqual(pattern.distance("안녕하세오", max_distance=2), 1)
+
+
+class JamoSearchTests(unittest.TestCase):
+	def test_search_maps_to_syllables(self) -> None:
+		matches = JamoPattern("한굴").search("나는 한글을 배워요", max_distance=1)
+		self.assertEqual(len(matches), 1)
+		self.assertEqual((matches[0].start, matches[0].end, matches[0].distance), (3, 5, 1))
+
+	def test_search_inside_syllable(self) -> None:
+		matches = JamoPattern("ㅏㄴ").search("한", max_distance=0)
+		self.assertEqual([(match.start, match.end, match.jamoStart) for match in matches], [(0, 1, 1)])
+
+	def test_search_standalone_complex_letters(self) -> None:
+		matches = JamoPattern("ㄲ").search("아까", max_distance=0)
+		self.assertEqual([(match.start, match.end, match.jamoStart) for match in matches], [(1, 2, 2)])
+		# A standalone ㄳ in the text is searched as ㄱㅅ, and the match maps back to it.
+		matches = JamoPattern("ㄱㅅ").search("a ㄳ b", max_distance=0)
+		self.assertEqual([(match.start, match.end) for match in matches], [(2, 3)])
+
+
+class FuzzyMatchTests(unittest.TestCase):
+	def test_fuzzy_match_ranks_by_distance(self) -> None:
+		words = ["한국", "한글", "항구", "하늘", "학교"]
+		expected = [("한글", 1), ("한국", 2), ("하늘", 2)]
+		self.assertEqual(fuzzy_match("한귿", words, max_distance=2), expected)
+		vocabulary = JamoVocabulary(words)
+		self.assertEqual(vocabulary.match("한귿", max_distance=2), expected)
+		self.assertEqual(vocabulary.match("하늘", max_distance=0), [("하늘", 0)])
+		self.assertEqual(vocabulary.match("한글", max_distance=3, limit=1), [("한글", 0)])
+
+	def test_typed_complex_letters_match_words(self) -> None:
+		words = ["과일", "까치", "가치"]
+		self.assertEqual(fuzzy_match("ㄱㅘㅇㅣㄹ", words, max_distance=0), [("과일", 0)])
+		self.assertEqual(JamoVocabulary(words).match("ㄲㅏㅊㅣ", max_distance=0), [("까치", 0)])
+		self.assertEqual(JamoVocabulary(["ㄲㅏㅊㅣ"]).match("까치", max_distance=0), [("ㄲㅏㅊㅣ", 0)])
+
+	def test_vocabulary_filter_keeps_every_match(self) -> None:
+		rng = random.Random(11)
+		words = ["".join(chr(0xAC00 + rng.randrange(400)) for _ in range(rng.randint(1, 3))) for _ in range(500)]
+		vocabulary = JamoVocabulary(words)
+		for query in words[:25]:
+			for max_distance in (1, 2, 3):
+				self.assertEqual(vocabulary.match(query, max_distance), fuzzy_match(query, words, max_distance))
+
+	def test_piece_index_keeps_every_match(self) -> None:
+		rng = random.Random(12)
+		syllables = [chr(0xAC00 + rng.randrange(11172)) for _ in range(30)]
+		words = ["".join(rng.choice(syllables) for _ in range(rng.randint(1, 5))) for _ in range(800)]
+		letters = sorted(set(decompose_syllables("".join(words), True)))
+		vocabulary = JamoVocabulary(words)
+		for _ in range(40):
+			query = list(decompose_syllables(rng.choice(words), True))
+			for _edit in range(rng.randint(0, 3)):
+				position = rng.randrange(len(query) + 1)
+				operation = rng.randrange(3)
+				if operation == 0 and position < len(query):
+					query[position] = rng.choice(letters)
+				elif operation == 1 and position < len(query):
+					del query[position]
+				else:
+					query.insert(position, rng.choice(letters))
+			query_text = "".join(query)
+			for max_distance in range(6):
+				with self.subTest(query=query_text, max_distance=max_distance):
+					self.assertEqual(vocabulary.match(query_text, max_distance), fuzzy_match(query_text, words, max_distance))
+
+
+if __name__ == "__main__":
+	unittest.main()
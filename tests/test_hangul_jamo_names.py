@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+sys.path.insert(0, str(ADDON_DIR))
+
+from globalPlugins._hangulJamoNames import (  # noqa: E402
+	NAME_STYLE_DESCRIPTION,
+	NAME_STYLE_FULL,
+	NAME_STYLE_SHORT,
+	jamo_names,
+	jamo_speech_sequence,
+)
+from globalPlugins._hangulSplitterCore import (  # noqa: E402
+	COMPLEX_COMPAT_MAP,
+	SplitOptions,
+	split_hangul_blocks,
+)
+
+
+COMPAT_LETTERS = [chr(code) for code in range(0x3131, 0x3164)]
+
+
+class JamoNameTests(unittest.TestCase):
+	def test_every_compatibility_letter_is_named(self) -> None:
+		for style in (NAME_STYLE_FULL, NAME_STYLE_SHORT):
+			for korean in (True, False):
+				with self.subTest(style=style, korean=korean):
+					names = jamo_names(style, korean)
+					self.assertEqual(sorted(names), COMPAT_LETTERS)
+					self.assertTrue(all(names.values()))
+		self.assertIsNone(jamo_names(NAME_STYLE_DESCRIPTION, True))
+
+	def test_names_tell_letters_apart(self) -> None:
+		for style in (NAME_STYLE_FULL, NAME_STYLE_SHORT):
+			for korean in (True, False):
+				names = jamo_names(style, korean)
+				self.assertEqual(len(set(names.values())), len(names), (style, korean))
+
+	def test_complex_letter_names_join_their_parts(self) -> None:
+		names = jamo_names(NAME_STYLE_FULL, True)
+		self.assertEqual(names["ㄳ"], "기역시옷")
+		self.assertEqual(names["ㅀ"], "리을히읗")
+		self.assertEqual(names["ㅘ"], "와")
+		# Every letter a decomposition rule produces has a name of its own.
+		self.assertTrue(all(part in names for parts in COMPLEX_COMPAT_MAP.values() for part in parts))
+
+	def test_speech_sequence(self) -> None:
+		names = jamo_names(NAME_STYLE_FULL, True)
+		text = split_hangul_blocks("값 a닭", SplitOptions(splitComplexLetters=False))
+		sequence = jamo_speech_sequence(text, names, lambda run: [f"<{run}>"], lambda: "|")
+		self.assertEqual(
+			sequence,
+			["기역", "|", "아", "|", "비읍시옷", "|", "< a>", "|", "디귿", "|", "아", "|", "리을기역"],
+		)
+		self.assertEqual(jamo_speech_sequence("", names, list, lambda: "|"), [])
+		self.assertEqual(jamo_speech_sequence("abc", names, lambda run: [run], lambda: "|"), ["abc"])
+
+
+if __name__ == "__main__":
+	unittest.main()
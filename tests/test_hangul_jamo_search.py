@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+import random
+import sys
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+sys.path.insert(0, str(ADDON_DIR))
+
+from globalPlugins._hangulJamoSearch import JamoSearcher  # noqa: E402
+from globalPlugins._hangulSplitterCore import (  # noqa: E402
+	COMPLEX_COMPAT_MAP,
+	SplitOptions,
+	split_hangul_blocks_with_source_map,
+)
+
+
+def _split_with_letters(text: str) -> tuple[str, list[int]]:
+	# The splitter leaves standalone letters alone; the searcher splits them like letters in syllables.
+	jamo, source_map = split_hangul_blocks_with_source_map(text, SplitOptions())
+	letters: list[str] = []
+	positions: list[int] = []
+	for char, position in zip(jamo, source_map):
+		replacement = COMPLEX_COMPAT_MAP.get(char, char)
+		letters.append(replacement)
+		positions.extend([position] * len(replacement))
+	return "".join(letters), positions
+
+
+def _naive_spans(patterns: list[str], text: str) -> list[tuple[int, int, int]]:
+	jamo, source_map = _split_with_letters(text)
+	spans: list[tuple[int, int, int]] = []
+	for end in range(1, len(jamo) + 1):
+		for pattern_index, pattern in enumerate(patterns):
+			decomposed = _split_with_letters(pattern)[0]
+			if decomposed and jamo.endswith(decomposed, 0, end):
+				spans.append((pattern_index, source_map[end - len(decomposed)], source_map[end - 1] + 1))
+	return spans
+
+
+class JamoSearcherTests(unittest.TestCase):
+	def test_partial_syllable_matches(self) -> None:
+		searcher = JamoSearcher(["ㅏㄴ", "한글", "ㄴㄱ", "ㄹ"])
+		matches = searcher.find_all("한글 학교")
+		summary = [
+			(match.patternIndex, match.start, match.end, match.startsInsideSyllable, match.endsInsideSyllable)
+			for match in matches
+		]
+		self.assertIn((0, 0, 1, True, False), summary)
+		self.assertIn((1, 0, 2, False, False), summary)
+		self.assertIn((2, 0, 2, True, True), summary)
+		self.assertIn((3, 1, 2, True, False), summary)
+		self.assertEqual(len(summary), 4)
+
+	def test_pattern_ending_in_final_consonant(self) -> None:
+		matches = JamoSearcher(["ㅎㅏㄱ"]).find_all("하고 학교")
+		self.assertEqual(
+			[(match.start, match.end, match.endsInsideSyllable) for match in matches],
+			[(0, 2, True), (3, 4, False)],
+		)
+		matches = JamoSearcher(["ㅎㅏ"]).find_all("학")
+		self.assertEqual([(match.start, match.end, match.endsInsideSyllable) for match in matches], [(0, 1, True)])
+
+	def test_stream_matches_across_chunks(self) -> None:
+		searcher = JamoSearcher(["ㄴㄱㅡ"])
+		matches = list(searcher.iter_matches(["안", "글자"]))
+		self.assertEqual([(match.start, match.end) for match in matches], [(0, 2)])
+
+	def test_standalone_complex_letters(self) -> None:
+		matches = JamoSearcher(["ㄲ", "ㅘ"]).find_all("까과")
+		self.assertEqual([(match.patternIndex, match.start, match.end) for match in matches], [(0, 0, 1), (1, 1, 2)])
+		matches = JamoSearcher(["ㄱㅅ"]).find_all("a ㄳ 넋")
+		self.assertEqual([(match.start, match.end) for match in matches], [(2, 3), (4, 5)])
+		unsplit = JamoSearcher(["ㄲ"], split_complex_letters=False)
+		self.assertEqual([(match.start, match.end) for match in unsplit.find_all("까 ㄱㄱ ㄲ")], [(0, 1), (5, 6)])
+
+	def test_agrees_with_naive_search(self) -> None:
+		rng = random.Random(3)
+		patterns = ["ㅏ", "ㄱㅏ", "ㅏㄴㄱ", "가", "ㄴㄴ", "ab", "ㅂㅅ", "ㄲ", "ㅘ", "ㄳ"]
+		for _ in range(50):
+			text = "".join(rng.choice("가간각값나난까과ㄲㅘㄳa b") for _ in range(rng.randint(0, 40)))
+			actual = sorted((match.patternIndex, match.start, match.end) for match in JamoSearcher(patterns).find_all(text))
+			self.assertEqual(actual, sorted(_naive_spans(patterns, text)))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+import random
+import sys
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+sys.path.insert(0, str(ADDON_DIR))
+
+from globalPlugins._hangulJamoTrie import JamoTrie  # noqa: E402
+from globalPlugins._hangulSplitterCore import decompose_syllables  # noqa: E402
+
+
+WORDS = ["한", "한글", "하나", "하늘", "닭", "달걀", "달", "까치", "가다", "과일", "고양이", "NVDA", "한글"]
+
+
+class JamoTrieTests(unittest.TestCase):
+	def setUp(self) -> None:
+		self.trie = JamoTrie(WORDS)
+
+	def test_partial_final_syllable_is_ambiguous(self) -> None:
+		self.assertEqual(self.trie.complete("하ㄴ", limit=None), ["한", "한글", "하나", "하늘"])
+		self.assertEqual(self.trie.complete("한", limit=None), ["한", "한글", "하나", "하늘"])
+		self.assertEqual(self.trie.complete("하", limit=None), ["한", "한글", "하나", "하늘"])
+		self.assertEqual(self.trie.complete("한그", limit=None), ["한글"])
+
+	def test_complex_letters_continue_as_typed(self) -> None:
+		self.assertEqual(self.trie.complete("닭", limit=None), ["닭", "달걀"])
+		self.assertEqual(self.trie.complete("고", limit=None), ["고양이", "과일"])
+		self.assertEqual(self.trie.complete("ㄲ", limit=None), ["까치"])
+		self.assertEqual(self.trie.count("ㄱ"), 4)
+
+	def test_without_complex_letter_splitting(self) -> None:
+		trie = JamoTrie(WORDS, split_complex_letters=False)
+		self.assertEqual(trie.complete("고", limit=None), ["고양이"])
+		self.assertEqual(trie.complete("닭", limit=None), ["닭"])
+
+	def test_limit_count_and_membership(self) -> None:
+		self.assertEqual(len(self.trie), len(set(WORDS)))
+		self.assertEqual(self.trie.complete("", limit=2), ["NVDA", "까치"])
+		self.assertEqual(self.trie.count(""), len(self.trie))
+		self.assertEqual(self.trie.count("핳"), 0)
+		self.assertEqual(self.trie.complete("핳"), [])
+		self.assertIn("달", self.trie)
+		self.assertNotIn("다", self.trie)
+		self.assertNotIn(None, self.trie)
+
+	def test_empty_trie(self) -> None:
+		trie = JamoTrie([])
+		self.assertEqual(trie.complete("한"), [])
+		self.assertEqual(trie.count(""), 0)
+
+	def test_matches_scan_of_random_lexicon(self) -> None:
+		rng = random.Random(3)
+		syllables = [chr(0xAC00 + rng.randrange(11172)) for _index in range(40)]
+		words = ["".join(rng.choice(syllables) for _index in range(rng.randint(1, 4))) for _index in range(2000)]
+		trie = JamoTrie(words)
+		keyed = sorted((decompose_syllables(word), word) for word in set(words))
+		for word in rng.sample(words, 100):
+			for cut in range(len(word) + 1):
+				prefix = decompose_syllables(word[:cut])
+				for length in range(len(prefix) + 1):
+					expected = [candidate for key, candidate in keyed if key.startswith(prefix[:length])]
+					self.assertEqual(trie.complete(prefix[:length], limit=None), expected)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
+import threading
 import unittest
+from unittest import mock
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 CORE_DIR = PROJECT_ROOT / "addon" / "globalPlugins"
 sys.path.insert(0, str(CORE_DIR))
 
+import _hangulSplitterCore  # noqa: E402
 from _hangulSplitterCore import (  # noqa: E402
+	S_BASE,
+	S_END,
 	SplitOptions,
+	_spaced_translation_table,
+	_syllable_translation_table,
+	compile_syllable_table,
+	contains_hangul,
 	is_hangul_script_char,
+	iter_hangul_runs,
+	iter_split_hangul_blocks,
 	keep_only_hangul,
+	normalize_rules,
+	parallel_cut_points,
 	split_hangul_blocks,
+	split_hangul_blocks_parallel,
+	translate_hangul_blocks,
 )
 
 
@@ -47,6 +63,143 @@ class HangulSplitterCoreTests(unittest.TestCase):
 		self.assertTrue(is_hangul_script_char("ㄱ"))
 		self.assertFalse(is_hangul_script_char("A"))
 
+	def test_iter_hangul_runs(self) -> None:
+		self.assertEqual(
+			list(iter_hangul_runs("ab한글 ㄱㅏ!\t값")),
+			[(2, 4, "syllable"), (4, 5, "whitespace"), (5, 7, "jamo"), (8, 9, "whitespace"), (9, 10, "syllable")],
+		)
+		self.assertEqual(list(iter_hangul_runs("a 한", include_whitespace=False)), [(2, 3, "syllable")])
+
+	def test_runs_reproduce_keep_only_hangul(self) -> None:
+		text = "NVDA 한글\u3000분해기\n(가) 123 ꥠ"
+		for include_whitespace in (True, False):
+			joined = "".join(
+				text[start:end] for start, end, _kind in iter_hangul_runs(text, include_whitespace=include_whitespace)
+			)
+			self.assertEqual(joined, keep_only_hangul(text, include_whitespace=include_whitespace))
+
+	def test_contains_hangul(self) -> None:
+		self.assertTrue(contains_hangul("abc 한"))
+		self.assertTrue(contains_hangul("ㅋ"))
+		self.assertFalse(contains_hangul("abc   123"))
+		self.assertFalse(contains_hangul(""))
+
+	def test_chunked_split_matches_whole_text(self) -> None:
+		text = "한글 분해기ABC값 괜찮아"
+		for cut in range(len(text) + 1):
+			chunks = [text[:cut], "", text[cut:]]
+			for spaces in (False, True):
+				options = SplitOptions(splitComplexLetters=True, insertSpacesBetweenLetters=spaces)
+				self.assertEqual(
+					"".join(iter_split_hangul_blocks(chunks, options)),
+					split_hangul_blocks(text, options),
+				)
+
+	def test_long_text_is_processed_in_slices(self) -> None:
+		text = "한글 분해기ABC값 괜찮아\n닭닭닭 ᄀ \u3000가"
+		for slice_chars in (1, 2, 5):
+			with mock.patch.object(_hangulSplitterCore, "_SLICE_CHARS", slice_chars):
+				for spaces in (False, True):
+					options = SplitOptions(insertSpacesBetweenLetters=spaces)
+					self.assertEqual(translate_hangul_blocks(text, options), split_hangul_blocks(text, options))
+				self.assertEqual(keep_only_hangul(text), "한글 분해기값 괜찮아\n닭닭닭 ᄀ \u3000가")
+				self.assertEqual(keep_only_hangul(text, include_whitespace=False), "한글분해기값괜찮아닭닭닭ᄀ가")
+
+
+class DecompositionRulesTests(unittest.TestCase):
+	ALL_SYLLABLES = "".join(chr(scalar) for scalar in range(S_BASE, S_END + 1))
+
+	def test_custom_rules(self) -> None:
+		options = SplitOptions(decompositionRules=normalize_rules({"ㅐ": "ㅏㅣ", "ㄲ": "ㄱㄱ"}))
+		self.assertEqual(split_hangul_blocks("깨값", options), "ㄱㄱㅏㅣㄱㅏㅄ")
+		self.assertEqual(translate_hangul_blocks("깨값", options), "ㄱㄱㅏㅣㄱㅏㅄ")
+
+	def test_translate_matches_reference_for_every_syllable(self) -> None:
+		text = self.ALL_SYLLABLES + " a" + self.ALL_SYLLABLES[::97] + "\nㄱ가"
+		rule_sets = ((), normalize_rules({"ㅐ": "ㅏㅣ", "ㅘ": "ㅗㅏ", "ㄳ": "ㄱㅅ"}), SplitOptions().decompositionRules)
+		for rules in rule_sets:
+			for split_complex in (False, True):
+				for spaces in (False, True):
+					options = SplitOptions(split_complex, spaces, rules)
+					with self.subTest(rules=rules, split_complex=split_complex, spaces=spaces):
+						self.assertEqual(translate_hangul_blocks(text, options), split_hangul_blocks(text, options))
+
+	def test_equal_rules_share_one_compiled_table(self) -> None:
+		rules = normalize_rules({"ㅚ": "ㅗㅣ", "ㅆ": "ㅅㅅ"})
+		table = compile_syllable_table(rules)
+		self.assertIs(compile_syllable_table(normalize_rules({"ㅆ": "ㅅㅅ", "ㅚ": "ㅗㅣ"})), table)
+
+
+class ParallelSplitTests(unittest.TestCase):
+	OPTION_SETS = tuple(
+		SplitOptions(split_complex, spaces, rules)
+		for rules in ((), normalize_rules({"ㅐ": "ㅏㅣ", "ㄲ": "ㄱㄱ"}), SplitOptions().decompositionRules)
+		for split_complex in (False, True)
+		for spaces in (False, True)
+	)
+
+	def test_cut_points_prefer_whitespace(self) -> None:
+		text = "한글분해" * 10 + " " + "가" * 39
+		self.assertEqual(parallel_cut_points(text, 2), [0, 40, 80])
+		self.assertEqual(parallel_cut_points("가" * 10, 3), [0, 3, 6, 10])
+		self.assertEqual(parallel_cut_points("가나", 5), [0, 1, 2])
+
+	def test_matches_reference_at_every_seam(self) -> None:
+		# Runs of syllables with no whitespace force cuts inside them, where spacing must be stitched.
+		texts = ("한글 분해기ABC값 괜찮아\n닭", "값" * 37, "가 나" * 20 + "ㄱㅏ" + "닭" * 11)
+		for text in texts:
+			for workers in range(2, 9):
+				for options in self.OPTION_SETS:
+					with self.subTest(text=text[:10], workers=workers, options=options):
+						self.assertEqual(
+							split_hangul_blocks_parallel(text, options, max_workers=workers, min_chunk_chars=1),
+							split_hangul_blocks(text, options),
+						)
+
+	def test_short_text_and_shared_executor(self) -> None:
+		text = "한글 분해기 " * 50
+		options = SplitOptions(insertSpacesBetweenLetters=True)
+		self.assertEqual(split_hangul_blocks_parallel(text, options), split_hangul_blocks(text, options))
+		with ThreadPoolExecutor(max_workers=3) as executor:
+			for _round in range(3):
+				self.assertEqual(
+					split_hangul_blocks_parallel(text, options, max_workers=3, executor=executor, min_chunk_chars=16),
+					split_hangul_blocks(text, options),
+				)
+
+	def test_concurrent_callers_on_cold_caches(self) -> None:
+		# Callers with different rules race to compile tables from empty caches; every result must match.
+		compile_syllable_table.cache_clear()
+		_syllable_translation_table.cache_clear()
+		_spaced_translation_table.cache_clear()
+		text = "괜찮아요 값 닭 훑어보기 " * 40
+		expected = [split_hangul_blocks(text, options) for options in self.OPTION_SETS]
+		start = threading.Barrier(len(self.OPTION_SETS) * 2)
+		failures: list[str] = []
+
+		def run(index: int, parallel: bool) -> None:
+			options = self.OPTION_SETS[index]
+			start.wait()
+			for _round in range(20):
+				if parallel:
+					output = split_hangul_blocks_parallel(text, options, max_workers=3, min_chunk_chars=64)
+				else:
+					output = translate_hangul_blocks(text, options)
+				if output != expected[index]:
+					failures.append(f"{options} parallel={parallel}")
+					return
+
+		threads = [
+			threading.Thread(target=run, args=(index, parallel))
+			for index in range(len(self.OPTION_SETS))
+			for parallel in (False, True)
+		]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		self.assertEqual(failures, [])
+
 
 if __name__ == "__main__":
 	unittest.main()
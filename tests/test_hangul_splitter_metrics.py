@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+sys.path.insert(0, str(ADDON_DIR))
+
+from globalPlugins._hangulSplitterMetrics import (  # noqa: E402
+	STAGE_SANITIZE,
+	STAGE_SPLIT,
+	STAGE_TEXT_INFO,
+	STAGE_TOTAL,
+	LatencyRecorder,
+	percentile,
+)
+
+
+class _FakeClock:
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self) -> float:
+		return self.now
+
+	def advance(self, seconds: float) -> None:
+		self.now += seconds
+
+
+class LatencyRecorderTests(unittest.TestCase):
+	def setUp(self):
+		self.clock = _FakeClock()
+		self.recorder = LatencyRecorder(capacity=4, clock=self.clock)
+
+	def test_nested_stages_are_exclusive(self):
+		trace = self.recorder.begin("describe")
+		with trace.stage(STAGE_TEXT_INFO):
+			self.clock.advance(0.002)
+			with trace.stage(STAGE_SANITIZE):
+				self.clock.advance(0.003)
+		self.recorder.finish(trace)
+		stages = self.recorder.records()[0].stages
+		self.assertAlmostEqual(stages[STAGE_TEXT_INFO], 0.002)
+		self.assertAlmostEqual(stages[STAGE_SANITIZE], 0.003)
+		self.assertAlmostEqual(stages[STAGE_TOTAL], 0.005)
+
+	def test_iter_stage_charges_production_time_only(self):
+		clock = self.clock
+
+		def produce():
+			for piece in ("ㅎㅏㄴ", "ㄱㅡㄹ"):
+				clock.advance(0.001)
+				yield piece
+
+		trace = self.recorder.begin("describe")
+		for _piece in trace.iter_stage(STAGE_SPLIT, produce()):
+			clock.advance(0.010)
+		self.recorder.finish(trace)
+		self.assertAlmostEqual(self.recorder.records()[0].stages[STAGE_SPLIT], 0.002)
+
+	def test_ring_buffer_keeps_latest_records(self):
+		for index in range(6):
+			trace = self.recorder.begin(f"gesture{index}")
+			self.clock.advance(0.001 * (index + 1))
+			self.recorder.finish(trace)
+		self.assertEqual([record.gesture for record in self.recorder.records()], [f"gesture{index}" for index in range(2, 6)])
+		stats = self.recorder.summary()[STAGE_TOTAL]
+		self.assertEqual(stats.count, 4)
+		self.assertAlmostEqual(stats.max, 0.006)
+
+	def test_stages_nest_per_thread(self):
+		trace = self.recorder.begin("copy")
+		worker_entered = threading.Event()
+		main_done = threading.Event()
+
+		def work():
+			with trace.stage(STAGE_SPLIT):
+				worker_entered.set()
+				main_done.wait(5)
+				self.clock.advance(0.004)
+
+		worker = threading.Thread(target=work)
+		with trace.stage(STAGE_TEXT_INFO):
+			worker.start()
+			worker_entered.wait(5)
+			self.clock.advance(0.001)
+		main_done.set()
+		worker.join(5)
+		self.recorder.finish(trace)
+		stages = self.recorder.records()[0].stages
+		self.assertAlmostEqual(stages[STAGE_TEXT_INFO], 0.001)
+		self.assertAlmostEqual(stages[STAGE_SPLIT], 0.005)
+
+	def test_beginning_a_gesture_records_the_previous_one(self):
+		self.recorder.begin("first")
+		self.recorder.begin("second")
+		self.assertEqual([record.gesture for record in self.recorder.records()], ["first"])
+
+	def test_superseded_gesture_is_recorded_once(self):
+		first = self.recorder.begin("first")
+		self.clock.advance(0.001)
+		second = self.recorder.begin("second")
+		self.clock.advance(0.002)
+		self.recorder.finish(first)
+		self.recorder.finish(second)
+		records = self.recorder.records()
+		self.assertEqual([record.gesture for record in records], ["first", "second"])
+		self.assertAlmostEqual(records[0].stages[STAGE_TOTAL], 0.001)
+
+	def test_dump_writes_summary_and_records(self):
+		trace = self.recorder.begin("copy")
+		with trace.stage(STAGE_SPLIT):
+			self.clock.advance(0.004)
+		self.recorder.finish(trace)
+		with tempfile.TemporaryDirectory() as directory:
+			path = Path(directory) / "latency.json"
+			self.assertEqual(self.recorder.dump(str(path)), 1)
+			payload = json.loads(path.read_text(encoding="utf-8"))
+		self.assertEqual(payload["gestures"][0]["gesture"], "copy")
+		self.assertAlmostEqual(payload["summary"][STAGE_SPLIT]["p50Ms"], 4.0)
+
+	def test_percentile_uses_nearest_rank(self):
+		values = [float(value) for value in range(1, 101)]
+		self.assertEqual(percentile(values, 0.5), 50.0)
+		self.assertEqual(percentile(values, 0.99), 99.0)
+		self.assertEqual(percentile([], 0.5), 0.0)
+
+
+if __name__ == "__main__":
+	unittest.main()
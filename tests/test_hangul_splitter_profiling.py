@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+import pstats
+import sys
+import tempfile
+import threading
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+sys.path.insert(0, str(ADDON_DIR))
+
+from globalPlugins import _hangulSplitterProfiling as profiling  # noqa: E402
+from globalPlugins._hangulSplitterCore import SplitOptions, split_hangul_blocks  # noqa: E402
+
+
+@profiling.profiled
+def _split(text: str) -> str:
+	return split_hangul_blocks(text, SplitOptions())
+
+
+@profiling.profiled
+def _split_twice(text: str) -> str:
+	return _split(text) + _split(text)
+
+
+class ProfilingTests(unittest.TestCase):
+	def tearDown(self):
+		profiling.stop_profiling()
+
+	def test_profiled_calls_pass_through_when_off(self):
+		self.assertFalse(profiling.is_profiling())
+		self.assertEqual(_split("값"), "ㄱㅏㅂㅅ")
+		self.assertIsNone(profiling.stop_profiling())
+
+	def test_session_profiles_entry_calls_and_writes_files(self):
+		session = profiling.start_profiling()
+		self.assertIs(profiling.start_profiling(), session)
+		self.assertEqual(_split_twice("한글"), "ㅎㅏㄴㄱㅡㄹㅎㅏㄴㄱㅡㄹ")
+		self.assertIs(profiling.stop_profiling(), session)
+		self.assertEqual(session.calls, 1)
+		with tempfile.TemporaryDirectory() as directory:
+			profile_path, summary_path = session.write(str(Path(directory) / "profiles"))
+			functions = {name for _file, _line, name in pstats.Stats(profile_path).stats}
+			summary = Path(summary_path).read_text(encoding="utf-8")
+		self.assertIn("split_hangul_blocks", functions)
+		self.assertIn("split_hangul_blocks", summary)
+
+	def test_calls_from_other_threads_while_busy_are_not_profiled(self):
+		session = profiling.start_profiling()
+		entered = threading.Event()
+		release = threading.Event()
+		results: list[str] = []
+
+		@profiling.profiled
+		def blocking() -> None:
+			entered.set()
+			release.wait(5)
+
+		thread = threading.Thread(target=blocking)
+		thread.start()
+		self.assertTrue(entered.wait(5))
+		results.append(_split("닭"))
+		release.set()
+		thread.join(5)
+		self.assertEqual(results, ["ㄷㅏㄹㄱ"])
+		self.assertEqual((session.calls, session.missedCalls), (1, 1))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+import tempfile
+from types import ModuleType
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+CORE_PATH = ADDON_DIR / "globalPlugins" / "_hangulSplitterCore.py"
+TABLES_TOOL_PATH = PROJECT_ROOT / "site_scons" / "site_tools" / "hangulTables" / "tables.py"
+sys.path.insert(0, str(ADDON_DIR))
+
+import globalPlugins._hangulSplitterCore as core  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location("hangulTablesTool", TABLES_TOOL_PATH)
+tables_tool = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tables_tool)
+
+GENERATED_MODULE = "globalPlugins._hangulTables"
+
+
+def _render_tables() -> ModuleType:
+	module = ModuleType(GENERATED_MODULE)
+	exec(tables_tool.renderTablesModule(core.DEFAULT_DECOMPOSITION_RULES), module.__dict__)
+	return module
+
+
+def _clear_table_caches() -> None:
+	core.compile_syllable_table.cache_clear()
+	core._syllable_translation_table.cache_clear()
+	core._spaced_translation_table.cache_clear()
+
+
+class GeneratedTablesTests(unittest.TestCase):
+	def test_tables_agree_with_core_arithmetic(self) -> None:
+		tables = _render_tables()
+		reference = tables_tool.loadCoreModule(CORE_PATH)
+		self.assertEqual(tables_tool.checkTables(tables, reference), [])
+		self.assertEqual(tables.SYLLABLE_JAMO_SPLIT_SPACED.split("\n")[ord("관") - core.S_BASE], "ㄱ ㅗ ㅏ ㄴ")
+
+	def test_check_reports_disagreeing_syllables(self) -> None:
+		tables = _render_tables()
+		tables.SYLLABLE_JAMO = tables.SYLLABLE_JAMO.replace("ㅎㅏㄴ\n", "ㅎㅏ\n", 1)
+		tables.SPLIT_RULES = ()
+		problems = tables_tool.checkTables(tables, tables_tool.loadCoreModule(CORE_PATH))
+		self.assertEqual(
+			problems,
+			["SPLIT_RULES differ from DEFAULT_DECOMPOSITION_RULES", "SYLLABLE_JAMO: U+D55C is 'ㅎㅏ', the core computes 'ㅎㅏㄴ'"],
+		)
+
+	def test_written_module_compiles(self) -> None:
+		with tempfile.TemporaryDirectory() as directory:
+			target = Path(directory) / "_hangulTables.py"
+			tables_tool.writeTablesModule(CORE_PATH, target)
+			compile(target.read_text(encoding="utf-8"), str(target), "exec")
+
+	def test_core_loads_generated_tables(self) -> None:
+		tables = _render_tables()
+		# A marked entry shows the table came from the generated module rather than the arithmetic.
+		tables.SYLLABLE_JAMO_SPLIT_SPACED = "X" + tables.SYLLABLE_JAMO_SPLIT_SPACED[1:]
+		sys.modules[GENERATED_MODULE] = tables
+		self.addCleanup(_clear_table_caches)
+		self.addCleanup(sys.modules.pop, GENERATED_MODULE, None)
+		_clear_table_caches()
+		options = core.SplitOptions(insertSpacesBetweenLetters=True)
+		self.assertEqual(core.translate_hangul_blocks("가한", options), "X ㅏ ㅎ ㅏ ㄴ")
+		self.assertEqual(core.translate_hangul_blocks("깎", core.SplitOptions()), "ㄱㄱㅏㄱㄱ")
+		custom = core.SplitOptions(decompositionRules=core.normalize_rules({"ㄲ": "ㄱㄱ"}))
+		self.assertEqual(core.translate_hangul_blocks("꽈", custom), "ㄱㄱㅘ")
+
+
+if __name__ == "__main__":
+	unittest.main()
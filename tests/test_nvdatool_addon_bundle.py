@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import importlib
+import os
+from pathlib import Path
+import sys
+import tempfile
+import types
+import unittest
+import zipfile
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+NVDATOOL_DIR = PROJECT_ROOT / "site_scons" / "site_tools" / "NVDATool"
+
+# The package itself imports SCons; only its SCons-free modules are loaded here.
+_package = types.ModuleType("nvdaToolModules")
+_package.__path__ = [str(NVDATOOL_DIR)]
+sys.modules["nvdaToolModules"] = _package
+addon = importlib.import_module("nvdaToolModules.addon")
+
+
+class AddonBundleTests(unittest.TestCase):
+	def setUp(self) -> None:
+		self._directory = tempfile.TemporaryDirectory()
+		self.addCleanup(self._directory.cleanup)
+		root = Path(self._directory.name)
+		self.source = root / "addon"
+		self.cacheDir = root / "cache"
+		(self.source / "globalPlugins" / "__pycache__").mkdir(parents=True)
+		(self.source / "doc" / "ko").mkdir(parents=True)
+		(self.source / "manifest.ini").write_text('name = "test"\n', encoding="utf-8")
+		(self.source / "globalPlugins" / "plugin.py").write_text("x = 1\n" * 200, encoding="utf-8")
+		(self.source / "globalPlugins" / "__pycache__" / "plugin.pyc").write_bytes(b"\0")
+		(self.source / "doc" / "ko" / "읽어보기.md").write_text("한글 " * 100, encoding="utf-8")
+		self.dest = root / "test.nvda-addon"
+
+	def build(self, cacheDir: Path | None = None) -> addon.BundleChanges:
+		return addon.createAddonBundleFromPath(self.source, str(self.dest), ["globalPlugins/__pycache__/*"], cacheDir)
+
+	def test_bundle_is_readable(self) -> None:
+		self.build()
+		with zipfile.ZipFile(self.dest) as z:
+			self.assertIsNone(z.testzip())
+			self.assertEqual(z.namelist(), ["doc/ko/읽어보기.md", "globalPlugins/plugin.py", "manifest.ini"])
+			self.assertEqual(z.read("globalPlugins/plugin.py"), b"x = 1\n" * 200)
+			self.assertEqual(z.getinfo("manifest.ini").date_time, (1980, 1, 1, 0, 0, 0))
+
+	def test_bundle_is_reproducible(self) -> None:
+		self.build()
+		first = self.dest.read_bytes()
+		os.utime(self.source / "manifest.ini", (0, 0))
+		self.build(self.cacheDir)
+		self.assertEqual(self.dest.read_bytes(), first)
+
+	def test_changes_and_reuse(self) -> None:
+		changes = self.build(self.cacheDir)
+		self.assertEqual(len(changes.added), 3)
+		self.assertEqual(changes.reused, 0)
+
+		(self.source / "manifest.ini").write_text('name = "changed"\n', encoding="utf-8")
+		(self.source / "doc" / "ko" / "읽어보기.md").unlink()
+		(self.source / "doc" / "style.css").write_text("body {}\n", encoding="utf-8")
+		changes = self.build(self.cacheDir)
+		self.assertEqual(changes.added, ["doc/style.css"])
+		self.assertEqual(changes.changed, ["manifest.ini"])
+		self.assertEqual(changes.removed, ["doc/ko/읽어보기.md"])
+		self.assertEqual((changes.unchanged, changes.reused), (1, 1))
+		self.assertIn("changed: manifest.ini", changes.describe())
+		with zipfile.ZipFile(self.dest) as z:
+			self.assertEqual(z.read("manifest.ini"), b'name = "changed"\n')
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BUILD_CACHE_PATH = PROJECT_ROOT / "site_scons" / "site_tools" / "NVDATool" / "buildCache.py"
+
+_spec = importlib.util.spec_from_file_location("nvdaToolBuildCache", BUILD_CACHE_PATH)
+buildCache = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(buildCache)
+
+
+class ContentKeyTests(unittest.TestCase):
+	def test_parts_are_not_concatenated(self) -> None:
+		self.assertNotEqual(buildCache.contentKey("ab", "c"), buildCache.contentKey("a", "bc"))
+		self.assertEqual(buildCache.contentKey("한글", b"x"), buildCache.contentKey("한글".encode("utf-8"), "x"))
+
+
+class ContentCacheTests(unittest.TestCase):
+	def test_round_trip(self) -> None:
+		with tempfile.TemporaryDirectory() as directory:
+			cache = buildCache.ContentCache(directory)
+			key = buildCache.contentKey("doc")
+			self.assertIsNone(cache.get(key))
+			cache.put(key, b"<html></html>")
+			cache.put(key, b"<html>2</html>")
+			self.assertEqual(cache.get(key), b"<html>2</html>")
+			# Only the entry itself is left behind, without temporary files.
+			self.assertEqual(os.listdir(os.path.join(directory, key[:2])), [key])
+
+
+if __name__ == "__main__":
+	unittest.main()
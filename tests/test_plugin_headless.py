@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import importlib
+import json
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from nvda_harness import FakeDocument, PluginHarness, install, make_document_text  # noqa: E402
+
+install()
+
+from globalPlugins._hangulSplitterCore import SplitOptions, split_hangul_blocks  # noqa: E402
+
+
+class GestureScriptTests(unittest.TestCase):
+	def setUp(self):
+		self.harness = PluginHarness()
+		self.module = self.harness.module
+
+	def tearDown(self):
+		self.harness.close()
+
+	def _utterances(self) -> list[str]:
+		return ["".join(item for item in sequence if isinstance(item, str)) for sequence in self.harness.speech.spoken]
+
+	def test_describe_speaks_character_under_caret(self):
+		self.harness.focus(FakeDocument("값 없음", caret=0))
+		self.harness.press("describeSplitHangul")
+		self.assertEqual(self.harness.speech.spoken_text(), "giyeokabieupsiot")
+		names = [item for item in self.harness.speech.spoken[0] if isinstance(item, str)]
+		self.assertEqual(names, ["giyeok", "a", "bieup", "siot"])
+
+	def test_describe_speaks_letter_names_in_korean(self):
+		self.harness.languageHandler.language = "ko_KR"
+		self.harness.focus(FakeDocument("값 없음", caret=0))
+		self.harness.press("describeSplitHangul")
+		self.assertEqual(self.harness.speech.spoken_text(), "기역아비읍시옷")
+		self.harness.speech.reset()
+		self.harness.set_option(self.module.KEY_JAMO_NAME_STYLE, self.module.NAME_STYLE_SHORT)
+		self.module._settings.invalidate()
+		self.harness.press("describeSplitHangul")
+		self.assertEqual(self.harness.speech.spoken_text(), "그아브스")
+
+	def test_describe_with_character_descriptions(self):
+		self.harness.set_option(self.module.KEY_JAMO_NAME_STYLE, self.module.NAME_STYLE_DESCRIPTION)
+		self.harness.focus(FakeDocument("값 없음", caret=0))
+		self.harness.press("describeSplitHangul")
+		self.assertEqual(self.harness.speech.spoken_text(), "ㄱㅏㅂㅅ")
+
+	def test_describe_again_reuses_speech_sequence(self):
+		self.harness.focus(FakeDocument("값 없음", caret=0))
+		self.harness.press("describeSplitHangul")
+		with mock.patch.object(self.module, "jamo_speech_sequence") as build:
+			self.harness.press("describeSplitHangul")
+		build.assert_not_called()
+		self.assertEqual(self.harness.speech.spoken[0][1:], self.harness.speech.spoken[1][1:])
+
+	def test_long_speech_sequences_are_not_kept(self):
+		cache = self.module._JamoSpeechCache(max_chars=3)
+		cache.sequence("ㄱㅏㅂㅅ", self.module.NAME_STYLE_FULL, False)
+		with mock.patch.object(self.module, "jamo_speech_sequence", return_value=[]) as build:
+			cache.sequence("ㄱㅏㅂㅅ", self.module.NAME_STYLE_FULL, False)
+		build.assert_called_once()
+
+	def test_describe_twice_copies_current_line(self):
+		self.harness.set_option(self.module.KEY_DEFAULT_SOURCE_SCOPE, self.module.SCOPE_LINE)
+		self.harness.focus(FakeDocument("첫 줄\n한글 abc\n끝", caret=7))
+		self.harness.press("describeSplitHangul", repeat=1)
+		self.assertEqual(self.harness.api.clipboard, ["ㅎㅏㄴㄱㅡㄹ \n"])
+
+	def test_long_selection_is_spoken_in_pieces(self):
+		# Spelled letters make the spoken text comparable with the split text.
+		self.harness.set_option(self.module.KEY_JAMO_NAME_STYLE, self.module.NAME_STYLE_DESCRIPTION)
+		text = make_document_text(20000)
+		self.harness.focus(FakeDocument(text, selection=(0, len(text))))
+		self.harness.press("describeSplitHangul")
+		expected = split_hangul_blocks(self.module._sanitize_for_split(text), SplitOptions())
+		self.assertGreater(len(self.harness.speech.spoken), 1)
+		self.assertEqual(self.harness.speech.spoken_text(), expected)
+
+	def test_large_copy_runs_on_worker(self):
+		self.harness.set_option(self.module.KEY_DEFAULT_SOURCE_SCOPE, self.module.SCOPE_LINE)
+		line = "한글 " * 3000
+		self.harness.focus(FakeDocument(line, caret=5))
+		self.harness.press("copySplitHangulUnderCursor")
+		self.assertEqual(self.harness.api.clipboard, ["ㅎㅏㄴㄱㅡㄹ " * 3000])
+		self.assertIsNotNone(self.harness.plugin._split_worker._thread)
+
+	def test_no_hangul_is_announced(self):
+		self.harness.focus(FakeDocument("abc", caret=1))
+		self.harness.press("copySplitHangulUnderCursor")
+		self.assertEqual(self.harness.ui.messages, ["No Hangul character under cursor."])
+		self.assertEqual(self.harness.api.clipboard, [])
+
+	def test_caret_move_by_character_spells_letters(self):
+		self.harness.set_option(self.module.KEY_ANNOUNCE_ON_CARET_MOVE, True)
+		document = FakeDocument("한글 읽기", caret=0)
+		self.harness.focus(document)
+		self.harness.move_caret(document, 1)
+		self.harness.move_caret(document, 3)
+		self.assertEqual(self._utterances(), ["giyeokeurieul"])
+
+	def test_caret_move_speaks_letters_in_configured_style(self):
+		self.harness.set_option(self.module.KEY_ANNOUNCE_ON_CARET_MOVE, True)
+		self.harness.set_option(self.module.KEY_JAMO_NAME_STYLE, self.module.NAME_STYLE_DESCRIPTION)
+		document = FakeDocument("한글", caret=0)
+		self.harness.focus(document)
+		self.harness.move_caret(document, 1)
+		self.harness.set_option(self.module.KEY_JAMO_NAME_STYLE, self.module.NAME_STYLE_SHORT)
+		self.module._settings.invalidate()
+		self.harness.move_caret(document, 0)
+		self.assertEqual(self._utterances(), ["ㄱㅡㄹ", "han"])
+		self.assertEqual(self.harness.speech.spelled, [])
+
+	def test_caret_move_after_silent_text_change_reads_new_text(self):
+		self.harness.set_option(self.module.KEY_ANNOUNCE_ON_CARET_MOVE, True)
+		document = FakeDocument("가나다라", caret=0)
+		self.harness.focus(document)
+		self.harness.move_caret(document, 1)
+		document.text = "바사아자"
+		self.harness.move_caret(document, 2)
+		self.assertEqual(self._utterances(), ["nieuna", "ieunga"])
+
+	def test_caret_jump_and_expiry_clear_line_splits(self):
+		self.harness.set_option(self.module.KEY_ANNOUNCE_ON_CARET_MOVE, True)
+		now = [0.0]
+		self.harness.plugin._line_split_cache = self.module._LineSplitCache(ttl=1.0, clock=lambda: now[0])
+		document = FakeDocument("가나다라", caret=0)
+		self.harness.focus(document)
+		self.harness.move_caret(document, 1)
+		self.harness.move_caret(document, 3)
+		lines = document.calls["expand"]
+		self.harness.move_caret(document, 2)
+		self.assertGreater(document.calls["expand"], lines + 1)
+		lines = document.calls["expand"]
+		now[0] = 2.0
+		self.harness.move_caret(document, 1)
+		self.assertGreater(document.calls["expand"], lines + 1)
+		self.assertEqual(self._utterances(), ["nieuna", "digeuta", "nieuna"])
+
+	def test_gestures_are_timed(self):
+		self.harness.focus(FakeDocument("한글", caret=0))
+		self.harness.press("describeSplitHangul")
+		record = self.module._latency.records()[-1]
+		self.assertEqual(record.gesture, "describeSplitHangul")
+		self.assertIn("total", record.stages)
+		self.assertIn("container", record.stages)
+
+
+class SourceTextCacheTests(unittest.TestCase):
+	def setUp(self):
+		self.harness = PluginHarness()
+		self.module = self.harness.module
+		self.harness.set_option(self.module.KEY_DEFAULT_SOURCE_SCOPE, self.module.SCOPE_LINE)
+
+	def tearDown(self):
+		self.harness.close()
+
+	def test_second_press_reuses_source_text(self):
+		document = FakeDocument("첫 줄\n한글 abc\n끝", caret=7)
+		self.harness.focus(document)
+		self.harness.press("describeSplitHangul")
+		calls = dict(document.calls)
+		self.harness.press("describeSplitHangul", repeat=1)
+		self.assertEqual(document.calls["expand"], calls["expand"])
+		self.assertEqual(document.calls["text"], calls["text"])
+		self.assertEqual(self.harness.api.clipboard, ["ㅎㅏㄴㄱㅡㄹ \n"])
+		self.assertEqual(self.harness.plugin._source_cache.hits, 1)
+
+	def test_selection_is_read_once(self):
+		text = make_document_text(20000)
+		document = FakeDocument(text, selection=(0, len(text)))
+		self.harness.focus(document)
+		self.harness.press("describeSplitHangul")
+		chunks = document.calls["chunk"]
+		self.harness.press("copySplitHangulUnderCursor")
+		self.assertEqual(document.calls["chunk"], chunks)
+		expected = split_hangul_blocks(self.module._sanitize_for_split(text), SplitOptions())
+		self.assertEqual(self.harness.api.clipboard, [expected])
+
+	def test_caret_move_and_text_change_invalidate(self):
+		document = FakeDocument("한글\n읽기", caret=0)
+		self.harness.focus(document)
+		self.harness.press("copySplitHangulUnderCursor")
+		self.harness.move_caret(document, 3)
+		self.harness.press("copySplitHangulUnderCursor")
+		document.text = "값\n읽기"
+		document.caret = 0
+		self.harness.plugin.event_textChange(document, lambda: None)
+		self.harness.press("copySplitHangulUnderCursor")
+		self.assertEqual(self.harness.api.clipboard, ["ㅎㅏㄴㄱㅡㄹ\n", "ㅇㅣㄹㄱㄱㅣ", "ㄱㅏㅂㅅ\n"])
+		self.assertEqual(self.harness.plugin._source_cache.hits, 0)
+
+	def test_entries_expire(self):
+		now = [0.0]
+		self.harness.plugin._source_cache = self.module._SourceTextCache(ttl=1.0, clock=lambda: now[0])
+		document = FakeDocument("한글", caret=0)
+		self.harness.focus(document)
+		self.harness.press("copySplitHangulUnderCursor")
+		now[0] = 2.0
+		self.harness.press("copySplitHangulUnderCursor")
+		self.assertEqual(self.harness.plugin._source_cache.hits, 0)
+		self.assertEqual(self.harness.plugin._source_cache.misses, 2)
+
+
+class SettingsCacheTests(unittest.TestCase):
+	def setUp(self):
+		self.harness = PluginHarness()
+		self.module = self.harness.module
+		self.settings = self.module._settings
+		self.conf = self.module._get_conf_section()
+
+	def tearDown(self):
+		self.harness.close()
+
+	def test_gestures_reuse_one_snapshot(self):
+		self.harness.focus(FakeDocument("한글", caret=0))
+		rebuilds = self.settings.snapshotRebuilds
+		reads = self.conf.reads
+		for _index in range(5):
+			self.harness.press("describeSplitHangul")
+		self.assertLessEqual(self.settings.snapshotRebuilds - rebuilds, 1)
+		self.assertLessEqual(self.conf.reads - reads, len(self.module.CONF_SPEC))
+
+	def test_toggle_script_rebuilds_snapshot(self):
+		self.assertTrue(self.module._get_split_options().splitComplexLetters)
+		self.harness.press("toggleComplexLetterSplitting")
+		self.assertFalse(self.module._get_split_options().splitComplexLetters)
+		self.assertEqual(self.harness.ui.messages, ["Split complex letters off."])
+
+	def test_profile_switch_invalidates_snapshot(self):
+		self.assertEqual(self.module._get_default_source_scope(), self.module.SCOPE_CHARACTER)
+		self.conf[self.module.KEY_DEFAULT_SOURCE_SCOPE] = self.module.SCOPE_LINE
+		self.assertEqual(self.module._get_default_source_scope(), self.module.SCOPE_CHARACTER)
+		self.harness.config.post_configProfileSwitch.notify()
+		self.assertEqual(self.module._get_default_source_scope(), self.module.SCOPE_LINE)
+
+	def test_config_save_rebuilds_string_table_for_new_language(self):
+		self.assertEqual(self.module._tr("Current line", "현재 줄"), "Current line")
+		self.harness.languageHandler.language = "ko_KR"
+		self.assertEqual(self.module._tr("Current line", "현재 줄"), "Current line")
+		rebuilds = self.settings.stringTableRebuilds
+		self.harness.config.post_configSave.notify()
+		self.assertEqual(self.module._tr("Current line", "현재 줄"), "현재 줄")
+		self.assertEqual(self.settings.stringTableRebuilds, rebuilds + 1)
+
+	def test_terminate_unregisters_config_handlers(self):
+		self.harness.close()
+		self.assertNotIn(self.module._on_config_saved, self.harness.config.post_configSave.handlers)
+		self.harness = PluginHarness()
+
+
+class DecompositionProfileTests(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+		globalVars = importlib.import_module("globalVars")
+		patcher = mock.patch.object(globalVars.appArgs, "configPath", self.directory.name)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		self.addCleanup(self.directory.cleanup)
+		self.harness = PluginHarness()
+		self.addCleanup(self.harness.close)
+		self.module = self.harness.module
+
+	def test_cycling_profiles_changes_the_split(self):
+		self.harness.focus(FakeDocument("깨값", selection=(0, 2)))
+		self.harness.press("cycleDecompositionProfile")
+		self.assertEqual(self.harness.ui.messages, ["Double consonants only"])
+		self.harness.press("copySplitHangulUnderCursor")
+		self.assertEqual(self.harness.api.clipboard, ["ㄱㄱㅐㄱㅏㅄ"])
+
+	def test_custom_profile_from_file(self):
+		profiles = {"profiles": {"teacher": {"base": "doubleConsonants", "rules": {"ㅐ": "ㅏㅣ"}}}}
+		Path(self.directory.name, self.module.PROFILES_FILE_NAME).write_text(
+			json.dumps(profiles, ensure_ascii=False),
+			encoding="utf-8",
+		)
+		self.module._settings.invalidate()
+		self.harness.set_option(self.module.KEY_DECOMPOSITION_PROFILE, "teacher")
+		self.harness.focus(FakeDocument("깨값", selection=(0, 2)))
+		self.harness.press("copySplitHangulUnderCursor")
+		self.assertEqual(self.harness.api.clipboard, ["ㄱㄱㅏㅣㄱㅏㅄ"])
+
+	def test_edited_profiles_file_is_read_again(self):
+		path = Path(self.directory.name, self.module.PROFILES_FILE_NAME)
+		self.harness.set_option(self.module.KEY_DECOMPOSITION_PROFILE, "teacher")
+		self.harness.focus(FakeDocument("깨", selection=(0, 1)))
+		self.harness.press("copySplitHangulUnderCursor")
+		profiles = {"profiles": {"teacher": {"base": "doubleConsonants", "rules": {"ㅐ": "ㅏㅣ"}}}}
+		path.write_text(json.dumps(profiles, ensure_ascii=False), encoding="utf-8")
+		self.harness.press("copySplitHangulUnderCursor")
+		self.assertEqual(self.harness.api.clipboard, ["ㄱㄱㅐ", "ㄱㄱㅏㅣ"])
+
+	def test_unknown_profile_falls_back_to_full(self):
+		self.harness.set_option(self.module.KEY_DECOMPOSITION_PROFILE, "missing")
+		self.module._settings.invalidate()
+		self.assertEqual(self.module._get_decomposition_profile(), "full")
+
+
+class DialogTests(unittest.TestCase):
+	def setUp(self):
+		self.harness = PluginHarness()
+
+	def tearDown(self):
+		self.harness.close()
+
+	def test_open_dialog_seeds_and_updates_output(self):
+		self.harness.focus(FakeDocument("한글", selection=(0, 2)))
+		self.harness.press("openHangulSplitterDialog")
+		dialog = self.harness.dialog
+		self.assertIsNotNone(dialog)
+		self.assertEqual(dialog._output_edit.GetValue(), "ㅎㅏㄴㄱㅡㄹ")
+		dialog._input_edit.type_text("a닭")
+		self.assertEqual(dialog.get_input_text(), "한글닭")
+		self.assertEqual(dialog._output_edit.GetValue(), "ㅎㅏㄴㄱㅡㄹㄷㅏㄹㄱ")
+
+	def test_close_saves_preferences(self):
+		self.harness.focus(FakeDocument("한글", caret=0))
+		self.harness.press("openHangulSplitterDialog")
+		dialog = self.harness.dialog
+		dialog._insert_spaces_checkbox.toggle()
+		self.assertEqual(dialog._output_edit.GetValue(), "ㅎ ㅏ ㄴ")
+		dialog.Close()
+		self.assertIsNone(self.harness.dialog)
+		self.assertTrue(self.harness.module._get_split_options().insertSpacesBetweenLetters)
+
+
+class ExportTests(unittest.TestCase):
+	def setUp(self):
+		self.harness = PluginHarness()
+		self.text = make_document_text(5000)
+		self.document = FakeDocument(self.text, caret=10)
+		self.harness.focus(self.document)
+		self.expected = split_hangul_blocks(self.harness.module._sanitize_for_split(self.text), SplitOptions())
+
+	def tearDown(self):
+		self.harness.close()
+
+	def test_export_copies_whole_document_in_paragraph_chunks(self):
+		self.harness.press("exportSplitDocument")
+		self.assertEqual(self.harness.api.clipboard, [self.expected])
+		self.assertEqual(self.document.calls["text"], 0)
+		self.assertEqual(self.document.calls["chunk"], self.text.count("\n") + 1)
+		self.assertEqual(self.harness.ui.messages[-1], "Split document copied to clipboard.")
+		self.assertIsNone(self.harness.plugin._export)
+
+	def test_export_runs_in_steps_and_reports_progress(self):
+		export_module = importlib.import_module("globalPlugins._hangulSplitterExport")
+		with mock.patch.object(export_module, "EXPORT_STEP_SECONDS", 0), mock.patch.object(
+			export_module,
+			"EXPORT_PROGRESS_INTERVAL_SECONDS",
+			0,
+		):
+			self.harness.press("exportSplitDocument", settle=False)
+			steps = 0
+			while self.harness.plugin._export is not None:
+				timers = [timer for timer in self.harness.wx.pending_timers if timer.running]
+				self.harness.wx.pending_timers.clear()
+				for timer in timers:
+					timer.fire()
+				steps += 1
+		self.assertGreater(steps, 10)
+		self.assertEqual(self.harness.api.clipboard, [self.expected])
+		progress = [message for message in self.harness.ui.messages if message.endswith("percent.")]
+		self.assertGreater(len(progress), 10)
+		self.assertEqual(progress[-1], "Exporting, 99 percent.")
+
+	def test_pressing_again_cancels(self):
+		self.harness.press("exportSplitDocument", settle=False)
+		self.harness.press("exportSplitDocument")
+		self.assertEqual(self.harness.api.clipboard, [])
+		self.assertEqual(self.harness.ui.messages, ["Exporting document.", "Export cancelled."])
+		self.assertIsNone(self.harness.plugin._export)
+
+	def test_export_to_file(self):
+		with tempfile.TemporaryDirectory() as directory:
+			path = str(Path(directory) / "split.txt")
+			self.harness.wx.FileDialog.next_path = path
+			self.harness.press("exportSplitDocumentToFile")
+			self.assertEqual(Path(path).read_text(encoding="utf-8"), self.expected)
+			self.assertEqual(sorted(entry.name for entry in Path(directory).iterdir()), ["split.txt"])
+		self.assertEqual(self.harness.ui.messages[-1], "Saved the split document to split.txt.")
+
+	def test_cancelled_save_dialog_does_not_export(self):
+		self.harness.press("exportSplitDocumentToFile")
+		self.assertEqual(self.harness.ui.messages, [])
+		self.assertIsNone(self.harness.plugin._export)
+
+	def test_document_without_hangul(self):
+		self.harness.focus(FakeDocument("abc\ndef", caret=0))
+		self.harness.press("exportSplitDocument")
+		self.assertEqual(self.harness.api.clipboard, [])
+		self.assertEqual(self.harness.ui.messages[-1], "The document does not contain Hangul.")
+
+
+if __name__ == "__main__":
+	unittest.main()
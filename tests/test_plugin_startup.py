@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+import unittest
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from nvda_harness import PluginHarness, measure_startup  # noqa: E402
+
+
+# Generous defaults so slow CI machines pass; tighten locally with the environment variables.
+IMPORT_BUDGET_MS = float(os.environ.get("HANGUL_SPLITTER_IMPORT_BUDGET_MS", "250"))
+INIT_BUDGET_MS = float(os.environ.get("HANGUL_SPLITTER_INIT_BUDGET_MS", "25"))
+
+LAZY_MODULES = (
+	"globalPlugins._hangulSplitterDialog",
+	"globalPlugins._hangulSplitterExport",
+	"globalPlugins._hangulSplitterSettingsPanel",
+)
+
+
+class StartupBudgetTests(unittest.TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.startup = measure_startup()
+
+	def test_ui_modules_are_not_loaded_at_startup(self):
+		for name in LAZY_MODULES:
+			self.assertNotIn(name, self.startup["modules"])
+
+	def test_profiler_modules_are_not_loaded_at_startup(self):
+		self.assertNotIn("cProfile", self.startup["modules"])
+
+	def test_import_and_init_within_budget(self):
+		self.assertLess(self.startup["importMs"], IMPORT_BUDGET_MS)
+		self.assertLess(self.startup["initMs"], INIT_BUDGET_MS)
+
+
+class LazyUiTests(unittest.TestCase):
+	def setUp(self):
+		self.harness = PluginHarness()
+
+	def tearDown(self):
+		self.harness.close()
+
+	def test_menu_item_is_added_after_startup(self):
+		tools_menu = self.harness.module.gui.mainFrame.sysTrayIcon.toolsMenu
+		self.assertEqual(tools_menu.items, [])
+		self.harness.wx.run_pending()
+		self.assertEqual(len(tools_menu.items), 1)
+
+	def test_settings_panel_builds_controls_on_first_show(self):
+		panel_class = self.harness.module.HangulSplitterSettingsPanel
+		self.assertIn(panel_class, self.harness.module.gui.settingsDialogs.NVDASettingsDialog.categoryClasses)
+		panel = panel_class()
+		panel._controls._insert_spaces_checkbox.SetValue(True)
+		panel.onSave()
+		self.assertTrue(self.harness.module._get_split_options().insertSpacesBetweenLetters)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import unittest
+from unittest import mock
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from split_engines import (  # noqa: E402
+	ENGINES,
+	OPTION_SETS,
+	all_hangul_range_chars,
+	all_syllables,
+	check_engines,
+	exhaustive_texts,
+	make_mixed_text,
+	time_engines,
+)
+
+import globalPlugins._hangulSplitterCore as core  # noqa: E402
+
+
+class SplitEngineDifferentialTests(unittest.TestCase):
+	def assert_engines_agree(self, text: str) -> None:
+		mismatches = check_engines(text)
+		self.assertEqual([mismatch.describe() for mismatch in mismatches[:3]], [])
+
+	def test_exhaustive_hangul(self) -> None:
+		for text in exhaustive_texts():
+			with self.subTest(text=text[:8]):
+				self.assert_engines_agree(text)
+
+	def test_every_char_alone(self) -> None:
+		# Single characters, where no engine can lean on its neighbours.
+		chars = dict.fromkeys(all_syllables() + all_hangul_range_chars())
+		for options in OPTION_SETS:
+			for char in chars:
+				expected = core.split_hangul_blocks(char, options)
+				for name, engine in ENGINES.items():
+					actual = engine(char, options)
+					if actual is not None and actual != expected:
+						self.fail(f"{name} with {options}: {char!r} gives {actual!r}, expected {expected!r}")
+
+	def test_random_mixed_text(self) -> None:
+		for seed in range(2):
+			with self.subTest(seed=seed):
+				self.assert_engines_agree(make_mixed_text(20_000, seed))
+
+	def test_random_mixed_text_in_small_slices(self) -> None:
+		# Long texts are translated slice by slice; tiny slices put many slice seams inside syllable runs.
+		with mock.patch.object(core, "_SLICE_CHARS", 7):
+			self.assert_engines_agree(make_mixed_text(5_000, seed=7))
+
+	def test_mismatch_is_reported(self) -> None:
+		broken = {"broken": lambda text, options: core.translate_hangul_blocks(text.replace("닭", "달"), options)}
+		mismatches = check_engines("값 닭", broken, OPTION_SETS[3:])
+		self.assertEqual(len(mismatches), 1)
+		self.assertEqual(mismatches[0].offset, 13)
+		self.assertIn("broken", mismatches[0].describe())
+
+	def test_time_engines_covers_reference(self) -> None:
+		timings = time_engines("한글 값", OPTION_SETS[0], repeat=1)
+		self.assertEqual(set(timings), {"reference", *ENGINES})
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+import queue
+import sys
+import threading
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+ADDON_DIR = PROJECT_ROOT / "addon"
+sys.path.insert(0, str(ADDON_DIR))
+
+from globalPlugins._hangulSplitWorker import SplitWorker  # noqa: E402
+from globalPlugins._hangulSplitterCore import SplitOptions, split_hangul_blocks  # noqa: E402
+
+
+class _MainThread:
+	# Collects delivered callables so the test decides when the "main thread" runs them.
+
+	def __init__(self):
+		self.calls: queue.Queue = queue.Queue()
+
+	def deliver(self, func) -> None:
+		self.calls.put(func)
+
+	def run_next(self, timeout: float = 5.0) -> None:
+		self.calls.get(timeout=timeout)()
+
+
+class SplitWorkerTests(unittest.TestCase):
+	def setUp(self):
+		self.main = _MainThread()
+		self.worker = SplitWorker(self.main.deliver, inline_max_chars=10)
+
+	def tearDown(self):
+		self.worker.terminate()
+
+	def test_small_jobs_run_inline(self):
+		results: list[str] = []
+		self.worker.submit(lambda: split_hangul_blocks("한글", SplitOptions()), results.append, size=2)
+		self.assertEqual(results, ["ㅎㅏㄴㄱㅡㄹ"])
+		self.assertTrue(self.main.calls.empty())
+
+	def test_large_job_result_is_delivered_through_main_thread(self):
+		text = "한글 " * 100
+		results: list[str] = []
+		self.worker.submit(lambda: split_hangul_blocks(text, SplitOptions()), results.append, size=len(text))
+		self.main.run_next()
+		self.assertEqual(results, [split_hangul_blocks(text, SplitOptions())])
+
+	def test_superseded_job_result_is_dropped(self):
+		started = threading.Event()
+		release = threading.Event()
+		results: list[str] = []
+
+		def slow_job() -> str:
+			started.set()
+			release.wait(5)
+			return "old"
+
+		self.worker.submit(slow_job, results.append, size=100)
+		self.assertTrue(started.wait(5))
+		self.worker.submit(lambda: "new", results.append, size=100)
+		release.set()
+		self.main.run_next()
+		self.assertEqual(results, ["new"])
+		self.assertTrue(self.main.calls.empty())
+
+	def test_result_waiting_for_main_thread_is_dropped_after_supersede(self):
+		results: list[str] = []
+		self.worker.submit(lambda: "old", results.append, size=100)
+		pending = self.main.calls.get(timeout=5)
+		self.worker.supersede()
+		pending()
+		self.assertEqual(results, [])
+
+	def test_job_errors_are_raised_on_main_thread(self):
+		def failing_job() -> str:
+			raise ValueError("boom")
+
+		self.worker.submit(failing_job, lambda result: None, size=100)
+		with self.assertRaises(ValueError):
+			self.main.run_next()
+
+
+if __name__ == "__main__":
+	unittest.main()
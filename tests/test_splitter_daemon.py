@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import json
+from pathlib import Path
+import sys
+import unittest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from splitter_daemon import SplitterServer, classify_runs, split_batch  # noqa: E402
+from globalPlugins._hangulJamoTrie import JamoTrie  # noqa: E402
+from globalPlugins._hangulSplitterCore import SplitOptions, split_hangul_blocks  # noqa: E402
+
+
+class SplitBatchTests(unittest.TestCase):
+	def test_batch_matches_individual_splits(self) -> None:
+		texts = ["한글", "", "괜찮아 값", "abc", "한\x00글", "읽기 "]
+		for complex_letters in (False, True):
+			for spaces in (False, True):
+				options = SplitOptions(splitComplexLetters=complex_letters, insertSpacesBetweenLetters=spaces)
+				expected = [split_hangul_blocks(text, options) for text in texts]
+				self.assertEqual(split_batch(texts, options), expected)
+
+	def test_classify_runs(self) -> None:
+		self.assertEqual(
+			classify_runs("한글 ㄱA"),
+			[["syllable", 2], ["whitespace", 1], ["jamo", 1], ["other", 1]],
+		)
+
+	def test_uses_the_packaged_core(self) -> None:
+		import splitter_daemon
+
+		self.assertIs(splitter_daemon.SplitOptions, SplitOptions)
+		self.assertEqual(splitter_daemon.translate_hangul_blocks.__module__, "globalPlugins._hangulSplitterCore")
+
+
+class SplitterServerTests(unittest.IsolatedAsyncioTestCase):
+	async def test_pipelined_requests_over_one_connection(self) -> None:
+		splitter = SplitterServer()
+		server = await splitter.start(port=0)
+		port = server.sockets[0].getsockname()[1]
+		reader, writer = await asyncio.open_connection("127.0.0.1", port)
+		requests = [
+			{"jsonrpc": "2.0", "id": 1, "method": "split", "params": {"text": "한글"}},
+			{
+				"jsonrpc": "2.0",
+				"id": 2,
+				"method": "split",
+				"params": {"text": "괜", "splitComplexLetters": False, "insertSpacesBetweenLetters": True},
+			},
+			{"jsonrpc": "2.0", "id": 3, "method": "keepOnlyHangul", "params": {"text": "a한 b"}},
+			{"jsonrpc": "2.0", "id": 4, "method": "nope"},
+		]
+		writer.write(b"".join(json.dumps(request).encode("utf-8") + b"\n" for request in requests))
+		await writer.drain()
+		responses = {}
+		for _request in requests:
+			response = json.loads(await reader.readline())
+			responses[response["id"]] = response
+		writer.close()
+		await writer.wait_closed()
+		server.close()
+		await server.wait_closed()
+
+		self.assertEqual(responses[1]["result"], "ㅎㅏㄴㄱㅡㄹ")
+		self.assertEqual(responses[2]["result"], "ㄱ ㅙ ㄴ")
+		self.assertEqual(responses[3]["result"], "한 ")
+		self.assertEqual(responses[4]["error"]["code"], -32601)
+		self.assertEqual(splitter.batcher.batches, 1)
+
+	async def test_complete(self) -> None:
+		splitter = SplitterServer(lexicon=JamoTrie(["한글", "하나", "하늘", "달"]))
+		result = await splitter.dispatch("complete", {"prefix": "하ㄴ", "limit": 2})
+		self.assertEqual(result, {"count": 3, "words": ["한글", "하나"]})
+		response = await SplitterServer().handle_line(b'{"id": 1, "method": "complete", "params": {"prefix": "a"}}')
+		self.assertEqual(response["error"]["code"], -32600)
+
+	async def test_unexpected_errors_and_notifications(self) -> None:
+		class FailingLexicon:
+			def count(self, prefix: str) -> int:
+				raise KeyError(prefix)
+
+		splitter = SplitterServer(lexicon=FailingLexicon())
+		with contextlib.redirect_stderr(io.StringIO()):
+			response = await splitter.handle_line(b'{"id": 7, "method": "complete", "params": {"prefix": "a"}}')
+			notification = await splitter.handle_line(b'{"method": "complete", "params": {"prefix": "a"}}')
+		self.assertEqual(response["id"], 7)
+		self.assertEqual(response["error"]["code"], -32603)
+		self.assertIsNone(notification)
+		self.assertIsNone(await splitter.handle_line(b'{"method": "ping"}'))
+		self.assertEqual((await splitter.handle_line(b"[1]"))["error"]["code"], -32600)
+
+
+if __name__ == "__main__":
+	unittest.main()